@@ -1,19 +1,101 @@
 const int FSR_PIN_1 = A0;  // 발받침대 FSR 센서
-const int FSR_PIN_2 = A1;  // 방석 FSR 센서
+const int FSR_PIN_2 = A1;  // 방석 FSR 센서 (매트 모드에서는 멀티플렉서 공통 출력)
+
+// 다채널 방석 매트: 0 = 단일 방석 센서, 8~16 = CD74HC4067 16채널 멀티플렉서로 읽는 셀 수
+// 셀 순서는 뒤쪽 행부터 왼쪽 → 오른쪽 (호스트 설정 mat_rows x mat_cols 와 같아야 함)
+#define MAT_CELLS 0
+const int MUX_SELECT_PINS[4] = {2, 3, 4, 5};  // S0~S3
+const unsigned int MUX_SETTLE_US = 10;
+
+#if MAT_CELLS > 0
+const int NUM_CHANNELS = 1 + MAT_CELLS;
+#else
+const int NUM_CHANNELS = 2;
+#endif
+
+// 전송 모드: 0 = CSV 텍스트 (9600bps, 10Hz), 1 = 바이너리 프레임 (115200bps, 200Hz)
+// 호스트 설정의 arduino_protocol / arduino_baud_rate 와 맞춰야 합니다.
+#define BINARY_MODE 0
+
+#if BINARY_MODE
+const long BAUD_RATE = 115200;
+const unsigned long SAMPLE_INTERVAL_US = 5000;  // 200Hz
+#else
+const long BAUD_RATE = 9600;
+const unsigned long SAMPLE_INTERVAL_US = 100000;  // 10Hz
+#endif
+
+// 바이너리 프레임: 0xA5 0x5A, 순번, 채널 값 (uint16 LE, 발받침대 다음 방석/매트 셀), XOR 체크섬
+const byte SYNC_1 = 0xA5;
+const byte SYNC_2 = 0x5A;
+
+byte sequence = 0;
+unsigned long nextSample = 0;
+
+int values[NUM_CHANNELS];
 
 void setup() {
-  Serial.begin(9600);
+  Serial.begin(BAUD_RATE);
+  for (int i = 0; i < 4; i++) {
+    pinMode(MUX_SELECT_PINS[i], OUTPUT);
+  }
+  nextSample = micros();
+}
+
+int readMuxChannel(int channel) {
+  for (int i = 0; i < 4; i++) {
+    digitalWrite(MUX_SELECT_PINS[i], (channel >> i) & 1);
+  }
+  delayMicroseconds(MUX_SETTLE_US);
+  return analogRead(FSR_PIN_2);
+}
+
+void sendBinary() {
+  byte frame[4 + 2 * NUM_CHANNELS];
+  byte checksum = sequence;
+  frame[0] = SYNC_1;
+  frame[1] = SYNC_2;
+  frame[2] = sequence++;
+  for (int i = 0; i < NUM_CHANNELS; i++) {
+    frame[3 + 2 * i] = values[i] & 0xFF;
+    frame[4 + 2 * i] = (values[i] >> 8) & 0xFF;
+    checksum ^= frame[3 + 2 * i] ^ frame[4 + 2 * i];
+  }
+  frame[3 + 2 * NUM_CHANNELS] = checksum;
+  Serial.write(frame, sizeof(frame));
+}
+
+void sendCsv() {
+  for (int i = 0; i < NUM_CHANNELS; i++) {
+    if (i > 0) {
+      Serial.print(",");
+    }
+    Serial.print(values[i]);
+  }
+  Serial.println();
 }
 
 void loop() {
+  // 고정 주기 샘플링 (delay 대신 micros 기준, 전송 시간만큼 주기가 밀리지 않음)
+  if ((long)(micros() - nextSample) < 0) {
+    return;
+  }
+  nextSample += SAMPLE_INTERVAL_US;
+
   // FSR 센서 값 읽기 (0-1023)
-  int fsr1Value = analogRead(FSR_PIN_1);
-  int fsr2Value = analogRead(FSR_PIN_2);
-  
+  values[0] = analogRead(FSR_PIN_1);
+#if MAT_CELLS > 0
+  for (int cell = 0; cell < MAT_CELLS; cell++) {
+    values[1 + cell] = readMuxChannel(cell);
+  }
+#else
+  values[1] = analogRead(FSR_PIN_2);
+#endif
+
+#if BINARY_MODE
+  sendBinary();
+#else
   // 시리얼로 전송 (CSV 형식)
-  Serial.print(fsr1Value);
-  Serial.print(",");
-  Serial.println(fsr2Value);
-  
-  delay(100);  // 100ms 딜레이
-} 
\ No newline at end of file
+  sendCsv();
+#endif
+}
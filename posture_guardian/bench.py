@@ -0,0 +1,691 @@
+"""
+성능 측정 스크립트
+Example: python -m posture_guardian.bench roi --source clip.mp4 --frames 300
+         python -m posture_guardian.bench flow --source clip.mp4 --inference-fps 3
+         python -m posture_guardian.bench serial --samples 2000 --rate 200
+         python -m posture_guardian.bench pressure --scenario config/scenarios.toml --rate 1000
+"""
+import argparse
+import asyncio
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from posture_guardian.utils.events import PoseKeypoint
+
+
+def _open_source(source: str):
+    """숫자면 웹캠 장치 ID, 아니면 영상 파일 경로로 캡처를 엽니다."""
+    import cv2
+
+    cap = cv2.VideoCapture(int(source) if source.isdigit() else source)
+    if not cap.isOpened():
+        raise RuntimeError(f"입력을 열 수 없습니다: {source}")
+    return cap
+
+
+def read_frames(source: str, frames: int) -> List[np.ndarray]:
+    """
+    입력에서 좌우 반전된 RGB 프레임을 읽어 메모리에 적재합니다.
+
+    Args:
+        source: 웹캠 장치 ID 또는 영상 파일 경로
+        frames: 읽을 최대 프레임 수
+
+    Returns:
+        List[np.ndarray]: RGB 프레임 목록
+    """
+    import cv2
+
+    cap = _open_source(source)
+    result = []
+    try:
+        while len(result) < frames:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            frame = cv2.flip(frame, 1)
+            result.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+    finally:
+        cap.release()
+    return result
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """
+    측정값(밀리초) 요약 통계를 계산합니다.
+
+    Args:
+        samples_ms: 프레임별 측정값
+
+    Returns:
+        Dict[str, float]: 평균, 중앙값, p95
+    """
+    arr = np.asarray(samples_ms, dtype=np.float64)
+    if arr.size == 0:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0}
+    return {
+        "mean_ms": float(arr.mean()),
+        "p50_ms": float(np.percentile(arr, 50)),
+        "p95_ms": float(np.percentile(arr, 95)),
+    }
+
+
+def time_per_frame(
+    frames: List[np.ndarray], fn: Callable[[np.ndarray], object]
+) -> List[float]:
+    """프레임마다 `fn` 실행 시간을 밀리초로 측정합니다."""
+    samples = []
+    for frame in frames:
+        started = time.perf_counter()
+        fn(frame)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def bench_roi(frames: List[np.ndarray], padding: float = 0.6) -> Dict[str, Dict[str, float]]:
+    """
+    전체 프레임 추론과 ROI 크롭 추론의 프레임당 시간을 비교합니다.
+
+    Args:
+        frames: RGB 프레임 목록
+        padding: ROI 여백 비율
+
+    Returns:
+        Dict[str, Dict[str, float]]: 방식별 요약 통계
+    """
+    import mediapipe as mp
+
+    from posture_guardian.sensors.roi import RoiTracker
+    from posture_guardian.sensors.webcam import local_pose_infer
+
+    with mp.solutions.pose.Pose(
+        min_detection_confidence=0.5, min_tracking_confidence=0.5
+    ) as pose:
+        full = time_per_frame(frames, lambda f: local_pose_infer(pose, f))
+
+    tracker = RoiTracker(padding=padding)
+    with mp.solutions.pose.Pose(
+        min_detection_confidence=0.5, min_tracking_confidence=0.5
+    ) as pose:
+        def roi_step(frame: np.ndarray) -> Optional[np.ndarray]:
+            crop, box = tracker.crop(frame)
+            return tracker.update(local_pose_infer(pose, crop), box, frame.shape)
+
+        roi = time_per_frame(frames, roi_step)
+
+    return {
+        "full_frame": summarize(full),
+        "roi": {**summarize(roi), **tracker.stats()},
+    }
+
+
+def bench_flow(
+    frames: List[np.ndarray],
+    fps: float = 30.0,
+    inference_fps: float = 3.0,
+    max_error: float = 2.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    매 프레임 전체 추론과 광학 흐름 추적(희소 추론)의 시간과 랜드마크 오차를 비교합니다.
+
+    오차는 매 프레임 전체 추론 결과를 기준으로 한 추적 랜드마크의 평균 픽셀 거리입니다.
+
+    Args:
+        frames: RGB 프레임 목록
+        fps: 입력 프레임 속도 (추론 주기 계산용)
+        inference_fps: 광학 흐름 사용 시 전체 추론 주기 (초당 횟수)
+        max_error: 허용 전방-후방 추적 오차 (픽셀)
+
+    Returns:
+        Dict[str, Dict[str, float]]: 방식별 요약 통계
+    """
+    import mediapipe as mp
+
+    from posture_guardian.sensors.flow import (FLOW_LANDMARK_INDICES,
+                                               LandmarkFlowTracker)
+    from posture_guardian.sensors.webcam import local_pose_infer
+
+    with mp.solutions.pose.Pose(
+        min_detection_confidence=0.5, min_tracking_confidence=0.5
+    ) as pose:
+        reference: List[Optional[np.ndarray]] = []
+        full = time_per_frame(frames, lambda f: reference.append(local_pose_infer(pose, f)))
+
+    tracker = LandmarkFlowTracker(inference_fps=inference_fps, max_error=max_error)
+    results: List[Optional[np.ndarray]] = []
+    inferred = 0
+    with mp.solutions.pose.Pose(
+        min_detection_confidence=0.5, min_tracking_confidence=0.5
+    ) as pose:
+        def flow_step(frame: np.ndarray) -> None:
+            nonlocal inferred
+            now = len(results) / fps
+            landmarks = tracker.track(frame, now)
+            if landmarks is None:
+                landmarks = local_pose_infer(pose, frame)
+                tracker.reset(frame, landmarks, now)
+                inferred += 1
+            results.append(landmarks)
+
+        flow = time_per_frame(frames, flow_step)
+
+    errors = []
+    for frame, ref, got in zip(frames, reference, results):
+        if ref is None or got is None:
+            continue
+        height, width = frame.shape[:2]
+        diff = (ref[FLOW_LANDMARK_INDICES, :2] - got[FLOW_LANDMARK_INDICES, :2]) * (width, height)
+        errors.append(float(np.hypot(diff[:, 0], diff[:, 1]).mean()))
+
+    return {
+        "full_frame": summarize(full),
+        "flow": {
+            **summarize(flow),
+            "inferences": float(inferred),
+            "landmark_error_px": float(np.mean(errors)) if errors else 0.0,
+            "landmark_error_p95_px": float(np.percentile(errors, 95)) if errors else 0.0,
+            **tracker.stats(),
+        },
+    }
+
+
+def _synthetic_pose_landmarks(rng: np.random.Generator) -> SimpleNamespace:
+    """MediaPipe `pose_landmarks` 와 같은 모양의 임의 랜드마크"""
+    values = rng.random((33, 4))
+    return SimpleNamespace(landmark=[
+        SimpleNamespace(x=x, y=y, z=z, visibility=v) for x, y, z, v in values.tolist()
+    ])
+
+
+# 배열 기반으로 바꾸기 전 웹캠 센서의 키포인트 매핑 (기준선 측정용)
+_LEGACY_KEYPOINT_MAP = {
+    "left_eye_inner": 1,
+    "left_eye_outer": 3,
+    "right_eye_inner": 4,
+    "right_eye_outer": 6,
+    "nose": 0,
+    "left_shoulder": 11,
+    "right_shoulder": 12,
+    "left_elbow": 13,
+    "right_elbow": 14,
+    "left_hip": 23,
+    "right_hip": 24,
+}
+
+
+def _legacy_extract_keypoints(landmarks) -> Dict[str, "PoseKeypoint"]:
+    """배열 기반으로 바꾸기 전 `extract_keypoints` (랜드마크마다 PoseKeypoint 생성)"""
+    from posture_guardian.utils.events import PoseKeypoint
+
+    result = {}
+    for name, idx in _LEGACY_KEYPOINT_MAP.items():
+        landmark = landmarks.landmark[idx]
+        result[name] = PoseKeypoint(
+            x=landmark.x,
+            y=landmark.y,
+            z=landmark.z,
+            visibility=landmark.visibility
+        )
+    return result
+
+
+def bench_landmarks(frames: int = 2000) -> Dict[str, Dict[str, float]]:
+    """
+    키포인트 객체 기반 FrameData 생성과 배열 기반 생성의 시간/할당을 비교합니다.
+
+    Args:
+        frames: 측정할 프레임 수
+
+    Returns:
+        Dict[str, Dict[str, float]]: 방식별 프레임당 시간과 할당 블록 수
+    """
+    from posture_guardian.sensors.webcam import (build_frame_data,
+                                                 calculate_distance)
+    from posture_guardian.utils.events import FrameData
+    from posture_guardian.utils.landmarks import LandmarkArray
+
+    rng = np.random.default_rng(0)
+    inputs = [_synthetic_pose_landmarks(rng) for _ in range(frames)]
+
+    def legacy(pose_landmarks) -> FrameData:
+        landmarks = pose_landmarks.landmark
+        return FrameData(
+            frame_id=0,
+            keypoints=_legacy_extract_keypoints(pose_landmarks),
+            eye_distance_left=calculate_distance(landmarks[1], landmarks[3]),
+            eye_distance_right=calculate_distance(landmarks[4], landmarks[6]),
+        )
+
+    def array(pose_landmarks) -> FrameData:
+        return build_frame_data(0, LandmarkArray.from_mediapipe(pose_landmarks).data)
+
+    report = {}
+    for name, fn in (("keypoints", legacy), ("array", array)):
+        samples = time_per_frame(inputs, fn)
+
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        kept = [fn(item) for item in inputs[:200]]
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+        del kept
+
+        report[name] = {**summarize(samples), "alloc_blocks_per_frame": blocks / 200}
+    return report
+
+
+def bench_replay(path: str) -> Dict[str, Dict[str, float]]:
+    """
+    녹화 파일을 최대 속도로 재생해 이벤트 버스와 자세 평가기의 처리량을 측정합니다.
+
+    Args:
+        path: 녹화 파일 경로
+
+    Returns:
+        Dict[str, Dict[str, float]]: 이벤트 수, 소요 시간, 초당 이벤트 수
+    """
+    from posture_guardian.core.bus import EventBus
+    from posture_guardian.core.config import AppConfig
+    from posture_guardian.processing.posture_eval import PostureEvaluator
+    from posture_guardian.sensors.replay import load_recording, replay_events
+    from posture_guardian.utils.events import EventType
+
+    recording = load_recording(path)
+
+    async def run() -> Dict[str, float]:
+        # 처리량 측정이므로 모든 이벤트를 처리하도록 무제한 큐
+        bus = EventBus(policies={})
+        evaluator = PostureEvaluator(AppConfig())
+        handled = 0
+
+        def on_event(event) -> None:
+            nonlocal handled
+            handled += 1
+            if event.type == EventType.FRAME:
+                evaluator.update_frame(event.data)
+            else:
+                evaluator.update_pressure(event.data)
+
+        bus.subscribe(EventType.FRAME, on_event)
+        bus.subscribe(EventType.PRESSURE, on_event)
+        await bus.start()
+        started = time.perf_counter()
+        published = await replay_events(recording, bus, speed=0)
+        while handled < published:
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+        await bus.stop()
+        return {
+            "events": float(published),
+            "elapsed_s": elapsed,
+            "events_per_s": published / elapsed if elapsed > 0 else 0.0,
+        }
+
+    return {"replay": asyncio.run(run())}
+
+
+def bench_serial(samples: int = 2000, rate_hz: float = 200.0) -> Dict[str, Dict[str, float]]:
+    """
+    CSV 와 바이너리 프로토콜의 디코딩 비용과 pty 가상 아두이노 수신 결과를 비교합니다.
+
+    Args:
+        samples: 프로토콜마다 보낼 샘플 수
+        rate_hz: 가상 아두이노 전송 속도 (초당 샘플)
+
+    Returns:
+        Dict[str, Dict[str, float]]: 샘플당 디코딩 시간, 수신 샘플 수, 루프 깨어남당 샘플 수, 손실
+    """
+    import serial
+
+    from posture_guardian.sensors.serial_reader import (PROTOCOL_BINARY,
+                                                        PROTOCOL_CSV,
+                                                        SerialLineReader,
+                                                        decode_binary_frames,
+                                                        encode_binary_frames,
+                                                        parse_csv_lines)
+    from tools.pty_arduino import PtyArduino
+
+    values = np.random.default_rng(0).integers(0, 1024, size=(samples, 2))
+    csv_lines = [b"%d,%d\r" % (foot, cushion) for foot, cushion in values.tolist()]
+    frames = encode_binary_frames(values)
+    decoders = {
+        PROTOCOL_CSV: lambda: parse_csv_lines(csv_lines),
+        PROTOCOL_BINARY: lambda: decode_binary_frames(frames),
+    }
+
+    async def receive(protocol: str) -> Dict[str, float]:
+        arduino = PtyArduino(protocol, rate_hz=rate_hz, samples=samples)
+        ser = serial.Serial(arduino.port, timeout=0.1)
+        reader = SerialLineReader(ser, protocol=protocol)
+        reader.start()
+        arduino.start()
+        received = wakeups = 0
+        started = time.perf_counter()
+        try:
+            deadline = started + samples / rate_hz + 2.0
+            while received < samples and time.perf_counter() < deadline:
+                _, block = await reader.read_samples(timeout=0.5)
+                if len(block):
+                    received += len(block)
+                    wakeups += 1
+        finally:
+            reader.stop()
+            ser.close()
+            arduino.stop()
+        stats = reader.stats()
+        return {
+            "received": float(received),
+            "elapsed_s": time.perf_counter() - started,
+            "samples_per_wakeup": received / wakeups if wakeups else 0.0,
+            "bytes_per_sample": stats["serial_bytes"] / received if received else 0.0,
+            "lost": stats["serial_frames_lost"] + stats["serial_bad_lines"],
+        }
+
+    report = {}
+    for protocol, decode in decoders.items():
+        started = time.perf_counter()
+        for _ in range(10):
+            decode()
+        decode_us = (time.perf_counter() - started) / (10 * samples) * 1e6
+        report[protocol] = {"decode_us_per_sample": decode_us, **asyncio.run(receive(protocol))}
+    return report
+
+
+def bench_pressure(
+    rate_hz: float = 1000.0,
+    duration: float = 195.0,
+    block: int = 100,
+    scenario_path: Optional[str] = None,
+    seed: int = 0,
+    deadband: float = 0.0,
+    heartbeat: float = 1.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    시나리오 시뮬레이터로 생성한 압력 샘플을 대기 없이 이벤트 버스와 자세 평가기에 흘려보냅니다.
+
+    데드밴드를 주면 센서 태스크와 같이 묶음마다 필터를 적용하고, 비어 버린 묶음은 발행하지 않습니다.
+
+    Args:
+        rate_hz: 시뮬레이션 초당 샘플 수
+        duration: 시뮬레이션 시간 (초)
+        block: 이벤트 하나에 담을 샘플 수
+        scenario_path: 시나리오 TOML 파일 (없으면 고정 평균값)
+        seed: 난수 시드
+        deadband: 데드밴드 임계값 (0 이면 모든 샘플 발행)
+        heartbeat: 데드밴드 heartbeat 간격 (초)
+
+    Returns:
+        Dict[str, Dict[str, float]]: 생성/처리 속도, 발받침대/방석 불균형으로 판정된 묶음 비율,
+        데드밴드 사용 시 샘플/이벤트 감소율
+    """
+    from posture_guardian.core.bus import EventBus
+    from posture_guardian.core.config import AppConfig
+    from posture_guardian.processing.posture_eval import PostureEvaluator
+    from posture_guardian.sensors.deadband import PressureDeadband
+    from posture_guardian.sensors.pressure_pad import PressurePadSimulator
+    from posture_guardian.sensors.scenario import load_scenario
+    from posture_guardian.utils.events import (CalibrationData, Event,
+                                              EventType, PostureStatus,
+                                              PressureBlock)
+
+    config = AppConfig()
+    sensors = config.sensors
+    scenario = None
+    if scenario_path:
+        scenario = load_scenario(scenario_path, sensors.simulation_foot_mean, sensors.simulation_cushion_mean)
+    simulator = PressurePadSimulator(
+        foot_mean=sensors.simulation_foot_mean,
+        foot_std=sensors.simulation_foot_std,
+        cushion_mean=sensors.simulation_cushion_mean,
+        cushion_std=sensors.simulation_cushion_std,
+        rate_hz=rate_hz,
+        scenario=scenario,
+        seed=seed,
+    )
+    total = int(rate_hz * duration)
+
+    band = PressureDeadband(deadband, heartbeat) if deadband > 0 else None
+
+    started = time.perf_counter()
+    blocks = []
+    offered = 0
+    filter_s = 0.0
+    for offset in range(0, total, block):
+        t, values = simulator.read_block(min(block, total - offset))
+        offered += 1
+        if band is not None:
+            filter_started = time.perf_counter()
+            mask = band.filter(t, values)
+            filter_s += time.perf_counter() - filter_started
+            t, values = t[mask], values[mask]
+            if len(values) == 0:
+                continue
+        blocks.append(PressureBlock.from_arrays(t, values, source="simulation"))
+    generate_s = time.perf_counter() - started
+
+    async def run() -> Dict[str, float]:
+        # 처리량 측정이므로 모든 이벤트를 처리하도록 무제한 큐
+        bus = EventBus(policies={})
+        evaluator = PostureEvaluator(config)
+        evaluator.calibration = CalibrationData(
+            baseline_foot=sensors.simulation_foot_mean,
+            baseline_cushion=sensors.simulation_cushion_mean,
+            baseline_eye_distance_ratio=1.0,
+            completed=True,
+        )
+        handled = bad_foot = bad_cushion = 0
+
+        def on_pressure(event) -> None:
+            nonlocal handled, bad_foot, bad_cushion
+            handled += 1
+            evaluator.update_pressure(event.data)
+            bad_foot += evaluator._check_foot_pressure() == PostureStatus.BAD_FOOT
+            bad_cushion += evaluator._check_cushion_pressure() == PostureStatus.BAD_CUSHION
+
+        bus.subscribe(EventType.PRESSURE, on_pressure)
+        await bus.start()
+        started = time.perf_counter()
+        for data in blocks:
+            await bus.publish(Event(type=EventType.PRESSURE, data=data))
+        while handled < len(blocks):
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - started
+        await bus.stop()
+        return {
+            "samples_per_s": total / elapsed if elapsed > 0 else 0.0,
+            "events_per_s": handled / elapsed if elapsed > 0 else 0.0,
+            "bad_foot_ratio": bad_foot / handled if handled else 0.0,
+            "bad_cushion_ratio": bad_cushion / handled if handled else 0.0,
+        }
+
+    report = {
+        "generate": {
+            "samples": float(total),
+            "us_per_sample": generate_s / total * 1e6 if total else 0.0,
+        },
+        "bus": asyncio.run(run()),
+    }
+    if band is not None:
+        report["deadband"] = {
+            **band.stats(),
+            "events_offered": float(offered),
+            "events_published": float(len(blocks)),
+            "event_reduction": 1.0 - len(blocks) / offered if offered else 0.0,
+            "filter_us_per_sample": filter_s / total * 1e6 if total else 0.0,
+        }
+    return report
+
+
+def bench_bus(
+    duration: float = 5.0,
+    fps: float = 30.0,
+    cameras: int = 2,
+    handler_ms: float = 20.0,
+) -> Dict[str, Dict[str, float]]:
+    """
+    느린 FRAME 구독자가 있을 때 무제한 큐와 상한 큐 정책(BOUNDED_POLICIES)을 비교합니다.
+
+    카메라마다 fps 로 FRAME 을, 10Hz 로 PRESSURE 를, 1초마다 COMMAND 를 실제 시간에 맞춰 발행하고,
+    FRAME 구독자는 이벤트마다 handler_ms 동안 대기합니다.
+
+    Args:
+        duration: 발행 시간 (초)
+        fps: 카메라당 초당 프레임 수
+        cameras: 카메라 수
+        handler_ms: FRAME 구독자 처리 시간 (밀리초)
+
+    Returns:
+        Dict[str, Dict[str, float]]: 정책별 최대 대기 수, 처리한 프레임의 지연, 버림/병합 수, 전달된 명령 수
+    """
+    from posture_guardian.core.bus import BOUNDED_POLICIES, EventBus
+    from posture_guardian.utils.events import (Command, CommandType, Event,
+                                              EventType, FrameData,
+                                              PressureData)
+
+    async def run(policies) -> Dict[str, float]:
+        bus = EventBus(policies=policies)
+        latencies_ms: List[float] = []
+        commands = 0
+
+        async def on_frame(event) -> None:
+            latencies_ms.append((time.time() - event.data.timestamp.timestamp()) * 1000.0)
+            await asyncio.sleep(handler_ms / 1000.0)
+
+        def on_command(event) -> None:
+            nonlocal commands
+            commands += 1
+
+        bus.subscribe(EventType.FRAME, on_frame)
+        bus.subscribe(EventType.COMMAND, on_command)
+        await bus.start()
+        started = time.perf_counter()
+        frame_id = 0
+        sent_commands = 0
+        while time.perf_counter() - started < duration:
+            for camera in range(cameras):
+                await bus.publish(Event(
+                    type=EventType.FRAME,
+                    data=FrameData(frame_id=frame_id, camera_id=str(camera)),
+                ))
+            if frame_id % max(1, int(fps / 10)) == 0:
+                await bus.publish(Event(
+                    type=EventType.PRESSURE,
+                    data=PressureData(foot_value=500, cushion_value=500),
+                ))
+            if frame_id % max(1, int(fps)) == 0:
+                sent_commands += 1
+                await bus.publish(Event(type=EventType.COMMAND, data=Command(type=CommandType.START)))
+            frame_id += 1
+            await asyncio.sleep(1.0 / fps)
+        pending = bus.pending()
+        await bus.stop()
+        stats = bus.stats()
+        return {
+            "max_pending": stats["bus_max_pending"],
+            "pending_at_end": float(pending),
+            "frames_handled": float(len(latencies_ms)),
+            **{f"frame_latency_{k}": v for k, v in summarize(latencies_ms).items()},
+            "dropped": stats["bus_dropped"],
+            "coalesced": stats["bus_coalesced"],
+            "commands_delivered": float(commands),
+            "commands_sent": float(sent_commands),
+        }
+
+    return {
+        "unbounded": asyncio.run(run({})),
+        "bounded": asyncio.run(run(BOUNDED_POLICIES)),
+    }
+
+
+def _print_report(title: str, report: Dict[str, Dict[str, float]]) -> None:
+    """측정 결과를 표 형태로 출력"""
+    print(f"== {title}")
+    for name, values in report.items():
+        formatted = ", ".join(f"{k}={v:.2f}" for k, v in values.items())
+        print(f"  {name:<12} {formatted}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """성능 측정 진입점"""
+    parser = argparse.ArgumentParser(description="Posture Guardian 성능 측정")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    roi_parser = sub.add_parser("roi", help="전체 프레임 vs ROI 추론 시간 비교")
+    roi_parser.add_argument("--source", default="0", help="웹캠 장치 ID 또는 영상 파일")
+    roi_parser.add_argument("--frames", type=int, default=300)
+    roi_parser.add_argument("--padding", type=float, default=0.6)
+
+    flow_parser = sub.add_parser("flow", help="매 프레임 추론 vs 광학 흐름 추적 시간/오차 비교")
+    flow_parser.add_argument("--source", default="0", help="웹캠 장치 ID 또는 영상 파일")
+    flow_parser.add_argument("--frames", type=int, default=300)
+    flow_parser.add_argument("--fps", type=float, default=30.0, help="입력 프레임 속도")
+    flow_parser.add_argument("--inference-fps", type=float, default=3.0)
+    flow_parser.add_argument("--max-error", type=float, default=2.0)
+
+    landmarks_parser = sub.add_parser("landmarks", help="키포인트 객체 vs 배열 기반 FrameData 생성 비교")
+    landmarks_parser.add_argument("--frames", type=int, default=2000)
+
+    replay_parser = sub.add_parser("replay", help="녹화 파일 최대 속도 재생 처리량")
+    replay_parser.add_argument("path", help="녹화 파일 경로")
+
+    serial_parser = sub.add_parser("serial", help="CSV vs 바이너리 시리얼 프로토콜 (pty 가상 아두이노)")
+    serial_parser.add_argument("--samples", type=int, default=2000)
+    serial_parser.add_argument("--rate", type=float, default=200.0, help="초당 전송 샘플 수")
+
+    pressure_parser = sub.add_parser("pressure", help="시나리오 압력 시뮬레이터로 버스/평가기 부하 시험")
+    pressure_parser.add_argument("--scenario", default=None, help="시나리오 TOML 파일")
+    pressure_parser.add_argument("--rate", type=float, default=1000.0, help="초당 샘플 수")
+    pressure_parser.add_argument("--duration", type=float, default=195.0, help="시뮬레이션 시간 (초)")
+    pressure_parser.add_argument("--block", type=int, default=100, help="이벤트당 샘플 수")
+    pressure_parser.add_argument("--seed", type=int, default=0)
+    pressure_parser.add_argument("--deadband", type=float, default=0.0, help="데드밴드 임계값 (0 이면 사용 안 함)")
+    pressure_parser.add_argument("--heartbeat", type=float, default=1.0, help="데드밴드 heartbeat 간격 (초)")
+
+    bus_parser = sub.add_parser("bus", help="느린 구독자가 있을 때 무제한 큐 vs 타입별 큐 정책")
+    bus_parser.add_argument("--duration", type=float, default=5.0, help="발행 시간 (초)")
+    bus_parser.add_argument("--fps", type=float, default=30.0, help="카메라당 초당 프레임 수")
+    bus_parser.add_argument("--cameras", type=int, default=2)
+    bus_parser.add_argument("--handler-ms", type=float, default=20.0, help="FRAME 구독자 처리 시간 (밀리초)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "roi":
+        frames = read_frames(args.source, args.frames)
+        _print_report(f"ROI 추론 ({len(frames)} 프레임)", bench_roi(frames, args.padding))
+    elif args.command == "flow":
+        frames = read_frames(args.source, args.frames)
+        _print_report(
+            f"광학 흐름 추적 ({len(frames)} 프레임)",
+            bench_flow(frames, args.fps, args.inference_fps, args.max_error),
+        )
+    elif args.command == "landmarks":
+        _print_report(f"FrameData 생성 ({args.frames} 프레임)", bench_landmarks(args.frames))
+    elif args.command == "replay":
+        _print_report(f"녹화 재생 ({args.path})", bench_replay(args.path))
+    elif args.command == "pressure":
+        _print_report(
+            f"압력 부하 시험 ({args.rate:.0f}Hz x {args.duration:.0f}초, 묶음 {args.block})",
+            bench_pressure(
+                args.rate, args.duration, args.block, args.scenario, args.seed, args.deadband, args.heartbeat
+            ),
+        )
+    elif args.command == "bus":
+        _print_report(
+            f"이벤트 버스 큐 ({args.cameras}대 x {args.fps:.0f}fps, 구독자 {args.handler_ms:.0f}ms)",
+            bench_bus(args.duration, args.fps, args.cameras, args.handler_ms),
+        )
+    elif args.command == "serial":
+        _print_report(
+            f"시리얼 프로토콜 ({args.samples} 샘플, {args.rate:.0f}Hz)",
+            bench_serial(args.samples, args.rate),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,86 @@
 """
 이벤트 버스 구현
 Pub-Sub 패턴을 사용하여 모듈 간 이벤트 통신을 위한 중앙 허브
+- 이벤트 타입별 큐 정책: 무제한, 가득 차면 대기(block), 오래된 것 버림(drop_oldest),
+  최신 값으로 병합(latest, 타입 또는 출처 기준)
+- 기본은 모든 타입 무제한이며, 버리거나 병합하는 정책은 설정으로 선택 (BOUNDED_POLICIES)
+- 명령/보정 이벤트는 설정과 관계없이 버리지 않고, 그보다 나중에 발행된 이벤트가 앞질러 처리되지 않음
 """
 import asyncio
+import collections
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Set
 
 from posture_guardian.utils.events import Event, EventType
 
 logger = logging.getLogger(__name__)
 
+# 큐 정책
+POLICY_UNBOUNDED = "unbounded"      # 제한 없음
+POLICY_BLOCK = "block"              # 가득 차면 발행자가 자리가 날 때까지 대기
+POLICY_DROP_OLDEST = "drop_oldest"  # 가득 차면 같은 타입의 가장 오래된 이벤트를 버림
+POLICY_LATEST = "latest"            # 아직 처리되지 않은 같은 키의 이벤트를 새 이벤트로 교체
+POLICIES = (POLICY_UNBOUNDED, POLICY_BLOCK, POLICY_DROP_OLDEST, POLICY_LATEST)
+
+# latest 정책의 병합 기준
+KEY_TYPE = "type"                   # 이벤트 타입마다 하나
+KEY_SOURCE = "source"               # 출처(카메라 ID, 데이터 소스, SYSTEM source)마다 하나
+
+# 어떤 설정이든 버리거나 병합하지 않는 이벤트 타입
+NEVER_DROP = frozenset({EventType.COMMAND, EventType.CALIBRATION})
+
+
+@dataclass
+class QueuePolicy:
+    """이벤트 타입별 큐 정책"""
+    policy: str = POLICY_UNBOUNDED
+    maxsize: int = 0                # 타입별 대기 이벤트 최대 수 (0 이면 무제한)
+    key: str = KEY_TYPE             # latest 정책의 병합 기준
+
+
+# 기본 정책: 모든 타입 무제한 (녹화/재생 등 모든 구독자가 모든 이벤트를 받음)
+DEFAULT_POLICIES: Dict[EventType, QueuePolicy] = {}
+
+# 상한 정책 (bus.bounded_queues 로 선택): 프레임은 카메라마다 최신 값만,
+# 압력/결과/상태는 상한을 두고 오래된 것부터 버림
+BOUNDED_POLICIES: Dict[EventType, QueuePolicy] = {
+    EventType.FRAME: QueuePolicy(POLICY_LATEST, maxsize=8, key=KEY_SOURCE),
+    EventType.PRESSURE: QueuePolicy(POLICY_DROP_OLDEST, maxsize=256),
+    EventType.POSTURE_RESULT: QueuePolicy(POLICY_DROP_OLDEST, maxsize=64),
+    EventType.SCHEDULE: QueuePolicy(POLICY_LATEST, key=KEY_TYPE),
+    EventType.SYSTEM: QueuePolicy(POLICY_DROP_OLDEST, maxsize=1024),
+}
+
+
+def event_source(event: Event) -> Optional[str]:
+    """
+    이벤트 출처 (latest 정책의 source 키)
+
+    Args:
+        event: 이벤트
+
+    Returns:
+        Optional[str]: 카메라 ID, 압력 데이터 소스 또는 SYSTEM 이벤트의 source
+    """
+    data = event.data
+    if isinstance(data, dict):
+        return data.get("source")
+    camera_id = getattr(data, "camera_id", None)
+    if camera_id is not None:
+        return camera_id
+    return getattr(data, "source", None)
+
+
+class _Pending:
+    """큐에 대기 중인 이벤트 (버려지면 event 가 None)"""
+
+    __slots__ = ("event", "key")
+
+    def __init__(self, event: Event, key: Optional[Hashable]):
+        self.event: Optional[Event] = event
+        self.key = key
+
 
 class EventBus:
     """
@@ -17,16 +88,68 @@ class EventBus:
     - 이벤트 발행 (publish)
     - 이벤트 구독 (subscribe)
     - 토픽 기반 구독
+    - 이벤트 타입별 큐 정책과 버림/병합 통계
+    
+    모든 타입이 하나의 발행 순서를 공유하며, 버려진 이벤트는 자리만 남았다가 워커가 건너뜁니다.
+    병합된 이벤트는 처음 대기열에 들어간 위치에서 최신 값으로 처리됩니다.
+    명령/보정 이벤트가 발행되면 그 앞의 대기 이벤트는 더 이상 병합되지 않으므로,
+    그 뒤에 발행된 이벤트가 명령/보정 이벤트보다 먼저 처리되지 않습니다.
     """
 
-    def __init__(self):
-        """EventBus 초기화"""
+    def __init__(self, policies: Optional[Dict[EventType, QueuePolicy]] = None):
+        """
+        EventBus 초기화
+        
+        Args:
+            policies: 이벤트 타입별 큐 정책 (없으면 DEFAULT_POLICIES, 빠진 타입은 무제한)
+        """
         self._subscribers: Dict[EventType, Set[Callable]] = {}
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._policies: Dict[EventType, QueuePolicy] = {}
+        self.configure(DEFAULT_POLICIES if policies is None else policies)
+        
+        # 발행 순서 대기열, 타입별 대기 중인 항목 (오래된 순), latest 정책의 키 → 대기 항목
+        self._pending: Deque[_Pending] = collections.deque()
+        self._by_type: Dict[EventType, Deque[_Pending]] = {event_type: collections.deque() for event_type in EventType}
+        self._latest: Dict[Hashable, _Pending] = {}
+        self._live = 0
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        
         self._running = False
         self._worker_task: Optional[asyncio.Task] = None
+        
+        self.published = 0
+        self.processed = 0
+        self.max_pending = 0
+        self.dropped: Dict[EventType, int] = collections.Counter()
+        self.coalesced: Dict[EventType, int] = collections.Counter()
         logger.debug("EventBus 초기화됨")
 
+    def configure(self, policies: Dict[EventType, QueuePolicy]) -> None:
+        """
+        이벤트 타입별 큐 정책을 설정합니다. (빠진 타입은 무제한)
+        
+        명령/보정 이벤트에 버리거나 병합하는 정책을 주면 무시하고 무제한으로 둡니다.
+        
+        Args:
+            policies: 이벤트 타입별 큐 정책
+            
+        Raises:
+            ValueError: 알 수 없는 정책 또는 병합 기준
+        """
+        configured = {}
+        for event_type in EventType:
+            policy = policies.get(event_type, QueuePolicy())
+            if policy.policy not in POLICIES:
+                raise ValueError(f"알 수 없는 큐 정책: {event_type.value}={policy.policy}")
+            if policy.key not in (KEY_TYPE, KEY_SOURCE):
+                raise ValueError(f"알 수 없는 병합 기준: {event_type.value}={policy.key}")
+            if event_type in NEVER_DROP and policy.policy in (POLICY_DROP_OLDEST, POLICY_LATEST):
+                logger.warning(f"'{event_type.value}' 이벤트는 버릴 수 없어 큐 정책 {policy.policy} 를 무시합니다")
+                policy = QueuePolicy()
+            configured[event_type] = policy
+        self._policies = configured
+
     def subscribe(
         self, event_type: EventType, callback: Callable[[Event], Any]
     ) -> Callable[[], None]:
@@ -60,12 +183,104 @@ class EventBus:
         """
         이벤트를 발행합니다.
         
+        타입의 큐 정책에 따라 대기 중인 같은 키의 이벤트를 교체하거나, 상한에 도달하면
+        가장 오래된 이벤트를 버리거나 자리가 날 때까지 기다립니다.
+        (구독자 콜백 안에서 발행하면 워커가 멈추지 않도록 기다리지 않고 상한을 넘겨 넣음)
+        
         Args:
             event: 발행할 이벤트
         """
-        await self._queue.put(event)
+        event_type = event.type
+        policy = self._policies[event_type]
+        queued = self._by_type[event_type]
+        self.published += 1
+        
+        key = None
+        if event_type in NEVER_DROP:
+            # 순서 경계: 앞에 대기 중인 이벤트에 나중 값이 병합되어 앞지르지 않도록 함
+            self._latest.clear()
+        elif policy.policy == POLICY_LATEST:
+            key = (event_type, event_source(event)) if policy.key == KEY_SOURCE else event_type
+            entry = self._latest.get(key)
+            if entry is not None:
+                entry.event = event
+                self.coalesced[event_type] += 1
+                return
+        
+        if policy.maxsize > 0 and len(queued) >= policy.maxsize:
+            if policy.policy == POLICY_BLOCK:
+                while (
+                    len(queued) >= policy.maxsize
+                    and self._running
+                    and asyncio.current_task() is not self._worker_task
+                ):
+                    self._space.clear()
+                    await self._space.wait()
+            elif policy.policy != POLICY_UNBOUNDED:
+                self._drop_oldest(event_type)
+        
+        entry = _Pending(event, key)
+        self._pending.append(entry)
+        queued.append(entry)
+        if key is not None:
+            self._latest[key] = entry
+        self._live += 1
+        self.max_pending = max(self.max_pending, self._live)
+        self._ready.set()
         logger.debug(f"이벤트 발행됨: {event.type}")
 
+    def _drop_oldest(self, event_type: EventType) -> None:
+        """타입의 가장 오래된 대기 이벤트를 버림"""
+        entry = self._by_type[event_type].popleft()
+        if entry.key is not None and self._latest.get(entry.key) is entry:
+            del self._latest[entry.key]
+        entry.event = None
+        self._live -= 1
+        self.dropped[event_type] += 1
+        # 워커가 멈춰 있어도 버린 자리가 쌓이지 않도록 가끔 정리
+        if len(self._pending) > 2 * self._live + 64:
+            self._pending = collections.deque(pending for pending in self._pending if pending.event is not None)
+
+    def _next_event(self) -> Optional[Event]:
+        """처리할 다음 이벤트 (대기열이 비면 None)"""
+        while self._pending:
+            entry = self._pending.popleft()
+            event = entry.event
+            if event is None:
+                continue
+            self._by_type[event.type].popleft()
+            if entry.key is not None and self._latest.get(entry.key) is entry:
+                del self._latest[entry.key]
+            self._live -= 1
+            self._space.set()
+            return event
+        return None
+
+    def pending(self) -> int:
+        """처리를 기다리는 이벤트 수"""
+        return self._live
+
+    def stats(self) -> Dict[str, float]:
+        """
+        큐 통계를 반환합니다.
+        
+        Returns:
+            Dict[str, float]: 발행/처리/대기 이벤트 수, 최대 대기 수, 버림/병합 수 (전체와 타입별)
+        """
+        stats = {
+            "bus_published": float(self.published),
+            "bus_processed": float(self.processed),
+            "bus_pending": float(self._live),
+            "bus_max_pending": float(self.max_pending),
+            "bus_dropped": float(sum(self.dropped.values())),
+            "bus_coalesced": float(sum(self.coalesced.values())),
+        }
+        for event_type, count in self.dropped.items():
+            stats[f"bus_dropped_{event_type.value}"] = float(count)
+        for event_type, count in self.coalesced.items():
+            stats[f"bus_coalesced_{event_type.value}"] = float(count)
+        return stats
+
     async def start(self) -> None:
         """이벤트 버스 워커를 시작합니다."""
         if self._running:
@@ -81,6 +296,8 @@ class EventBus:
             return
         
         self._running = False
+        # 자리를 기다리는 발행자 깨우기
+        self._space.set()
         if self._worker_task:
             self._worker_task.cancel()
             try:
@@ -97,9 +314,13 @@ class EventBus:
         logger.debug("이벤트 워커 시작")
         while self._running:
             try:
-                event = await self._queue.get()
+                event = self._next_event()
+                if event is None:
+                    self._ready.clear()
+                    await self._ready.wait()
+                    continue
                 await self._process_event(event)
-                self._queue.task_done()
+                self.processed += 1
             except asyncio.CancelledError:
                 logger.debug("이벤트 워커 취소됨")
                 break
@@ -3,22 +3,118 @@
 """
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional
 
 import toml
 from pydantic import BaseModel, Field
 import streamlit as st
 from datetime import datetime
 
+from posture_guardian.core.bus import (BOUNDED_POLICIES, DEFAULT_POLICIES,
+                                       POLICY_BLOCK, POLICY_DROP_OLDEST,
+                                       POLICY_LATEST, QueuePolicy)
+from posture_guardian.utils.events import EventType
+from posture_guardian.utils.pressure_mat import MatLayout
+
 
 class SensorConfig(BaseModel):
     """센서 설정"""
     arduino_connection: bool = Field(False, description="아두이노 연결 여부")
+    arduino_protocol: str = Field("csv", description="아두이노 전송 프로토콜 (csv 또는 binary, 펌웨어 BINARY_MODE 와 일치)")
+    arduino_baud_rate: int = Field(9600, description="아두이노 시리얼 통신 속도 (binary 펌웨어 기본값 115200)")
+    arduino_port: Optional[str] = Field(None, description="아두이노 시리얼 포트 경로 (없으면 자동 탐색)")
+    arduino_reconnect_initial_backoff: float = Field(0.5, description="아두이노 재연결 첫 대기 시간 (초)")
+    arduino_reconnect_max_backoff: float = Field(30.0, description="아두이노 재연결 최대 대기 시간 (초)")
+    arduino_fallback_simulation: bool = Field(False, description="아두이노 재연결 대기 중 시뮬레이션 값 발행 여부 (source=simulation, 평가에는 사용하지 않음)")
+    pressure_batching: bool = Field(True, description="읽은 압력 샘플을 PressureBlock 하나로 발행 (false 면 샘플마다 PressureData)")
+    pressure_deadband: float = Field(0.0, ge=0, description="압력 데드밴드 (마지막 발행 값보다 이만큼 넘게 바뀐 샘플만 발행, 0 이면 모두 발행)")
+    pressure_heartbeat_interval: float = Field(1.0, description="데드밴드 사용 시 값이 그대로여도 발행하는 간격 (초)")
+    pressure_stats_interval: float = Field(10.0, description="압력 센서 통계 보고 간격 (초, 0 이면 보고 안 함)")
     webcam_device_id: int = Field(0, description="웹캠 장치 ID")
+    webcam_device_ids: List[int] = Field(default_factory=list, description="다중 카메라 장치 ID 목록 (비어 있으면 webcam_device_id 하나)")
+    webcam_capture_mode: str = Field("threaded", description="웹캠 캡처 방식 (threaded 또는 inline)")
+    webcam_buffer_size: int = Field(2, ge=1, description="캡처 스레드 링 버퍼 크기 (프레임)")
+    webcam_stats_interval: float = Field(10.0, description="웹캠 통계 보고 간격 (초)")
+    webcam_scan_devices: int = Field(4, ge=0, description="재연결 시 탐색할 장치 ID 범위 (0 이면 설정 장치만)")
+    webcam_reconnect_initial_backoff: float = Field(0.5, description="웹캠 재연결 첫 대기 시간 (초)")
+    webcam_reconnect_max_backoff: float = Field(30.0, description="웹캠 재연결 최대 대기 시간 (초)")
+    webcam_open_timeout: float = Field(5.0, description="웹캠 장치 열기 최대 대기 시간 (초)")
+    webcam_failure_threshold: int = Field(5, ge=1, description="연결 끊김으로 판단할 연속 읽기 실패 횟수")
+    webcam_stale_timeout: float = Field(3.0, description="연결 끊김으로 판단할 새 프레임 없는 시간 (초)")
+    webcam_width: Optional[int] = Field(None, description="캡처 너비 (없으면 드라이버 기본값)")
+    webcam_height: Optional[int] = Field(None, description="캡처 높이 (없으면 드라이버 기본값)")
+    webcam_fps: Optional[float] = Field(None, description="캡처 FPS (없으면 드라이버 기본값)")
+    webcam_fourcc: Optional[str] = Field(None, description="캡처 FOURCC (MJPG 또는 YUYV)")
+    opencv_threads: Optional[int] = Field(None, description="cv2.setNumThreads 값 (없으면 OpenCV 기본값)")
+    webcam_probe: bool = Field(False, description="시작 시 캡처 모드 탐색 여부")
+    webcam_probe_modes: List[str] = Field(
+        default_factory=lambda: ["320x240@YUYV", "640x480@YUYV", "640x480@MJPG", "1280x720@MJPG"],
+        description="탐색할 캡처 모드 후보 (너비x높이@FOURCC)"
+    )
+    webcam_probe_min_confidence: float = Field(0.6, description="탐색 시 요구하는 평가 키포인트 평균 가시성")
+    webcam_probe_frames: int = Field(10, ge=1, description="탐색 시 모드당 측정 프레임 수")
+    video_path: Optional[str] = Field(None, description="웹캠 대신 처리할 영상 파일 경로")
+    video_flip: bool = Field(True, description="영상 파일 프레임 좌우 반전 여부")
+    video_queue_size: int = Field(8, ge=1, description="디코딩된 영상 프레임 큐 크기")
+    pose_backend: str = Field("local", description="포즈 추론 방식 (local 또는 process)")
+    roi_tracking: bool = Field(False, description="머리·어깨 ROI 크롭 추론 사용 여부")
+    roi_padding: float = Field(0.6, description="ROI 여백 비율 (랜드마크 외곽 상자 대비)")
+    roi_min_visibility: float = Field(0.5, description="ROI 추적 유지 최소 평균 가시성")
+    motion_gating: bool = Field(False, description="움직임이 없을 때 포즈 추론 생략 여부")
+    motion_threshold: float = Field(2.0, description="추론을 재개할 평균 밝기 차이 (0~255)")
+    motion_max_reuse_age: float = Field(1.0, description="랜드마크 최대 재사용 시간 (초)")
+    flow_tracking: bool = Field(False, description="추론 사이 광학 흐름 랜드마크 추적 여부")
+    flow_inference_fps: float = Field(3.0, description="광학 흐름 사용 시 전체 추론 주기 (초당 횟수)")
+    flow_max_error: float = Field(2.0, description="허용 전방-후방 추적 오차 (픽셀)")
+    quality_filter: bool = Field(False, description="흐림/노출 불량 프레임 추론 제외 여부")
+    quality_min_sharpness: float = Field(15.0, description="최소 라플라시안 분산 (160px 축소 프레임 기준)")
+    quality_min_brightness: float = Field(40.0, description="최소 평균 밝기 (0~255)")
+    quality_max_brightness: float = Field(220.0, description="최대 평균 밝기 (0~255)")
+    quality_max_clipped_ratio: float = Field(0.6, description="너무 어둡거나 밝은 픽셀의 최대 비율 (0~1)")
+    landmark_smoothing: str = Field("none", description="랜드마크 평활화 방식 (none, one_euro 또는 ema)")
+    smoothing_min_cutoff: float = Field(1.0, description="One-Euro 최소 차단 주파수 (Hz)")
+    smoothing_beta: float = Field(5.0, description="One-Euro 속도 계수")
+    smoothing_d_cutoff: float = Field(1.0, description="One-Euro 속도 추정 차단 주파수 (Hz)")
+    smoothing_ema_alpha: float = Field(0.5, description="EMA 가중치 (0~1)")
+    smoothing_overrides: Dict[str, float] = Field(
+        default_factory=dict,
+        description="키포인트별 min_cutoff(One-Euro) 또는 alpha(EMA) 재정의"
+    )
+    presence_detection: bool = Field(False, description="자리 비움 감지 여부")
+    presence_cushion_floor: int = Field(100, description="앉아 있다고 보는 방석 압력 하한")
+    presence_absent_frames: int = Field(30, ge=1, description="자리 비움으로 판단할 연속 랜드마크 미검출 프레임 수")
+    presence_return_frames: int = Field(2, ge=1, description="복귀로 판단할 연속 랜드마크 검출 프레임 수")
+    presence_idle_interval: float = Field(1.0, description="자리 비움 동안 캡처/압력 발행 간격 (초)")
+    demand_scheduling: bool = Field(False, description="평가 일정에 맞춘 추론 여부")
+    demand_window: float = Field(0.5, description="평가 예정 시각 전 추론 시작 시간 (초)")
+    demand_keepalive_interval: float = Field(2.0, description="평가 구간 밖 keep-alive 추론 간격 (초)")
+    record_path: Optional[str] = Field(None, description="FRAME/PRESSURE 이벤트 녹화 파일 경로")
+    replay_path: Optional[str] = Field(None, description="재생할 녹화 파일 경로 (지정 시 실제 센서 대신 사용)")
+    replay_speed: float = Field(1.0, description="재생 배속 (0 이하면 최대 속도)")
+    replay_loop: bool = Field(False, description="녹화 파일 반복 재생 여부")
     simulation_foot_mean: int = Field(500, description="발받침대 시뮬레이션 평균값")
     simulation_foot_std: int = Field(30, description="발받침대 시뮬레이션 표준편차")
     simulation_cushion_mean: int = Field(500, description="방석 시뮬레이션 평균값")
     simulation_cushion_std: int = Field(30, description="방석 시뮬레이션 표준편차")
+    simulation_rate_hz: float = Field(10.0, gt=0, description="압력 시뮬레이션 초당 샘플 수")
+    simulation_scenario: Optional[str] = Field(None, description="압력 시뮬레이션 시나리오 TOML 파일 경로")
+    simulation_seed: Optional[int] = Field(None, description="압력 시뮬레이션 난수 시드 (없으면 매번 다름)")
+    mat_rows: int = Field(0, ge=0, description="다채널 방석 매트 앞뒤 셀 수 (0 이면 단일 방석 센서)")
+    mat_cols: int = Field(0, ge=0, description="다채널 방석 매트 좌우 셀 수 (0 이면 단일 방석 센서)")
+
+    def mat_layout(self) -> Optional[MatLayout]:
+        """다채널 방석 매트 셀 배치 (단일 방석 센서면 None)"""
+        if self.mat_rows * self.mat_cols == 0:
+            return None
+        return MatLayout.grid(self.mat_rows, self.mat_cols)
+
+    def pressure_channels(self) -> int:
+        """아두이노 샘플당 값 개수 (발받침대 + 방석 또는 매트 셀)"""
+        return 1 + max(1, self.mat_rows * self.mat_cols)
+
+    def camera_devices(self) -> List[int]:
+        """사용할 웹캠 장치 ID 목록 (첫 번째가 보정 기준 카메라)"""
+        return list(self.webcam_device_ids) or [self.webcam_device_id]
 
 
 class ProcessingConfig(BaseModel):
@@ -28,6 +124,48 @@ class ProcessingConfig(BaseModel):
     check_interval_min: int = Field(2, description="검사 간격 최소값 (초)")
     check_interval_max: int = Field(10, description="검사 간격 최대값 (초)")
     calibration_time: int = Field(3, description="보정 시간 (초)")
+    camera_frame_max_age: float = Field(2.0, description="다중 카메라 평가 시 함께 사용할 프레임의 최대 시간 차이 (초)")
+    pressure_window: int = Field(20, ge=1, description="압력 평가용 슬라이딩 윈도우 길이 (샘플 수)")
+    pressure_ema_alpha: float = Field(0.2, gt=0, le=1, description="압력 지수 이동 평균 가중치")
+    pressure_statistic: str = Field("mean", description="압력 평가 값 (mean: 윈도우 평균, ema: 지수 이동 평균, latest: 최근 샘플)")
+    balance_threshold: float = Field(0.3, description="다채널 매트 좌우 균형 임계값 ((오른쪽-왼쪽)/합, 0~1)")
+
+
+class QueuePolicyConfig(BaseModel):
+    """이벤트 타입별 버스 큐 정책"""
+    policy: str = Field("unbounded", description="큐 정책 (unbounded, block, drop_oldest, latest)")
+    maxsize: int = Field(0, ge=0, description="타입별 대기 이벤트 최대 수 (0 이면 무제한)")
+    key: str = Field("type", description="latest 정책의 병합 기준 (type 또는 source)")
+
+
+class BusConfig(BaseModel):
+    """이벤트 버스 설정"""
+    bounded_queues: bool = Field(False, description="상한/병합 기본 정책 사용 여부 (false 면 모든 타입 무제한)")
+    queue_policies: Dict[str, QueuePolicyConfig] = Field(
+        default_factory=dict,
+        description="이벤트 타입(frame, pressure, ...)별 큐 정책 재정의 (빠진 타입은 기본 정책)"
+    )
+    stats_interval: float = Field(10.0, description="버스 큐 통계 보고 간격 (초, 0 이면 보고 안 함)")
+
+    def policies(self, lossless: Iterable[EventType] = ()) -> Dict[EventType, QueuePolicy]:
+        """
+        기본 정책에 재정의를 덮어쓴 이벤트 타입별 큐 정책
+
+        Args:
+            lossless: 버리거나 병합하면 안 되는 이벤트 타입 (녹화 중인 FRAME/PRESSURE 등).
+                해당 타입의 drop_oldest/latest 정책은 같은 상한의 block 으로 바뀜
+
+        Returns:
+            Dict[EventType, QueuePolicy]: 이벤트 타입별 큐 정책
+        """
+        policies = dict(BOUNDED_POLICIES if self.bounded_queues else DEFAULT_POLICIES)
+        for name, override in self.queue_policies.items():
+            policies[EventType(name)] = QueuePolicy(override.policy, override.maxsize, override.key)
+        for event_type in lossless:
+            policy = policies.get(event_type)
+            if policy is not None and policy.policy in (POLICY_DROP_OLDEST, POLICY_LATEST):
+                policies[event_type] = QueuePolicy(POLICY_BLOCK, policy.maxsize)
+        return policies
 
 
 class UIConfig(BaseModel):
@@ -44,6 +182,7 @@ class AppConfig(BaseModel):
     debug: bool = Field(False, description="디버그 모드")
     sensors: SensorConfig = Field(default_factory=SensorConfig, description="센서 설정")
     processing: ProcessingConfig = Field(default_factory=ProcessingConfig, description="처리 설정")
+    bus: BusConfig = Field(default_factory=BusConfig, description="이벤트 버스 설정")
     ui: UIConfig = Field(default_factory=UIConfig, description="UI 설정")
 
 
@@ -10,6 +10,7 @@ from posture_guardian.core.config import AppConfig
 from posture_guardian.processing.calibration import calibration_processor
 from posture_guardian.processing.posture_eval import posture_processor
 from posture_guardian.sensors.pressure_pad import pressure_pad_sensor
+from posture_guardian.sensors.replay import event_recorder, replay_sensor
 from posture_guardian.sensors.webcam import webcam_sensor
 from posture_guardian.ui.streamlit_ui import start_ui, ui_processor
 from posture_guardian.utils.events import Command, CommandType, Event, EventType
@@ -17,6 +18,35 @@ from posture_guardian.utils.events import Command, CommandType, Event, EventType
 logger = logging.getLogger(__name__)
 
 
+async def bus_monitor(config: AppConfig) -> None:
+    """
+    이벤트 버스 큐 통계를 주기적으로 보고합니다.
+    
+    버려진 이벤트가 새로 생기면 경고로 기록하고 (병합은 정상 동작), 통계는 SYSTEM stats 이벤트로 발행합니다.
+    
+    Args:
+        config: 애플리케이션 설정
+    """
+    bus = get_event_bus()
+    interval = config.bus.stats_interval
+    if interval <= 0:
+        return
+    last_dropped = 0.0
+    while True:
+        await asyncio.sleep(interval)
+        stats = bus.stats()
+        message = "이벤트 버스 통계: " + ", ".join(f"{k}={v:.0f}" for k, v in stats.items())
+        if stats["bus_dropped"] > last_dropped:
+            logger.warning(message)
+        else:
+            logger.info(message)
+        last_dropped = stats["bus_dropped"]
+        await bus.publish(Event(
+            type=EventType.SYSTEM,
+            data={"source": "bus", "kind": "stats", **stats}
+        ))
+
+
 async def start_all(config: AppConfig) -> None:
     """
     모든 시스템 모듈을 시작합니다.
@@ -26,6 +56,9 @@ async def start_all(config: AppConfig) -> None:
     """
     # 이벤트 버스 초기화
     bus = get_event_bus()
+    # 녹화 중에는 녹화하는 이벤트를 버리거나 병합하지 않음 (재생 충실도)
+    recorded = (EventType.FRAME, EventType.PRESSURE) if config.sensors.record_path else ()
+    bus.configure(config.bus.policies(lossless=recorded))
     await bus.start()
     
     # 시스템 태스크 목록
@@ -35,9 +68,16 @@ async def start_all(config: AppConfig) -> None:
         # UI 시작 - 별도 프로세스로 실행
         ui_process = await start_ui()
         
-        # 센서 모듈 태스크 시작
-        tasks.append(asyncio.create_task(webcam_sensor(config)))
-        tasks.append(asyncio.create_task(pressure_pad_sensor(config)))
+        # 센서 모듈 태스크 시작 (녹화 파일이 지정되면 실제 센서 대신 재생)
+        if config.sensors.replay_path:
+            tasks.append(asyncio.create_task(replay_sensor(config)))
+        else:
+            tasks.append(asyncio.create_task(webcam_sensor(config)))
+            tasks.append(asyncio.create_task(pressure_pad_sensor(config)))
+        
+        # 센서 이벤트 녹화
+        if config.sensors.record_path:
+            tasks.append(asyncio.create_task(event_recorder(config)))
         
         # 처리 모듈 태스크 시작
         tasks.append(asyncio.create_task(calibration_processor(config)))
@@ -46,6 +86,9 @@ async def start_all(config: AppConfig) -> None:
         # UI 프로세서 태스크 시작
         tasks.append(asyncio.create_task(ui_processor(config)))
         
+        # 버스 큐 통계 보고
+        tasks.append(asyncio.create_task(bus_monitor(config)))
+        
         # 모든 태스크 완료될 때까지 대기
         logger.info("모든 시스템 모듈이 시작되었습니다")
         await asyncio.gather(*tasks)
@@ -7,20 +7,38 @@ import asyncio
 import logging
 import random
 import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Deque, Dict, List, Optional, Set, Tuple, Union
+
+import numpy as np
 
 from posture_guardian.core.bus import get_event_bus
 from posture_guardian.core.config import AppConfig
-from posture_guardian.utils.events import (CalibrationData, Event, EventType,
-                                          FrameData, PostureResult,
-                                          PostureStatus, PressureData)
+from posture_guardian.utils.events import (CalibrationData, CheckSchedule,
+                                          Event, EventType, FrameData,
+                                          PostureResult, PostureStatus,
+                                          PressureBlock, PressureData,
+                                          latest_pressure)
+from posture_guardian.utils.pressure_mat import LR_BALANCE
+from posture_guardian.utils.rolling import RollingStats
 
 logger = logging.getLogger(__name__)
 
+# 영상 파일 입력의 카메라 ID (보정 기준 카메라로 취급)
+VIDEO_CAMERA_ID = "video"
+
 
 class PostureEvaluator:
-    """자세 평가기"""
+    """
+    자세 평가기
+    
+    카메라가 여러 대이면 카메라별 최신 프레임을 보관합니다. 눈 거리 비율은 카메라마다 자기 기준값
+    (보정 기준 카메라 - `camera_devices()` 의 첫 번째, 영상 입력이면 video - 는 보정 데이터, 나머지는
+    보정 직전 `calibration_time` 초 동안의 자기 비율 평균) 대비 차이를 구해 최근 프레임들의 평균 차이로 평가하고, 어깨 기울기는 최근 프레임들의 평균을 기록합니다.
+    아두이노 모드에서는 source="arduino" 압력 샘플만 평가하며, 재연결 중 시뮬레이션 샘플이나
+    연결 끊김 동안은 평가를 멈춥니다. 압력 데이터 출처가 바뀌면 윈도우 통계를 비웁니다.
+    """
     
     def __init__(self, config: AppConfig):
         """
@@ -39,6 +57,36 @@ class PostureEvaluator:
         self.check_interval_min = config.processing.check_interval_min
         self.check_interval_max = config.processing.check_interval_max
         self.next_check_time: Optional[float] = None
+        self.pause_reasons: Set[str] = set()
+        
+        # 카메라별 최신 프레임 (latest_frame 은 눈 거리 평가에 사용할 프레임)
+        self.camera_ids: List[str] = [str(d) for d in config.sensors.camera_devices()]
+        self.latest_frames: Dict[str, FrameData] = {}
+        self.eye_baselines: Dict[str, float] = {}
+        # 카메라별 최근 `calibration_time` 초의 (시각, 눈 거리 비율) - 보정 시 기준값 계산에 사용
+        self.calibration_time = config.processing.calibration_time
+        self.recent_eye_ratios: Dict[str, Deque[Tuple[datetime, float]]] = {}
+        self.lost_cameras: Set[str] = set()
+        self.frame_max_age = config.processing.camera_frame_max_age
+        
+        # 다채널 방석 매트: 가장 최근 샘플의 압력 중심/균형/하중
+        self.mat_layout = config.sensors.mat_layout()
+        self.latest_mat_features: Optional[Dict[str, float]] = None
+        
+        # 압력 슬라이딩 윈도우 통계 (평가 시 샘플 하나 대신 사용)
+        processing = config.processing
+        self.pressure_statistic = processing.pressure_statistic
+        if self.pressure_statistic not in ("mean", "ema", "latest"):
+            logger.warning(f"알 수 없는 압력 통계 방식: {self.pressure_statistic}, mean 으로 동작합니다")
+            self.pressure_statistic = "mean"
+        self.pressure_stats: Dict[str, RollingStats] = {
+            name: RollingStats(processing.pressure_window, processing.pressure_ema_alpha)
+            for name in ("foot", "cushion", LR_BALANCE)
+        }
+        
+        # 평가에 쓸 압력 데이터 출처 (아두이노 모드면 실제 센서만, 아니면 제한 없음)
+        self.required_pressure_source: Optional[str] = "arduino" if config.sensors.arduino_connection else None
+        self.pressure_source: Optional[str] = None
     
     def set_calibration(self, calibration: CalibrationData) -> None:
         """
@@ -48,12 +96,106 @@ class PostureEvaluator:
             calibration: 보정 데이터
         """
         self.calibration = calibration
+        # 보정 기준 카메라는 보정 값, 나머지 카메라는 보정 시간 동안의 비율 평균을 기준값으로 사용
+        primary = self.camera_ids[0]
+        self.eye_baselines = {primary: calibration.baseline_eye_distance_ratio}
+        newest = max((ratios[-1][0] for ratios in self.recent_eye_ratios.values() if ratios), default=None)
+        for camera_id, ratios in self.recent_eye_ratios.items():
+            window = [
+                ratio for timestamp, ratio in ratios
+                if (newest - timestamp).total_seconds() <= self.calibration_time
+            ]
+            if camera_id != primary and window:
+                self.eye_baselines[camera_id] = sum(window) / len(window)
         self.start_time = time.time()
         self.last_check_time = self.start_time
         self.next_check_time = self.start_time + self._get_random_interval()
         self.score = 10
         logger.info("자세 평가기 보정 데이터 설정됨")
     
+    @property
+    def paused(self) -> bool:
+        """평가 일시 중지 여부"""
+        return bool(self.pause_reasons)
+    
+    def set_paused(self, reason: str, paused: bool) -> None:
+        """
+        평가 일시 중지 사유 설정/해제
+        
+        중지되면 마지막 프레임을 버리고 평가를 멈추며,
+        모든 사유가 해제되면 새 프레임이 쌓이도록 다음 평가 시각을 뒤로 미룹니다.
+        
+        Args:
+            reason: 중지 사유 ("camera", "presence" 등)
+            paused: 중지 여부
+        """
+        was_paused = self.paused
+        if paused:
+            self.pause_reasons.add(reason)
+        else:
+            self.pause_reasons.discard(reason)
+        
+        if self.paused and not was_paused:
+            self.latest_frame = None
+            self.latest_frames.clear()
+            logger.info(f"자세 평가기: 평가 일시 중지 ({reason})")
+        elif was_paused and not self.paused:
+            if self.calibration is not None:
+                self.next_check_time = time.time() + self._get_random_interval()
+            logger.info(f"자세 평가기: 평가 재개 ({reason})")
+    
+    def set_camera_available(self, available: bool, camera_id: Optional[str] = None) -> None:
+        """
+        웹캠 연결 상태 반영 - 모든 카메라가 끊긴 경우에만 평가를 멈춤
+        
+        Args:
+            available: 웹캠 사용 가능 여부
+            camera_id: 상태가 바뀐 카메라 ID (없으면 전체)
+        """
+        if camera_id is None:
+            self.set_paused("camera", not available)
+            return
+        
+        camera_id = self._camera_key(camera_id)
+        if available:
+            self.lost_cameras.discard(camera_id)
+        else:
+            self.lost_cameras.add(camera_id)
+            # 끊긴 카메라의 마지막 프레임과 비율 기록은 사용하지 않음
+            self.latest_frames.pop(camera_id, None)
+            self.recent_eye_ratios.pop(camera_id, None)
+            self.latest_frame = self._select_frame()
+        self.set_paused("camera", set(self.camera_ids) <= self.lost_cameras)
+    
+    def set_user_present(self, present: bool) -> None:
+        """
+        사용자 재석 상태 반영
+        
+        Args:
+            present: 재석 여부
+        """
+        self.set_paused("presence", not present)
+    
+    def set_pressure_available(self, available: bool) -> None:
+        """
+        아두이노 연결 상태 반영 - 끊기면 윈도우 통계를 비우고 실제 샘플이 다시 올 때까지 평가를 멈춤
+        
+        Args:
+            available: 아두이노 연결 여부
+        """
+        if self.required_pressure_source is None or available:
+            return
+        self.reset_pressure()
+        self.set_paused("pressure", True)
+    
+    def reset_pressure(self) -> None:
+        """압력 윈도우 통계와 최근 압력 값을 버립니다."""
+        for stats in self.pressure_stats.values():
+            stats.reset()
+        self.latest_pressure = None
+        self.latest_mat_features = None
+        self.pressure_source = None
+    
     def update_frame(self, frame: FrameData) -> None:
         """
         최신 프레임 데이터 업데이트
@@ -61,16 +203,95 @@ class PostureEvaluator:
         Args:
             frame: 프레임 데이터
         """
-        self.latest_frame = frame
+        camera_id = self._camera_key(frame.camera_id)
+        self.latest_frames[camera_id] = frame
+        self.latest_frame = self._select_frame()
+        
+        ratio = self._eye_distance_ratio(frame)
+        if ratio:
+            ratios = self.recent_eye_ratios.setdefault(camera_id, deque())
+            ratios.append((frame.timestamp, ratio))
+            while (frame.timestamp - ratios[0][0]).total_seconds() > self.calibration_time:
+                ratios.popleft()
+    
+    def _camera_key(self, camera_id: str) -> str:
+        """카메라별 상태의 키 (영상 입력은 보정 기준 카메라)"""
+        return self.camera_ids[0] if camera_id == VIDEO_CAMERA_ID else camera_id
+    
+    def _fresh_frames(self) -> List[FrameData]:
+        """가장 최근 프레임 기준 `frame_max_age` 초 이내의 카메라별 프레임"""
+        if not self.latest_frames:
+            return []
+        newest = max(frame.timestamp for frame in self.latest_frames.values())
+        return [
+            frame for frame in self.latest_frames.values()
+            if (newest - frame.timestamp).total_seconds() <= self.frame_max_age
+        ]
     
-    def update_pressure(self, pressure: PressureData) -> None:
+    def _select_frame(self) -> Optional[FrameData]:
+        """눈 거리 평가에 사용할 프레임 (보정 기준 카메라 우선, 없으면 가장 최근 프레임)"""
+        fresh = self._fresh_frames()
+        if not fresh:
+            return None
+        for frame in fresh:
+            if self._camera_key(frame.camera_id) == self.camera_ids[0]:
+                return frame
+        return max(fresh, key=lambda frame: frame.timestamp)
+    
+    def update_pressure(self, pressure: Union[PressureData, PressureBlock]) -> None:
         """
         최신 압력 데이터 업데이트
         
         Args:
-            pressure: 압력 데이터
+            pressure: 압력 데이터 또는 압력 샘플 묶음 (모든 샘플을 윈도우 통계에 반영)
         """
-        self.latest_pressure = pressure
+        if isinstance(pressure, PressureBlock) and len(pressure) == 0:
+            return
+        if pressure.source != self.pressure_source:
+            # 다른 출처의 값과 섞어 평균 내지 않도록 윈도우를 비움
+            self.reset_pressure()
+            self.pressure_source = pressure.source
+        if self.required_pressure_source is not None:
+            usable = pressure.source == self.required_pressure_source
+            self.set_paused("pressure", not usable)
+            if not usable:
+                return
+        
+        if isinstance(pressure, PressureBlock):
+            self.pressure_stats["foot"].extend(pressure.foot_values)
+            self.pressure_stats["cushion"].extend(pressure.cushion_values)
+        else:
+            self.pressure_stats["foot"].push(pressure.foot_value)
+            self.pressure_stats["cushion"].push(pressure.cushion_value)
+        self.latest_pressure = latest_pressure(pressure)
+        
+        if self.mat_layout is None:
+            return
+        cells = pressure.cells
+        if cells is None or np.shape(cells)[-1] != self.mat_layout.channels:
+            return
+        # 묶음 전체의 특징을 한 번에 계산하고 가장 최근 샘플 값을 보관
+        features = self.mat_layout.features(cells)
+        self.latest_mat_features = {name: float(values[-1]) for name, values in features.items()}
+        self.pressure_stats[LR_BALANCE].extend(features[LR_BALANCE])
+    
+    def _pressure_value(self, name: str, latest: float) -> float:
+        """
+        평가에 사용할 압력 값 (`pressure_statistic` 에 따라 윈도우 평균, EMA 또는 최근 샘플)
+        
+        Args:
+            name: 통계 이름 ("foot", "cushion", "lr_balance")
+            latest: 가장 최근 샘플 값
+            
+        Returns:
+            float: 평가 값
+        """
+        stats = self.pressure_stats[name]
+        if self.pressure_statistic == "latest" or len(stats) == 0:
+            return latest
+        if self.pressure_statistic == "ema":
+            return stats.ema
+        return stats.mean
     
     def is_ready_for_evaluation(self) -> bool:
         """
@@ -81,8 +302,9 @@ class PostureEvaluator:
         """
         current_time = time.time()
         
-        # 보정 데이터, 프레임 데이터, 압력 데이터가 모두 있고, 체크 시간이 지났는지 확인
-        return (self.calibration is not None and 
+        # 일시 중지 상태가 아니고, 보정 데이터, 프레임 데이터, 압력 데이터가 모두 있고, 체크 시간이 지났는지 확인
+        return (not self.paused and
+                self.calibration is not None and 
                 self.latest_frame is not None and 
                 self.latest_pressure is not None and
                 self.next_check_time is not None and
@@ -122,6 +344,8 @@ class PostureEvaluator:
             status = foot_status
         elif cushion_status != PostureStatus.GOOD:
             status = cushion_status
+        elif self._check_balance() != PostureStatus.GOOD:
+            status = PostureStatus.BAD_CUSHION
         
         # 점수 조정 - 나쁜 자세일 때 점수 감소
         if status != PostureStatus.GOOD:
@@ -136,10 +360,25 @@ class PostureEvaluator:
         
         # 세부 정보 수집
         details = {}
-        if self.latest_frame.eye_distance_left is not None and self.latest_frame.eye_distance_right is not None:
-            details["eye_distance_ratio"] = self.latest_frame.eye_distance_left / self.latest_frame.eye_distance_right
+        eye_ratio = self._eye_distance_ratio(self.latest_frame)
+        if eye_ratio is not None:
+            details["eye_distance_ratio"] = eye_ratio
+        deviations = self._eye_deviations()
+        if deviations:
+            details["eye_distance_deviation"] = sum(deviations.values()) / len(deviations)
+            if len(deviations) > 1:
+                details.update({f"eye_distance_deviation_{cid}": d for cid, d in deviations.items()})
+        details.update(self._shoulder_details())
         details["foot_value"] = self.latest_pressure.foot_value
         details["cushion_value"] = self.latest_pressure.cushion_value
+        for name in ("foot", "cushion"):
+            stats = self.pressure_stats[name]
+            details[f"{name}_mean"] = stats.mean
+            details[f"{name}_std"] = stats.std
+        if self.latest_mat_features is not None:
+            details.update(self.latest_mat_features)
+        # 실제 센서 대신 시뮬레이션 값으로 평가했는지 표시
+        details["pressure_simulated"] = float(self.latest_pressure.source != "arduino")
         
         # 결과 생성
         result = PostureResult(
@@ -155,9 +394,54 @@ class PostureEvaluator:
         
         return result
     
+    def _shoulder_details(self) -> Dict[str, float]:
+        """
+        어깨 기울기 세부 정보 - 카메라가 여러 대이면 카메라별 값과 평균
+        
+        Returns:
+            Dict[str, float]: shoulder_tilt (및 shoulder_tilt_<카메라 ID>)
+        """
+        tilts = {
+            frame.camera_id: frame.landmarks.shoulder_tilt()
+            for frame in self._fresh_frames()
+            if frame.landmarks is not None
+        }
+        if not tilts:
+            return {}
+        details = {"shoulder_tilt": sum(tilts.values()) / len(tilts)}
+        if len(tilts) > 1:
+            details.update({f"shoulder_tilt_{cid}": tilt for cid, tilt in tilts.items()})
+        return details
+    
+    def _eye_deviations(self) -> Dict[str, float]:
+        """
+        카메라별 눈 거리 비율의 기준값 대비 상대 차이
+        
+        기준값이 있는 카메라의 최근 프레임만 사용하고, 하나도 없으면 평가용 프레임을
+        보정 기준 값과 비교합니다.
+        
+        Returns:
+            Dict[str, float]: 카메라 ID → |비율 - 기준값| / 기준값
+        """
+        deviations = {}
+        for frame in self._fresh_frames():
+            camera_id = self._camera_key(frame.camera_id)
+            baseline = self.eye_baselines.get(camera_id)
+            ratio = self._eye_distance_ratio(frame)
+            if baseline and ratio is not None:
+                deviations[camera_id] = abs(ratio - baseline) / baseline
+        if deviations or self.calibration is None or self.latest_frame is None:
+            return deviations
+        
+        ratio = self._eye_distance_ratio(self.latest_frame)
+        baseline = self.calibration.baseline_eye_distance_ratio
+        if ratio is None:
+            return {}
+        return {self._camera_key(self.latest_frame.camera_id): abs(ratio - baseline) / baseline}
+    
     def _check_eye_distance(self) -> PostureStatus:
         """
-        눈 거리 비율 체크
+        눈 거리 비율 체크 - 카메라가 여러 대이면 카메라별 차이의 평균
         
         Returns:
             PostureStatus: 자세 상태
@@ -165,23 +449,37 @@ class PostureEvaluator:
         if self.calibration is None or self.latest_frame is None:
             return PostureStatus.UNKNOWN
         
-        if self.latest_frame.eye_distance_left is None or self.latest_frame.eye_distance_right is None:
+        # 현재 눈 거리 비율의 기준값 대비 차이
+        deviations = self._eye_deviations()
+        if not deviations:
             return PostureStatus.UNKNOWN
         
-        # 현재 눈 거리 비율 계산
-        current_ratio = self.latest_frame.eye_distance_left / self.latest_frame.eye_distance_right
-        baseline_ratio = self.calibration.baseline_eye_distance_ratio
-        
         # 임계값 확인
         threshold = self.config.processing.eye_distance_threshold
-        ratio_diff = abs(current_ratio - baseline_ratio) / baseline_ratio
+        ratio_diff = sum(deviations.values()) / len(deviations)
         
         if ratio_diff > threshold:
-            logger.info(f"눈 거리 비율 불균형: {ratio_diff:.4f} > {threshold:.4f} (기준값: {baseline_ratio:.4f})")
+            logger.info(f"눈 거리 비율 불균형: {ratio_diff:.4f} > {threshold:.4f} (카메라 {len(deviations)}대)")
             return PostureStatus.BAD_EYES
         
         return PostureStatus.GOOD
     
+    @staticmethod
+    def _eye_distance_ratio(frame: FrameData) -> Optional[float]:
+        """
+        프레임의 왼쪽/오른쪽 눈 거리 비율
+        
+        랜드마크 배열이 있으면 배열에서 바로 계산합니다.
+        
+        Returns:
+            Optional[float]: 눈 거리 비율 또는 None (계산 불가)
+        """
+        if frame.landmarks is not None:
+            return frame.landmarks.eye_distance_ratio()
+        if frame.eye_distance_left is None or not frame.eye_distance_right:
+            return None
+        return frame.eye_distance_left / frame.eye_distance_right
+    
     def _check_foot_pressure(self) -> PostureStatus:
         """
         발받침대 압력 체크
@@ -192,8 +490,8 @@ class PostureEvaluator:
         if self.calibration is None or self.latest_pressure is None:
             return PostureStatus.UNKNOWN
         
-        # 현재 압력 값 확인
-        current_value = self.latest_pressure.foot_value
+        # 현재 압력 값 확인 (윈도우 통계)
+        current_value = self._pressure_value("foot", self.latest_pressure.foot_value)
         baseline_value = self.calibration.baseline_foot
         
         # 임계값 확인
@@ -216,8 +514,8 @@ class PostureEvaluator:
         if self.calibration is None or self.latest_pressure is None:
             return PostureStatus.UNKNOWN
         
-        # 현재 압력 값 확인
-        current_value = self.latest_pressure.cushion_value
+        # 현재 압력 값 확인 (윈도우 통계)
+        current_value = self._pressure_value("cushion", self.latest_pressure.cushion_value)
         baseline_value = self.calibration.baseline_cushion
         
         # 임계값 확인
@@ -230,6 +528,43 @@ class PostureEvaluator:
         
         return PostureStatus.GOOD
     
+    def _check_balance(self) -> PostureStatus:
+        """
+        다채널 매트 좌우 균형 체크 (한쪽으로 기울어 앉음)
+        
+        Returns:
+            PostureStatus: 자세 상태 (매트가 없거나 자리가 비어 있으면 GOOD)
+        """
+        if self.latest_mat_features is None or self.latest_pressure is None:
+            return PostureStatus.GOOD
+        
+        # 앉아 있지 않으면 셀 잡음만 남으므로 판단하지 않음
+        if self.latest_pressure.cushion_value < self.config.sensors.presence_cushion_floor:
+            return PostureStatus.GOOD
+        
+        baseline = 0.0
+        if self.calibration is not None and self.calibration.baseline_lr_balance is not None:
+            baseline = self.calibration.baseline_lr_balance
+        
+        threshold = self.config.processing.balance_threshold
+        balance = self._pressure_value(LR_BALANCE, self.latest_mat_features[LR_BALANCE])
+        balance_diff = abs(balance - baseline)
+        
+        if balance_diff > threshold:
+            logger.info(f"방석 좌우 불균형: {balance_diff:.2f} > {threshold} (기준값: {baseline:.2f})")
+            return PostureStatus.BAD_CUSHION
+        
+        return PostureStatus.GOOD
+    
+    def get_schedule(self) -> CheckSchedule:
+        """
+        다음 평가 일정 반환
+        
+        Returns:
+            CheckSchedule: 다음 평가 예정 시각 (보정 전이면 None)
+        """
+        return CheckSchedule(next_check_time=self.next_check_time)
+    
     def _get_random_interval(self) -> float:
         """
         랜덤 체크 간격 생성
@@ -253,11 +588,19 @@ async def posture_processor(config: AppConfig) -> None:
     # 평가기 초기화
     evaluator = PostureEvaluator(config)
     
+    # 다음 평가 시각 발행 (웹캠 수요 기반 추론에 사용)
+    async def publish_schedule() -> None:
+        await bus.publish(Event(
+            type=EventType.SCHEDULE,
+            data=evaluator.get_schedule()
+        ))
+    
     # 보정 데이터 구독
     async def on_calibration(event: Event) -> None:
         calibration_data: CalibrationData = event.data
         evaluator.set_calibration(calibration_data)
         logger.info("자세 평가 처리기: 보정 데이터 수신")
+        await publish_schedule()
     
     # 프레임 데이터 구독
     async def on_frame(event: Event) -> None:
@@ -274,16 +617,37 @@ async def posture_processor(config: AppConfig) -> None:
                     data=result
                 )
                 await bus.publish(result_event)
+                await publish_schedule()
     
     # 압력 데이터 구독
     async def on_pressure(event: Event) -> None:
-        pressure_data: PressureData = event.data
-        evaluator.update_pressure(pressure_data)
-        
+        was_paused = evaluator.paused
+        evaluator.update_pressure(event.data)
+        if was_paused and not evaluator.paused:
+            await publish_schedule()
+        
+    # 웹캠 연결 상태 및 재석 상태 구독
+    async def on_system(event: Event) -> None:
+        data = event.data
+        if not isinstance(data, dict):
+            return
+        was_paused = evaluator.paused
+        if data.get("kind") == "camera_health":
+            evaluator.set_camera_available(data.get("status") == "connected", data.get("camera_id"))
+        elif data.get("kind") == "presence":
+            evaluator.set_user_present(data.get("status") == "present")
+        elif data.get("kind") == "pressure_health":
+            evaluator.set_pressure_available(data.get("status") == "connected")
+        else:
+            return
+        if was_paused and not evaluator.paused:
+            await publish_schedule()
+    
     # 이벤트 구독
     cal_unsub = bus.subscribe(EventType.CALIBRATION, on_calibration)
     frame_unsub = bus.subscribe(EventType.FRAME, on_frame)
     pressure_unsub = bus.subscribe(EventType.PRESSURE, on_pressure)
+    system_unsub = bus.subscribe(EventType.SYSTEM, on_system)
     
     try:
         # 계속 실행
@@ -299,4 +663,5 @@ async def posture_processor(config: AppConfig) -> None:
         cal_unsub()
         frame_unsub()
         pressure_unsub()
+        system_unsub()
         logger.info("자세 평가 처리기 종료") 
\ No newline at end of file
@@ -0,0 +1,214 @@
+"""
+웹캠 캡처 모드 설정 및 시작 시 탐색
+- 해상도, FPS, FOURCC(MJPG/YUYV) 적용 후 드라이버가 실제로 선택한 값 확인
+- 후보 모드마다 디코딩/전처리 비용과 랜드마크 신뢰도를 측정해 가장 저렴한 모드 선택
+"""
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from posture_guardian.utils.landmarks import KEYPOINT_NAMES, LANDMARK_INDEX, VISIBILITY
+
+logger = logging.getLogger(__name__)
+
+# 신뢰도 계산에 사용하는 평가 키포인트 행
+_KEYPOINT_ROWS = np.array([LANDMARK_INDEX[name] for name in KEYPOINT_NAMES])
+
+# 탐색 시 같은 비용으로 보는 단위 (ms) - 이 안에서는 신뢰도, 해상도 순으로 선택
+PROBE_COST_RESOLUTION_MS = 0.1
+
+
+def preprocess_frame(frame: np.ndarray, flip: bool = True) -> np.ndarray:
+    """
+    BGR 캡처 프레임을 좌우 반전(거울 효과)하고 RGB 로 변환합니다.
+
+    Args:
+        frame: BGR 프레임
+        flip: 좌우 반전 여부
+
+    Returns:
+        np.ndarray: RGB 프레임
+    """
+    if flip:
+        frame = cv2.flip(frame, 1)
+    return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+
+def parse_mode(mode: str) -> Tuple[int, int, Optional[str]]:
+    """
+    "640x480" 또는 "640x480@MJPG" 형식의 모드 문자열을 해석합니다.
+
+    Args:
+        mode: 모드 문자열
+
+    Returns:
+        Tuple[int, int, Optional[str]]: (너비, 높이, FOURCC 또는 None)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    size, _, fourcc = mode.partition("@")
+    try:
+        width, height = (int(v) for v in size.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"캡처 모드 형식이 잘못되었습니다: {mode}")
+    return width, height, fourcc.upper() or None
+
+
+def _decode_fourcc(value: float) -> str:
+    """CAP_PROP_FOURCC 값을 문자열로 변환"""
+    code = int(value)
+    return "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)).strip("\x00")
+
+
+def configure_capture(
+    cap: cv2.VideoCapture,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+    fps: Optional[float] = None,
+    fourcc: Optional[str] = None,
+) -> Dict[str, object]:
+    """
+    캡처 설정을 적용하고 드라이버가 실제로 선택한 값을 반환합니다.
+
+    FOURCC 는 해상도보다 먼저 설정해야 일부 드라이버(V4L2)에서 적용됩니다.
+    None 인 항목은 드라이버 기본값을 유지합니다.
+
+    Args:
+        cap: 열려 있는 OpenCV 캡처 객체
+        width: 프레임 너비
+        height: 프레임 높이
+        fps: 프레임 속도
+        fourcc: "MJPG" 또는 "YUYV" 등 4글자 코드
+
+    Returns:
+        Dict[str, object]: 실제 width, height, fps, fourcc
+    """
+    if fourcc:
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc[:4].ljust(4)))
+    if width:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+    if height:
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+    if fps:
+        cap.set(cv2.CAP_PROP_FPS, fps)
+
+    return {
+        "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fps": float(cap.get(cv2.CAP_PROP_FPS)),
+        "fourcc": _decode_fourcc(cap.get(cv2.CAP_PROP_FOURCC)),
+    }
+
+
+def landmark_confidence(landmarks: Optional[np.ndarray]) -> float:
+    """평가 키포인트의 평균 가시성 (검출 실패 시 0)"""
+    if landmarks is None:
+        return 0.0
+    return float(landmarks[_KEYPOINT_ROWS, VISIBILITY].mean())
+
+
+def _probe_rank(result: Dict[str, object]) -> Tuple[float, float, int]:
+    """탐색 결과 정렬 키 (디코딩+전처리 비용 → 신뢰도 → 해상도)"""
+    cost = (result["decode_ms"] + result["preprocess_ms"]) / PROBE_COST_RESOLUTION_MS
+    return round(cost), -result["confidence"], -result["width"] * result["height"]
+
+
+def probe_capture_modes(
+    cap: cv2.VideoCapture,
+    modes: Sequence[str],
+    infer: Callable[[np.ndarray], Optional[np.ndarray]],
+    min_confidence: float = 0.6,
+    fps: Optional[float] = None,
+    frames: int = 10,
+    warmup_frames: int = 3,
+) -> Tuple[Optional[Dict[str, object]], List[Dict[str, object]]]:
+    """
+    후보 캡처 모드를 차례로 적용해 비용과 랜드마크 신뢰도를 측정합니다.
+
+    프레임 대기(`grab`)와 디코딩(`retrieve`)을 나눠 재고, 신뢰도가 `min_confidence` 이상인
+    모드 중 프레임당 디코딩+전처리 시간이 가장 짧은 모드를 선택합니다. 프레임 대기 시간은
+    카메라 프레임 간격이라 비용에서 제외하며, 비용이 `PROBE_COST_RESOLUTION_MS` 단위로 같으면
+    신뢰도, 해상도가 높은 모드를 선택합니다. 그런 모드가 없으면 신뢰도가 가장 높은 모드를
+    선택합니다. 선택된 모드는 캡처 객체에 다시 적용된 상태로 반환됩니다.
+
+    Args:
+        cap: 열려 있는 OpenCV 캡처 객체
+        modes: "640x480" 또는 "640x480@MJPG" 형식의 후보 모드 목록
+        infer: RGB 프레임 → (33, 4) 랜드마크 배열 추론 함수
+        min_confidence: 요구하는 평가 키포인트 평균 가시성
+        fps: 모든 후보에 적용할 프레임 속도 (None 이면 드라이버 기본값)
+        frames: 모드당 측정 프레임 수
+        warmup_frames: 모드 전환 직후 버리는 프레임 수
+
+    Returns:
+        Tuple[Optional[Dict[str, object]], List[Dict[str, object]]]:
+        (선택된 모드 결과 또는 None, 모드별 측정 결과)
+    """
+    results: List[Dict[str, object]] = []
+    for mode in modes:
+        width, height, fourcc = parse_mode(mode)
+        actual = configure_capture(cap, width, height, fps, fourcc)
+        for _ in range(warmup_frames):
+            cap.read()
+
+        wait_ms = 0.0
+        decode_ms = 0.0
+        preprocess_ms = 0.0
+        confidences = []
+        captured = 0
+        for _ in range(frames):
+            started = time.perf_counter()
+            if not cap.grab():
+                continue
+            grabbed = time.perf_counter()
+            ret, frame = cap.retrieve()
+            decoded = time.perf_counter()
+            if not ret:
+                continue
+            rgb_frame = preprocess_frame(frame)
+            wait_ms += (grabbed - started) * 1000.0
+            decode_ms += (decoded - grabbed) * 1000.0
+            preprocess_ms += (time.perf_counter() - decoded) * 1000.0
+            confidences.append(landmark_confidence(infer(rgb_frame)))
+            captured += 1
+
+        if captured == 0:
+            logger.warning(f"캡처 모드 {mode}: 프레임을 읽을 수 없습니다")
+            continue
+
+        result = {
+            "mode": mode,
+            **actual,
+            "wait_ms": wait_ms / captured,
+            "decode_ms": decode_ms / captured,
+            "preprocess_ms": preprocess_ms / captured,
+            "confidence": float(np.mean(confidences)),
+        }
+        results.append(result)
+        logger.info(
+            f"캡처 모드 {mode}: 실제 {actual['width']}x{actual['height']} "
+            f"{actual['fourcc']} {actual['fps']:.0f}fps, 대기 {result['wait_ms']:.1f}ms, "
+            f"디코딩 {result['decode_ms']:.2f}ms, 전처리 {result['preprocess_ms']:.2f}ms, "
+            f"신뢰도 {result['confidence']:.2f}"
+        )
+
+    if not results:
+        return None, results
+
+    passing = [r for r in results if r["confidence"] >= min_confidence]
+    if passing:
+        chosen = min(passing, key=_probe_rank)
+    else:
+        chosen = max(results, key=lambda r: r["confidence"])
+        logger.warning(
+            f"최소 신뢰도 {min_confidence:.2f} 를 만족하는 캡처 모드가 없어 "
+            f"신뢰도가 가장 높은 {chosen['mode']} 를 사용합니다"
+        )
+
+    width, height, fourcc = parse_mode(str(chosen["mode"]))
+    configure_capture(cap, width, height, fps, fourcc)
+    return chosen, results
@@ -0,0 +1,96 @@
+"""
+압력 샘플 데드밴드 필터
+- 마지막으로 발행한 샘플보다 어느 채널이든 임계값을 넘게 바뀐 샘플만 통과
+- 값이 그대로여도 heartbeat 간격마다 한 샘플을 통과시켜 소비자가 끊김(오래된 값)을 구분할 수 있게 함
+"""
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class PressureDeadband:
+    """변화량 기반 압력 샘플 발행 필터"""
+
+    def __init__(self, threshold: float, heartbeat_interval: float = 1.0):
+        """
+        데드밴드 필터 초기화
+
+        Args:
+            threshold: 발행할 최소 변화량 (원시 값 단위, 채널별 절댓값)
+            heartbeat_interval: 변화가 없어도 발행할 간격 (초, 0 이하면 사용 안 함)
+        """
+        self.threshold = threshold
+        self.heartbeat_interval = heartbeat_interval
+
+        self._reference: Optional[np.ndarray] = None
+        self._reference_time = 0.0
+
+        self.samples_in = 0
+        self.samples_out = 0
+        self.heartbeats = 0
+
+    def reset(self) -> None:
+        """기준 샘플을 버립니다. (다음 샘플은 무조건 발행)"""
+        self._reference = None
+
+    def filter(self, timestamps: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        발행할 샘플을 고릅니다.
+
+        기준 샘플이 발행할 때마다 바뀌므로 샘플 사이 의존성이 있어, 남은 구간 전체를 한 번에 비교해
+        다음 발행 위치를 찾는 방식으로 발행 샘플 수만큼만 반복합니다.
+
+        Args:
+            timestamps: (N,) 샘플 시각 (초)
+            values: (N, C) 샘플 값
+
+        Returns:
+            np.ndarray: (N,) 발행 여부
+        """
+        count = len(timestamps)
+        mask = np.zeros(count, dtype=bool)
+        if count == 0:
+            return mask
+        values = np.asarray(values).reshape(count, -1)
+        self.samples_in += count
+
+        start = 0
+        if self._reference is None or self._reference.shape != values.shape[1:]:
+            mask[0] = True
+            self._reference = values[0].copy()
+            self._reference_time = float(timestamps[0])
+            start = 1
+
+        while start < count:
+            changed = (np.abs(values[start:] - self._reference) > self.threshold).any(axis=1)
+            if self.heartbeat_interval > 0:
+                stale = np.asarray(timestamps[start:]) - self._reference_time >= self.heartbeat_interval
+                due = changed | stale
+            else:
+                due = changed
+            offset = int(due.argmax())
+            if not due[offset]:
+                break
+            index = start + offset
+            self.heartbeats += not changed[offset]
+            mask[index] = True
+            self._reference = values[index].copy()
+            self._reference_time = float(timestamps[index])
+            start = index + 1
+
+        self.samples_out += int(mask.sum())
+        return mask
+
+    def stats(self) -> Dict[str, float]:
+        """
+        필터 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 입력/발행 샘플 수, heartbeat 수, 줄어든 비율 (0~1)
+        """
+        return {
+            "deadband_samples_in": float(self.samples_in),
+            "deadband_samples_out": float(self.samples_out),
+            "deadband_heartbeats": float(self.heartbeats),
+            "deadband_reduction": 1.0 - self.samples_out / self.samples_in if self.samples_in else 0.0,
+        }
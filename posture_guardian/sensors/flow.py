@@ -0,0 +1,136 @@
+"""
+광학 흐름 기반 랜드마크 추적
+- 포즈 추론 사이의 프레임에서 눈·코·어깨 랜드마크를 피라미드 Lucas-Kanade 로 이동
+- 추적 오차가 커지거나 추론 주기가 되면 전체 추론 요청
+"""
+import time
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+# 추적하는 랜드마크 (코, 눈 안쪽/바깥쪽, 어깨)
+FLOW_LANDMARK_INDICES = np.array([0, 1, 3, 4, 6, 11, 12])
+
+
+class LandmarkFlowTracker:
+    """희소 추론 사이를 광학 흐름으로 채우는 랜드마크 추적기"""
+
+    def __init__(
+        self,
+        inference_fps: float = 3.0,
+        max_error: float = 2.0,
+        win_size: int = 21,
+        max_level: int = 3,
+    ):
+        """
+        광학 흐름 추적기 초기화
+
+        Args:
+            inference_fps: 전체 포즈 추론 주기 (초당 횟수)
+            max_error: 허용하는 평균 전방-후방 추적 오차 (픽셀)
+            win_size: Lucas-Kanade 탐색 창 크기 (픽셀)
+            max_level: 이미지 피라미드 단계 수
+        """
+        self.inference_interval = 1.0 / inference_fps if inference_fps > 0 else 0.0
+        self.max_error = max_error
+        self.lk_params = dict(
+            winSize=(win_size, win_size),
+            maxLevel=max_level,
+            criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03),
+        )
+
+        self._prev_gray: Optional[np.ndarray] = None
+        self._points: Optional[np.ndarray] = None      # (N, 1, 2) 픽셀 좌표
+        self._landmarks: Optional[np.ndarray] = None   # 마지막 (33, 4) 결과
+        self._last_inference = 0.0
+
+        self.tracked = 0
+        self.rejected = 0
+        self.last_error = 0.0
+
+    def reset(
+        self,
+        rgb_frame: np.ndarray,
+        landmarks: Optional[np.ndarray],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        전체 추론 결과로 추적 기준을 갱신합니다.
+
+        Args:
+            rgb_frame: 추론한 RGB 프레임
+            landmarks: 추론된 (33, 4) 랜드마크 배열 또는 None (추적 중지)
+            now: 현재 시각 (초), 없으면 time.monotonic()
+        """
+        self._last_inference = time.monotonic() if now is None else now
+        if landmarks is None:
+            self._prev_gray = None
+            self._points = None
+            self._landmarks = None
+            return
+
+        height, width = rgb_frame.shape[:2]
+        self._prev_gray = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2GRAY)
+        points = landmarks[FLOW_LANDMARK_INDICES, :2] * np.array([width, height], dtype=np.float32)
+        self._points = points.reshape(-1, 1, 2).astype(np.float32)
+        self._landmarks = landmarks.copy()
+
+    def track(self, rgb_frame: np.ndarray, now: Optional[float] = None) -> Optional[np.ndarray]:
+        """
+        광학 흐름으로 랜드마크를 현재 프레임으로 이동합니다.
+
+        Args:
+            rgb_frame: 현재 RGB 프레임
+            now: 현재 시각 (초), 없으면 time.monotonic()
+
+        Returns:
+            Optional[np.ndarray]: 이동된 (33, 4) 랜드마크 배열,
+            추론 주기가 되었거나 추적에 실패하면 None (전체 추론 필요)
+        """
+        if self._points is None or self._prev_gray is None or self._landmarks is None:
+            return None
+        if now is None:
+            now = time.monotonic()
+        if now - self._last_inference >= self.inference_interval:
+            return None
+
+        gray = cv2.cvtColor(rgb_frame, cv2.COLOR_RGB2GRAY)
+        if gray.shape != self._prev_gray.shape:
+            return None
+
+        # 전방 추적 후 다시 되돌아오는 후방 추적으로 오차 측정
+        forward, status_f, _ = cv2.calcOpticalFlowPyrLK(
+            self._prev_gray, gray, self._points, None, **self.lk_params
+        )
+        backward, status_b, _ = cv2.calcOpticalFlowPyrLK(
+            gray, self._prev_gray, forward, None, **self.lk_params
+        )
+        error = np.linalg.norm((self._points - backward).reshape(-1, 2), axis=1)
+        self.last_error = float(error.mean())
+
+        if not (status_f.all() and status_b.all()) or self.last_error > self.max_error:
+            self.rejected += 1
+            return None
+
+        height, width = gray.shape
+        self._landmarks[FLOW_LANDMARK_INDICES, :2] = (
+            forward.reshape(-1, 2) / np.array([width, height], dtype=np.float32)
+        )
+        self._prev_gray = gray
+        self._points = forward
+        self.tracked += 1
+        return self._landmarks.copy()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        추적 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 추적 성공/실패 프레임 수, 마지막 추적 오차 (픽셀)
+        """
+        return {
+            "flow_tracked": float(self.tracked),
+            "flow_rejected": float(self.rejected),
+            "flow_last_error_px": self.last_error,
+        }
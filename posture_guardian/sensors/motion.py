@@ -0,0 +1,103 @@
+"""
+움직임 기반 추론 게이트
+- 축소한 흑백 프레임의 차이로 장면 변화를 판단
+- 변화가 없으면 이전 랜드마크를 재사용해 포즈 추론을 건너뜀
+"""
+import time
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """프레임 차분 기반 추론 게이트"""
+
+    def __init__(
+        self,
+        threshold: float = 2.0,
+        max_reuse_age: float = 1.0,
+        downscale_width: int = 64,
+    ):
+        """
+        움직임 게이트 초기화
+
+        Args:
+            threshold: 추론을 다시 수행할 평균 밝기 차이 (0~255)
+            max_reuse_age: 랜드마크 최대 재사용 시간 (초)
+            downscale_width: 차분 계산용 축소 프레임 너비 (픽셀)
+        """
+        self.threshold = threshold
+        self.max_reuse_age = max_reuse_age
+        self.downscale_width = downscale_width
+
+        self._reference: Optional[np.ndarray] = None
+        self._reference_time = 0.0
+        self._landmarks: Optional[np.ndarray] = None
+
+        self.last_motion = 0.0
+        self.skipped = 0
+        self.inferred = 0
+
+    def _thumbnail(self, rgb_frame: np.ndarray) -> np.ndarray:
+        """차분 계산용 축소 흑백 프레임"""
+        height, width = rgb_frame.shape[:2]
+        size = (self.downscale_width, max(1, height * self.downscale_width // width))
+        small = cv2.resize(rgb_frame, size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+
+    def check(self, rgb_frame: np.ndarray) -> bool:
+        """
+        추론이 필요한지 판단합니다.
+
+        Args:
+            rgb_frame: RGB 프레임
+
+        Returns:
+            bool: 추론이 필요하면 True, 이전 랜드마크를 재사용하면 False
+        """
+        thumbnail = self._thumbnail(rgb_frame)
+        now = time.monotonic()
+
+        if (
+            self._reference is not None
+            and self._reference.shape == thumbnail.shape
+            and now - self._reference_time < self.max_reuse_age
+        ):
+            self.last_motion = float(cv2.absdiff(thumbnail, self._reference).mean())
+            if self.last_motion < self.threshold:
+                self.skipped += 1
+                return False
+
+        # 추론할 프레임을 새 기준으로 삼음
+        self._reference = thumbnail
+        self._reference_time = now
+        self.inferred += 1
+        return True
+
+    def remember(self, landmarks: Optional[np.ndarray]) -> None:
+        """
+        기준 프레임의 추론 결과를 저장합니다.
+
+        Args:
+            landmarks: 추론된 랜드마크 배열 또는 None
+        """
+        self._landmarks = landmarks
+
+    @property
+    def landmarks(self) -> Optional[np.ndarray]:
+        """재사용할 마지막 랜드마크"""
+        return self._landmarks
+
+    def stats(self) -> Dict[str, float]:
+        """
+        게이트 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 건너뛴/추론한 프레임 수, 마지막 움직임 크기
+        """
+        return {
+            "motion_skipped": float(self.skipped),
+            "motion_inferred": float(self.inferred),
+            "motion_last": self.last_motion,
+        }
@@ -0,0 +1,147 @@
+"""
+MediaPipe Pose 인스턴스 풀
+- Streamlit 재실행/세션 간에 Pose 그래프와 모델을 재사용
+- 시작 시 미리 생성(warm-up), 종료 시 일괄 해제
+"""
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class PosePool:
+    """
+    장기 보관용 MediaPipe Pose 인스턴스 풀
+
+    LIFO 순서로 대여하므로 연속된 요청은 같은 인스턴스를 받아
+    MediaPipe 의 프레임 간 추적 상태가 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+    ):
+        """
+        Pose 풀 초기화 (인스턴스는 필요할 때 생성)
+
+        Args:
+            size: 최대 인스턴스 수
+            min_detection_confidence: MediaPipe 검출 신뢰도 임계값
+            min_tracking_confidence: MediaPipe 추적 신뢰도 임계값
+        """
+        self.size = max(1, size)
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._instances: List[Any] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.acquisitions = 0
+        self.total_wait_ms = 0.0
+
+    def _create(self) -> Any:
+        """새 Pose 인스턴스 생성 (추적 모드)"""
+        import mediapipe as mp
+
+        return mp.solutions.pose.Pose(
+            static_image_mode=False,
+            min_detection_confidence=self.min_detection_confidence,
+            min_tracking_confidence=self.min_tracking_confidence,
+        )
+
+    def warm_up(self, frame_shape=(480, 640, 3)) -> None:
+        """
+        모든 인스턴스를 미리 생성하고 빈 프레임으로 한 번씩 실행합니다.
+
+        Args:
+            frame_shape: 워밍업에 사용할 프레임 크기
+        """
+        started = time.perf_counter()
+        blank = np.zeros(frame_shape, dtype=np.uint8)
+        with self._lock:
+            while len(self._instances) < self.size:
+                pose = self._create()
+                pose.process(blank)
+                self._instances.append(pose)
+                self._idle.put(pose)
+        logger.info(
+            f"Pose 풀 워밍업 완료: {len(self._instances)}개, "
+            f"{(time.perf_counter() - started) * 1000.0:.0f}ms"
+        )
+
+    @contextmanager
+    def acquire(self, timeout: float = 5.0) -> Iterator[Any]:
+        """
+        Pose 인스턴스를 대여합니다.
+
+        Args:
+            timeout: 빈 인스턴스를 기다릴 최대 시간 (초)
+
+        Yields:
+            mediapipe Pose 인스턴스
+
+        Raises:
+            RuntimeError: 풀이 닫혔거나 대기 시간이 초과된 경우
+        """
+        if self._closed:
+            raise RuntimeError("Pose 풀이 이미 종료되었습니다")
+
+        started = time.perf_counter()
+        pose = None
+        try:
+            pose = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if len(self._instances) < self.size:
+                    pose = self._create()
+                    self._instances.append(pose)
+            if pose is None:
+                try:
+                    pose = self._idle.get(timeout=timeout)
+                except queue.Empty:
+                    raise RuntimeError("사용 가능한 Pose 인스턴스가 없습니다")
+
+        self.acquisitions += 1
+        self.total_wait_ms += (time.perf_counter() - started) * 1000.0
+        try:
+            yield pose
+        finally:
+            if self._closed:
+                pose.close()
+            else:
+                self._idle.put(pose)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        풀 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 인스턴스 수, 대여 횟수, 평균 대기 시간 (밀리초)
+        """
+        return {
+            "pool_instances": float(len(self._instances)),
+            "pool_acquisitions": float(self.acquisitions),
+            "pool_wait_mean_ms": self.total_wait_ms / (self.acquisitions or 1),
+        }
+
+    def close(self) -> None:
+        """대여 중이지 않은 모든 인스턴스를 해제합니다. (대여 중인 인스턴스는 반납 시 해제)"""
+        with self._lock:
+            self._closed = True
+            while True:
+                try:
+                    self._idle.get_nowait().close()
+                except queue.Empty:
+                    break
+            self._instances.clear()
+        logger.info("Pose 풀 종료됨")
@@ -0,0 +1,221 @@
+"""
+별도 프로세스에서 MediaPipe Pose 추론을 수행하는 워커
+- 프레임은 `multiprocessing.shared_memory` 슬롯으로 전달 (피클링 없음)
+- 결과는 (33, 4) float32 랜드마크 배열로 반환
+"""
+import logging
+import multiprocessing as mp
+import time
+from multiprocessing.connection import Connection
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from posture_guardian.utils.landmarks import LandmarkArray
+
+logger = logging.getLogger(__name__)
+
+
+def _pose_worker_main(
+    shm_name: str,
+    conn: Connection,
+    min_detection_confidence: float,
+    min_tracking_confidence: float,
+) -> None:
+    """
+    워커 프로세스 본체
+
+    요청 `(seq, height, width)` 를 받으면 공유 메모리의 프레임으로 추론하고
+    `(seq, landmarks 또는 None, 추론 시간(ms))` 를 응답합니다.
+    `None` 요청을 받으면 종료합니다.
+    """
+    import mediapipe as mediapipe_module
+
+    shm = SharedMemory(name=shm_name)
+    pose = mediapipe_module.solutions.pose.Pose(
+        min_detection_confidence=min_detection_confidence,
+        min_tracking_confidence=min_tracking_confidence,
+    )
+    try:
+        conn.send(("ready",))
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            seq, height, width = request
+            frame = np.ndarray((height, width, 3), dtype=np.uint8, buffer=shm.buf)
+
+            started = time.perf_counter()
+            results = pose.process(frame)
+            infer_ms = (time.perf_counter() - started) * 1000.0
+
+            landmarks = None
+            if results.pose_landmarks:
+                landmarks = LandmarkArray.from_mediapipe(results.pose_landmarks).data
+            del frame
+            conn.send((seq, landmarks, infer_ms))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        pose.close()
+        shm.close()
+
+
+class PoseWorkerProcess:
+    """
+    포즈 추론 워커 프로세스 관리자
+
+    단일 공유 메모리 슬롯을 사용하므로 한 번에 하나의 요청만 처리합니다.
+    `infer()` 는 블로킹 호출이므로 이벤트 루프에서는 `asyncio.to_thread` 로 호출합니다.
+    """
+
+    def __init__(
+        self,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+        timeout: float = 5.0,
+    ):
+        """
+        워커 관리자 초기화
+
+        Args:
+            min_detection_confidence: MediaPipe 검출 신뢰도 임계값
+            min_tracking_confidence: MediaPipe 추적 신뢰도 임계값
+            timeout: 추론 응답 대기 시간 (초)
+        """
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.timeout = timeout
+
+        self._ctx = mp.get_context("spawn")
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._conn: Optional[Connection] = None
+        self._shm: Optional[SharedMemory] = None
+        self._capacity = 0
+        self._seq = 0
+
+        self.inferences = 0
+        self.total_infer_ms = 0.0
+        self.total_roundtrip_ms = 0.0
+
+    def is_alive(self) -> bool:
+        """워커 프로세스 동작 여부"""
+        return self._process is not None and self._process.is_alive()
+
+    def start(self, frame_shape: Tuple[int, int, int]) -> None:
+        """
+        워커 프로세스를 시작합니다.
+
+        Args:
+            frame_shape: 처리할 프레임 크기 (높이, 너비, 채널)
+
+        Raises:
+            RuntimeError: 워커가 준비 응답을 보내지 않은 경우
+        """
+        self.stop()
+        self._capacity = int(np.prod(frame_shape))
+        self._shm = SharedMemory(create=True, size=self._capacity)
+
+        parent_conn, child_conn = self._ctx.Pipe()
+        self._conn = parent_conn
+        self._process = self._ctx.Process(
+            target=_pose_worker_main,
+            args=(
+                self._shm.name,
+                child_conn,
+                self.min_detection_confidence,
+                self.min_tracking_confidence,
+            ),
+            name="pose-worker",
+            daemon=True,
+        )
+        self._process.start()
+        child_conn.close()
+
+        # 모델 로딩이 끝날 때까지 대기
+        try:
+            if not parent_conn.poll(30.0):
+                raise RuntimeError("준비 응답 시간 초과")
+            parent_conn.recv()
+        except (EOFError, OSError, RuntimeError) as e:
+            self.stop()
+            raise RuntimeError(f"포즈 워커 프로세스가 준비되지 않았습니다: {e}") from e
+        logger.info(f"포즈 워커 프로세스 시작됨 (PID: {self._process.pid})")
+
+    def infer(self, rgb_frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        프레임을 공유 메모리에 복사하고 워커의 추론 결과를 기다립니다.
+
+        Args:
+            rgb_frame: (높이, 너비, 3) uint8 RGB 프레임
+
+        Returns:
+            Optional[np.ndarray]: (33, 4) 랜드마크 배열, 사람이 없으면 None
+
+        Raises:
+            RuntimeError: 워커가 종료되었거나 응답 시간이 초과된 경우
+        """
+        if rgb_frame.nbytes > self._capacity or not self.is_alive():
+            self.start(rgb_frame.shape)
+
+        assert self._shm is not None and self._conn is not None
+        height, width = rgb_frame.shape[:2]
+        started = time.perf_counter()
+
+        slot = np.ndarray(rgb_frame.shape, dtype=np.uint8, buffer=self._shm.buf)
+        np.copyto(slot, rgb_frame)
+        del slot
+
+        self._seq += 1
+        try:
+            self._conn.send((self._seq, height, width))
+            if not self._conn.poll(self.timeout):
+                raise RuntimeError("포즈 워커 응답 시간 초과")
+            seq, landmarks, infer_ms = self._conn.recv()
+        except (EOFError, OSError) as e:
+            raise RuntimeError(f"포즈 워커 통신 오류: {e}") from e
+
+        if seq != self._seq:
+            raise RuntimeError(f"포즈 워커 응답 순번 불일치: {seq} != {self._seq}")
+
+        self.inferences += 1
+        self.total_infer_ms += infer_ms
+        self.total_roundtrip_ms += (time.perf_counter() - started) * 1000.0
+        return landmarks
+
+    def stats(self) -> Dict[str, float]:
+        """
+        추론 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 추론 횟수, 평균 추론/왕복 시간 (밀리초)
+        """
+        count = self.inferences or 1
+        return {
+            "worker_inferences": float(self.inferences),
+            "worker_infer_mean_ms": self.total_infer_ms / count,
+            "worker_roundtrip_mean_ms": self.total_roundtrip_ms / count,
+        }
+
+    def stop(self) -> None:
+        """워커 프로세스를 종료하고 공유 메모리를 해제합니다."""
+        if self._conn is not None:
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        if self._process is not None:
+            self._process.join(timeout=2.0)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join(timeout=1.0)
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        self._capacity = 0
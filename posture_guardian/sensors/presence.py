@@ -0,0 +1,136 @@
+"""
+사용자 재석 감지
+- 방석 압력과 랜드마크 검출 여부만으로 자리 비움/복귀 판단
+- 카메라마다 연속 검출/미검출 프레임 수를 따로 세고, 어느 카메라든 방석이든 사용자를 보면 재석
+- 자리 비움 동안 웹캠은 저속 동작, 평가와 UI 상태 기록은 중지 (SYSTEM presence 이벤트)
+"""
+from typing import Dict, List, Optional
+
+PRESENT = "present"
+AWAY = "away"
+
+
+class PresenceDetector:
+    """
+    재석 상태 머신
+
+    재석 → 자리 비움: 방석 압력이 하한 미만이고 모든 카메라에서 `absent_frames` 프레임 연속 랜드마크 없음
+    자리 비움 → 재석: 방석 압력이 하한 이상이거나 어느 카메라에서든 `return_frames` 프레임 연속 랜드마크 검출
+    압력 데이터를 아직 받지 못했으면 랜드마크만으로 판단합니다.
+    카메라별로 따로 세므로 사용자를 보지 못하는 카메라가 다른 카메라의 검출 횟수를 지우지 않습니다.
+    """
+
+    def __init__(self, cushion_floor: int = 100, absent_frames: int = 30, return_frames: int = 2):
+        """
+        재석 감지기 초기화
+
+        Args:
+            cushion_floor: 앉아 있다고 보는 방석 압력 하한
+            absent_frames: 자리 비움으로 판단할 연속 미검출 프레임 수
+            return_frames: 복귀로 판단할 연속 검출 프레임 수
+        """
+        self.cushion_floor = cushion_floor
+        self.absent_frames = absent_frames
+        self.return_frames = return_frames
+
+        self.state = PRESENT
+        self.cushion_value: Optional[int] = None
+        # 카메라 ID → 연속 랜드마크 미검출/검출 프레임 수
+        self._missing: Dict[str, int] = {}
+        self._seen: Dict[str, int] = {}
+
+        self.transitions = 0
+
+    @property
+    def present(self) -> bool:
+        """재석 여부"""
+        return self.state == PRESENT
+
+    @property
+    def missing(self) -> int:
+        """모든 카메라가 연속으로 랜드마크를 놓친 프레임 수 (카메라별 최솟값)"""
+        return min(self._missing.values(), default=0)
+
+    @property
+    def seen(self) -> int:
+        """어느 카메라든 연속으로 랜드마크를 검출한 프레임 수 (카메라별 최댓값)"""
+        return max(self._seen.values(), default=0)
+
+    @property
+    def cameras(self) -> List[str]:
+        """프레임을 보고한 카메라 ID 목록"""
+        return list(self._missing)
+
+    def _seated(self) -> bool:
+        """방석 압력이 하한 이상인지 여부"""
+        return self.cushion_value is not None and self.cushion_value >= self.cushion_floor
+
+    def _transition(self) -> Optional[str]:
+        """현재 신호로 상태를 전이하고, 바뀌었으면 새 상태를 반환"""
+        if self.state == PRESENT:
+            if not self._seated() and self.missing >= self.absent_frames:
+                self.state = AWAY
+                self.transitions += 1
+                return AWAY
+        elif self._seated() or self.seen >= self.return_frames:
+            self.state = PRESENT
+            self.transitions += 1
+            return PRESENT
+        return None
+
+    def update_pressure(self, cushion_value: int) -> Optional[str]:
+        """
+        방석 압력을 반영합니다.
+
+        Args:
+            cushion_value: 방석 압력 값
+
+        Returns:
+            Optional[str]: 상태가 바뀌었으면 새 상태 ("present" 또는 "away"), 아니면 None
+        """
+        self.cushion_value = cushion_value
+        return self._transition()
+
+    def update_frame(self, detected: bool, camera_id: str = "0") -> Optional[str]:
+        """
+        추론한 프레임의 랜드마크 검출 여부를 반영합니다.
+
+        Args:
+            detected: 랜드마크 검출 여부
+            camera_id: 프레임을 추론한 카메라 ID
+
+        Returns:
+            Optional[str]: 상태가 바뀌었으면 새 상태 ("present" 또는 "away"), 아니면 None
+        """
+        if detected:
+            self._seen[camera_id] = self._seen.get(camera_id, 0) + 1
+            self._missing[camera_id] = 0
+        else:
+            self._missing[camera_id] = self._missing.get(camera_id, 0) + 1
+            self._seen[camera_id] = 0
+        return self._transition()
+
+    def remove_camera(self, camera_id: str) -> None:
+        """
+        멈춘 카메라의 검출 기록을 버립니다. (마지막 검출 기록이 자리 비움 판단을 막지 않도록)
+
+        상태는 다음 프레임/압력 갱신 때 남은 카메라 기준으로 다시 판단합니다.
+
+        Args:
+            camera_id: 카메라 ID
+        """
+        self._missing.pop(camera_id, None)
+        self._seen.pop(camera_id, None)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        재석 감지 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 재석 여부, 연속 미검출 프레임 수, 상태 전이 횟수
+        """
+        return {
+            "presence_present": float(self.present),
+            "presence_missing_frames": float(self.missing),
+            "presence_transitions": float(self.transitions),
+        }
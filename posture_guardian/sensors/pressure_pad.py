@@ -5,30 +5,43 @@
 """
 import asyncio
 import logging
-import random
 import time
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import numpy as np
-import serial
-import serial.tools.list_ports
 
 from posture_guardian.core.bus import get_event_bus
 from posture_guardian.core.config import AppConfig
-from posture_guardian.utils.events import Event, EventType, PressureData
+from posture_guardian.sensors.deadband import PressureDeadband
+from posture_guardian.sensors.scenario import PressureScenario, load_scenario
+from posture_guardian.sensors.serial_reader import SerialLineReader
+from posture_guardian.sensors.serial_reconnect import SerialReconnector
+from posture_guardian.utils.events import Event, EventType, PressureBlock
+from posture_guardian.utils.pressure_mat import MatLayout
 
 logger = logging.getLogger(__name__)
 
 
 class PressurePadSimulator:
-    """압력 센서 시뮬레이터"""
+    """
+    압력 센서 시뮬레이터
+    
+    샘플 묶음을 한 번의 벡터화된 난수 호출로 생성하며, 시나리오가 있으면
+    시뮬레이션 시각에 따라 평균값과 잡음이 바뀝니다.
+    매트 배치가 주어지면 방석 대신 셀마다 값을 만들고, 시나리오의 압력 중심 이동에 따라
+    셀 평균값에 기울기를 줍니다.
+    """
     
     def __init__(
         self, 
         foot_mean: int = 500, 
         foot_std: int = 30,
         cushion_mean: int = 500, 
-        cushion_std: int = 30
+        cushion_std: int = 30,
+        rate_hz: float = 10.0,
+        scenario: Optional[PressureScenario] = None,
+        seed: Optional[int] = None,
+        layout: Optional[MatLayout] = None
     ):
         """
         압력 센서 시뮬레이터 초기화
@@ -38,28 +51,69 @@ class PressurePadSimulator:
             foot_std: 발받침대 표준편차
             cushion_mean: 방석 평균값
             cushion_std: 방석 표준편차
+            rate_hz: 초당 샘플 수 (시뮬레이션 시각 간격)
+            scenario: 평균값/잡음 시나리오 (없으면 고정 평균값)
+            seed: 난수 시드 (없으면 매번 다른 값)
+            layout: 다채널 매트 셀 배치 (없으면 단일 방석 센서)
         """
         self.foot_mean = foot_mean
         self.foot_std = foot_std
         self.cushion_mean = cushion_mean
         self.cushion_std = cushion_std
+        self.rate_hz = rate_hz
+        self.scenario = scenario
+        self.rng = np.random.default_rng(seed)
+        self.layout = layout
+        self.elapsed = 0.0  # 시뮬레이션 경과 시간 (초)
     
-    def read(self) -> Tuple[int, int]:
+    def read_block(self, count: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        시뮬레이션된 압력 센서 값을 읽습니다.
+        샘플 묶음을 생성합니다.
         
+        Args:
+            count: 샘플 수
+            
         Returns:
-            Tuple[int, int]: (발받침대 값, 방석 값)
+            Tuple[np.ndarray, np.ndarray]: (시뮬레이션 시각 (N,) 초,
+            (N, 2) [발받침대, 방석] 또는 (N, 1 + 셀 수) [발받침대, 셀...] 값 1~1024)
         """
-        # 정규분포로 값 생성
-        foot_value = int(np.random.normal(self.foot_mean, self.foot_std))
-        cushion_value = int(np.random.normal(self.cushion_mean, self.cushion_std))
+        t = self.elapsed + np.arange(count) / self.rate_hz
+        self.elapsed += count / self.rate_hz
+        
+        cells = 1 if self.layout is None else self.layout.channels
+        std = np.array([self.foot_std] + [self.cushion_std] * cells, dtype=np.float64)
+        if self.scenario is None:
+            means = np.tile([self.foot_mean, self.cushion_mean], (count, 1)).astype(np.float64)
+            cop = np.zeros((count, 2))
+            variance = np.broadcast_to(std ** 2, (count, cells + 1))
+        else:
+            means = self.scenario.means(t)
+            cop = self.scenario.cop(t)
+            scale, burst_rate, burst_std = self.scenario.noise(t)
+            variance = (std * scale[:, None]) ** 2
+            if burst_rate.any():
+                # 잡음 폭주: 해당 샘플만 표준편차 증가
+                burst = self.rng.random(count) < burst_rate / self.rate_hz
+                variance += (burst * burst_std)[:, None] ** 2
+        
+        if self.layout is not None:
+            # 압력 중심 이동 방향의 셀일수록 평균값이 커지도록 기울기 적용 (N, 셀 수)
+            weights = np.maximum(1.0 + cop @ self.layout.positions.T, 0.05)
+            means = np.concatenate([means[:, :1], means[:, 1:2] * weights], axis=1)
+        values = means + self.rng.standard_normal((count, cells + 1)) * np.sqrt(variance)
         
         # 1~1024 범위 제한
-        foot_value = max(1, min(1024, foot_value))
-        cushion_value = max(1, min(1024, cushion_value))
+        return t, np.clip(np.rint(values), 1, 1024).astype(np.int32)
+    
+    def read(self) -> Tuple[int, int]:
+        """
+        시뮬레이션된 압력 센서 값을 읽습니다.
         
-        return foot_value, cushion_value
+        Returns:
+            Tuple[int, int]: (발받침대 값, 방석 값)
+        """
+        _, values = self.read_block(1)
+        return int(values[0, 0]), int(values[0, 1])
 
 
 def get_arduino_port() -> Optional[str]:
@@ -69,98 +123,229 @@ def get_arduino_port() -> Optional[str]:
     Returns:
         Optional[str]: 아두이노 포트, 찾지 못한 경우 None
     """
-    ports = list(serial.tools.list_ports.comports())
-    for port in ports:
-        if "Arduino" in port.description or "CH340" in port.description:
-            return port.device
-    return None
+    candidates = SerialReconnector().candidates()
+    return candidates[0] if candidates else None
 
 
 async def pressure_pad_sensor(config: AppConfig) -> None:
     """
     압력 센서 데이터 수집 작업을 실행합니다.
     
+    아두이노 모드에서는 `SerialLineReader` 스레드가 시리얼 포트를 읽고,
+    이벤트 루프는 깨어날 때마다 쌓인 샘플을 수신 시각과 함께 PressureBlock 하나로 발행합니다.
+    (`pressure_batching` 이 꺼져 있으면 샘플마다 PressureData 발행)
+    포트를 찾지 못하거나 읽기 오류가 나면 `SerialReconnector` 가 백오프로 재연결하고,
+    연결 상태는 SYSTEM pressure_health 이벤트로 알립니다. 재연결을 기다리는 동안은
+    `arduino_fallback_simulation` 이 켜져 있으면 source="simulation" 으로 시뮬레이션 값을 발행합니다.
+    `pressure_deadband` 가 설정되어 있으면 값이 충분히 바뀐 샘플과 heartbeat 샘플만 발행하고,
+    발행 감소율은 `pressure_stats_interval` 마다 SYSTEM stats 이벤트로 보고합니다.
+    자리 비움(SYSTEM presence) 동안은 `presence_idle_interval` 간격으로만 발행합니다.
+    
     Args:
         config: 애플리케이션 설정
     """
     logger.info("압력 센서 시작")
     bus = get_event_bus()
+    sensors = config.sensors
     
-    # 아두이노 연결 시도 (또는 시뮬레이터 초기화)
-    arduino_mode = config.sensors.arduino_connection
-    arduino_port = None
+    arduino_mode = sensors.arduino_connection
     ser = None
-    simulator = None
+    reader: Optional[SerialLineReader] = None
+    simulator: Optional[PressurePadSimulator] = None
+    reconnector: Optional[SerialReconnector] = None
+    connect_task: Optional[asyncio.Task] = None
+    deadband: Optional[PressureDeadband] = None
+    if sensors.pressure_deadband > 0:
+        deadband = PressureDeadband(sensors.pressure_deadband, sensors.pressure_heartbeat_interval)
+    last_source: Optional[str] = None
+    
+    # 발행 통계 (데드밴드 없이 발행했을 이벤트 수 대비)
+    events_offered = 0
+    events_published = 0
+    last_report = time.monotonic()
+    
+    # 자리 비움 동안 발행 빈도 낮춤
+    away = False
+    last_publish = 0.0
+    
+    def on_system(event: Event) -> None:
+        nonlocal away
+        data = event.data
+        if isinstance(data, dict) and data.get("kind") == "presence":
+            away = data.get("status") == "away"
+    
+    system_unsub = bus.subscribe(EventType.SYSTEM, on_system)
+    
+    # 시뮬레이터 시작 시각 (시뮬레이션 시각 → 벽시계 시각 변환용)
+    simulation_started = 0.0
+    
+    def create_simulator() -> PressurePadSimulator:
+        nonlocal simulation_started
+        scenario = None
+        if sensors.simulation_scenario:
+            scenario = load_scenario(
+                sensors.simulation_scenario, sensors.simulation_foot_mean, sensors.simulation_cushion_mean
+            )
+            logger.info(f"압력 시뮬레이션 시나리오: {sensors.simulation_scenario} ({scenario.duration:.0f}초)")
+        simulation_started = time.time()
+        return PressurePadSimulator(
+            foot_mean=sensors.simulation_foot_mean,
+            foot_std=sensors.simulation_foot_std,
+            cushion_mean=sensors.simulation_cushion_mean,
+            cushion_std=sensors.simulation_cushion_std,
+            rate_hz=sensors.simulation_rate_hz,
+            scenario=scenario,
+            seed=sensors.simulation_seed,
+            layout=sensors.mat_layout()
+        )
+    
+    async def publish(timestamps: np.ndarray, values: np.ndarray, source: str) -> None:
+        nonlocal events_published
+        if len(values) == 0:
+            return
+        # 발받침대는 0번 열, 방석은 1번 열 또는 매트 셀 평균 (셀 값은 cells)
+        block = PressureBlock.from_arrays(timestamps, values, source=source)
+        if sensors.pressure_batching:
+            events_published += 1
+            await bus.publish(Event(
+                type=EventType.PRESSURE,
+                data=block
+            ))
+            return
+        events_published += len(values)
+        for pressure_data in block.samples():
+            await bus.publish(Event(
+                type=EventType.PRESSURE,
+                data=pressure_data
+            ))
+    
+    async def publish_health(status: str, details: Dict) -> None:
+        await bus.publish(Event(
+            type=EventType.SYSTEM,
+            data={"source": "pressure_pad", "kind": "pressure_health", "status": status, **details}
+        ))
+    
+    def stats_interval_due() -> bool:
+        nonlocal last_report
+        now = time.monotonic()
+        if sensors.pressure_stats_interval <= 0 or now - last_report < sensors.pressure_stats_interval:
+            return False
+        last_report = now
+        return True
+    
+    def start_connect() -> asyncio.Task:
+        return asyncio.create_task(reconnector.connect(publish_health))
+    
+    async def report_stats() -> None:
+        stats = {
+            "pressure_events_offered": float(events_offered),
+            "pressure_events_published": float(events_published),
+            "pressure_event_reduction": 1.0 - events_published / events_offered if events_offered else 0.0,
+        }
+        if deadband is not None:
+            stats.update(deadband.stats())
+        if reader is not None:
+            stats.update(reader.stats())
+        if reconnector is not None:
+            stats.update(reconnector.stats())
+        logger.info("압력 센서 통계: " + ", ".join(f"{k}={v:.2f}" for k, v in stats.items()))
+        await bus.publish(Event(
+            type=EventType.SYSTEM,
+            data={"source": "pressure_pad", "kind": "stats", **stats}
+        ))
     
     try:
         if arduino_mode:
-            # 아두이노 연결 시도
-            arduino_port = get_arduino_port()
-            if arduino_port:
-                ser = serial.Serial(arduino_port, 9600, timeout=1)
-                logger.info(f"아두이노 연결됨: {arduino_port}")
-            else:
-                logger.warning("아두이노 포트를 찾을 수 없음, 시뮬레이션 모드로 전환")
-                arduino_mode = False
-        
-        if not arduino_mode:
-            # 시뮬레이터 초기화
-            simulator = PressurePadSimulator(
-                foot_mean=config.sensors.simulation_foot_mean,
-                foot_std=config.sensors.simulation_foot_std,
-                cushion_mean=config.sensors.simulation_cushion_mean,
-                cushion_std=config.sensors.simulation_cushion_std
+            # 아두이노 연결은 백그라운드에서 재시도 (기다리는 동안 필요하면 시뮬레이션)
+            reconnector = SerialReconnector(
+                baud_rate=sensors.arduino_baud_rate,
+                port=sensors.arduino_port,
+                initial_backoff=sensors.arduino_reconnect_initial_backoff,
+                max_backoff=sensors.arduino_reconnect_max_backoff,
             )
+            connect_task = start_connect()
+        else:
+            # 시뮬레이터 초기화
+            simulator = create_simulator()
             logger.info("압력 센서 시뮬레이션 모드 활성화됨")
         
         # 데이터 수집 루프
         while True:
-            # 압력 센서 값 읽기
-            foot_value = None
-            cushion_value = None
+            if connect_task is not None and connect_task.done():
+                ser, port = connect_task.result()
+                connect_task = None
+                reader = SerialLineReader(
+                    ser, protocol=sensors.arduino_protocol, channels=sensors.pressure_channels()
+                )
+                reader.start()
+                if deadband is not None:
+                    # 재연결 후 첫 샘플은 값이 같아도 바로 발행 (heartbeat 를 기다리지 않음)
+                    deadband.reset()
+                if simulator is not None:
+                    logger.info("아두이노 재연결됨, 시뮬레이션 중지")
+                    simulator = None
+                logger.info(f"아두이노 연결됨: {port} ({sensors.arduino_protocol}, {sensors.arduino_baud_rate}bps)")
             
-            if arduino_mode and ser:
+            if reader is not None:
+                # 도착한 모든 샘플 (수신 시각 포함)
                 try:
-                    if ser.in_waiting:
-                        line = ser.readline().decode("utf-8").strip()
-                        values = line.split(",")
-                        if len(values) == 2:
-                            foot_value = int(values[0])
-                            cushion_value = int(values[1])
+                    timestamps, values = await reader.read_samples(timeout=1.0)
                 except Exception as e:
-                    logger.error(f"아두이노 읽기 오류: {e}")
-                    arduino_mode = False
-                    simulator = PressurePadSimulator(
-                        foot_mean=config.sensors.simulation_foot_mean,
-                        foot_std=config.sensors.simulation_foot_std,
-                        cushion_mean=config.sensors.simulation_cushion_mean,
-                        cushion_std=config.sensors.simulation_cushion_std
-                    )
-                    logger.info("오류로 인해 시뮬레이션 모드로 전환")
-            
-            if foot_value is None or cushion_value is None:
-                if simulator:
-                    foot_value, cushion_value = simulator.read()
-                else:
+                    logger.error(f"아두이노 읽기 오류: {e}, 재연결 시도")
+                    stats = reader.stats()
+                    reader.stop()
+                    reader = None
+                    ser.close()
+                    ser = None
+                    await publish_health("lost", {"error": str(e), **stats})
+                    connect_task = start_connect()
+                    continue
+                if len(values) == 0:
+                    continue
+                source = "arduino"
+            else:
+                if simulator is None:
+                    if not arduino_mode or sensors.arduino_fallback_simulation:
+                        simulator = create_simulator()
+                        logger.info("아두이노 연결 대기 중 시뮬레이션 값 발행 (source=simulation)")
+                    else:
+                        # 가짜 값을 발행하지 않고 재연결만 기다림
+                        await asyncio.sleep(0.1)
+                        continue
+                # 지난 읽기 이후 설정한 속도만큼 쌓였어야 할 샘플을 한 번에 생성
+                due = int((time.time() - simulation_started - simulator.elapsed) * simulator.rate_hz)
+                if due <= 0:
                     await asyncio.sleep(0.1)
                     continue
+                t, values = simulator.read_block(due)
+                timestamps = simulation_started + t
+                source = "simulation"
             
-            # 이벤트 생성 및 발행
-            pressure_data = PressureData(
-                foot_value=foot_value,
-                cushion_value=cushion_value,
-                source="arduino" if arduino_mode else "simulation"
-            )
+            # 데드밴드 없이 발행했을 이벤트 수
+            events_offered += 1 if sensors.pressure_batching else len(values)
+            if deadband is not None:
+                if source != last_source:
+                    # 데이터 출처가 바뀌면 첫 샘플은 바로 발행
+                    deadband.reset()
+                mask = deadband.filter(timestamps, values)
+                timestamps, values = timestamps[mask], values[mask]
+            last_source = source
             
-            event = Event(
-                type=EventType.PRESSURE,
-                data=pressure_data
-            )
+            if stats_interval_due():
+                await report_stats()
             
-            await bus.publish(event)
+            if away:
+                # 자리 비움 동안은 간격마다 가장 최근 샘플만 발행
+                if len(values) and time.monotonic() - last_publish >= sensors.presence_idle_interval:
+                    last_publish = time.monotonic()
+                    await publish(timestamps[-1:], values[-1:], source)
+            else:
+                last_publish = time.monotonic()
+                await publish(timestamps, values, source)
             
-            # 다음 읽기까지 대기
-            await asyncio.sleep(0.1)  # 약 10Hz 샘플링
+            if reader is None:
+                # 다음 묶음까지 대기
+                await asyncio.sleep(0.1)
     
     except asyncio.CancelledError:
         logger.info("압력 센서 태스크 취소됨")
@@ -168,6 +353,11 @@ async def pressure_pad_sensor(config: AppConfig) -> None:
         logger.exception(f"압력 센서 오류: {e}")
     finally:
         # 자원 해제
+        system_unsub()
+        if connect_task is not None:
+            connect_task.cancel()
+        if reader is not None:
+            reader.stop()
         if ser:
             ser.close()
-        logger.info("압력 센서 종료") 
\ No newline at end of file
+        logger.info("압력 센서 종료")
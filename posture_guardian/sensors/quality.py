@@ -0,0 +1,107 @@
+"""
+프레임 품질 필터
+- 축소한 흑백 프레임의 라플라시안 분산(선명도)과 밝기 히스토그램으로 품질 판단
+- 흐리거나 너무 어둡거나 밝은 프레임은 포즈 추론 전에 제외
+"""
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+# 거부 사유
+REJECT_BLUR = "blur"
+REJECT_DARK = "dark"
+REJECT_BRIGHT = "bright"
+
+# 포화 픽셀 판단 기준 (0~255)
+_DARK_LEVEL = 16
+_BRIGHT_LEVEL = 240
+
+
+class FrameQualityFilter:
+    """선명도/노출 기반 프레임 품질 필터"""
+
+    def __init__(
+        self,
+        min_sharpness: float = 15.0,
+        min_brightness: float = 40.0,
+        max_brightness: float = 220.0,
+        max_clipped_ratio: float = 0.6,
+        downscale_width: int = 160,
+    ):
+        """
+        품질 필터 초기화
+
+        Args:
+            min_sharpness: 최소 라플라시안 분산 (축소 프레임 기준)
+            min_brightness: 최소 평균 밝기 (0~255)
+            max_brightness: 최대 평균 밝기 (0~255)
+            max_clipped_ratio: 너무 어둡거나 밝은 픽셀의 최대 비율 (0~1)
+            downscale_width: 품질 계산용 축소 프레임 너비 (픽셀)
+        """
+        self.min_sharpness = min_sharpness
+        self.min_brightness = min_brightness
+        self.max_brightness = max_brightness
+        self.max_clipped_ratio = max_clipped_ratio
+        self.downscale_width = downscale_width
+
+        self.accepted = 0
+        self.rejected: Dict[str, int] = {REJECT_BLUR: 0, REJECT_DARK: 0, REJECT_BRIGHT: 0}
+        self.last_sharpness = 0.0
+        self.last_brightness = 0.0
+
+    def _thumbnail(self, rgb_frame: np.ndarray) -> np.ndarray:
+        """품질 계산용 축소 흑백 프레임"""
+        height, width = rgb_frame.shape[:2]
+        size = (self.downscale_width, max(1, height * self.downscale_width // width))
+        small = cv2.resize(rgb_frame, size, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_RGB2GRAY)
+
+    def check(self, rgb_frame: np.ndarray) -> Optional[str]:
+        """
+        프레임 품질을 판단합니다.
+
+        Args:
+            rgb_frame: RGB 프레임
+
+        Returns:
+            Optional[str]: 거부 사유 ("blur", "dark", "bright"), 통과하면 None
+        """
+        gray = self._thumbnail(rgb_frame)
+
+        # 밝기 히스토그램으로 평균 밝기와 포화 픽셀 비율 계산
+        hist = np.bincount(gray.ravel(), minlength=256)
+        total = gray.size
+        self.last_brightness = float(hist @ np.arange(256)) / total
+        dark_ratio = hist[:_DARK_LEVEL].sum() / total
+        bright_ratio = hist[_BRIGHT_LEVEL:].sum() / total
+
+        reason = None
+        if self.last_brightness < self.min_brightness or dark_ratio > self.max_clipped_ratio:
+            reason = REJECT_DARK
+        elif self.last_brightness > self.max_brightness or bright_ratio > self.max_clipped_ratio:
+            reason = REJECT_BRIGHT
+        else:
+            self.last_sharpness = float(cv2.Laplacian(gray, cv2.CV_32F).var())
+            if self.last_sharpness < self.min_sharpness:
+                reason = REJECT_BLUR
+
+        if reason is None:
+            self.accepted += 1
+        else:
+            self.rejected[reason] += 1
+        return reason
+
+    def stats(self) -> Dict[str, float]:
+        """
+        필터 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 통과/사유별 거부 프레임 수, 마지막 선명도와 밝기
+        """
+        return {
+            "quality_accepted": float(self.accepted),
+            **{f"quality_rejected_{reason}": float(count) for reason, count in self.rejected.items()},
+            "quality_last_sharpness": self.last_sharpness,
+            "quality_last_brightness": self.last_brightness,
+        }
@@ -0,0 +1,158 @@
+"""
+웹캠 재연결 관리
+- 장치가 빠지면 지수 백오프로 재시도하며 장치 목록을 다시 탐색
+- 장치 열기 한 번에 걸리는 시간을 제한해 드라이버가 멈춰도 루프가 묶이지 않음
+- 연결 상태 변화를 콜백으로 알림 (SYSTEM camera_health 이벤트 발행용)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import cv2
+
+logger = logging.getLogger(__name__)
+
+# 상태 알림 콜백: (상태, 추가 정보)
+StatusCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def _open_device(device_id: int) -> Optional[cv2.VideoCapture]:
+    """장치를 열고 프레임 하나를 읽어 확인 (실패 시 해제 후 None)"""
+    cap = cv2.VideoCapture(device_id)
+    if cap.isOpened():
+        ret, _ = cap.read()
+        if ret:
+            return cap
+    cap.release()
+    return None
+
+
+def _release_late(task: "asyncio.Future[Optional[cv2.VideoCapture]]") -> None:
+    """결과를 받지 못한 열기 작업 (시간 초과 또는 취소) 이 뒤늦게 연 장치 해제"""
+    if not task.cancelled() and task.exception() is None:
+        cap = task.result()
+        if cap is not None:
+            cap.release()
+
+
+class CameraReconnector:
+    """지수 백오프 기반 웹캠 재연결 관리자"""
+
+    def __init__(
+        self,
+        device_id: int = 0,
+        scan_devices: int = 4,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        open_timeout: float = 5.0,
+    ):
+        """
+        재연결 관리자 초기화
+
+        Args:
+            device_id: 설정된 웹캠 장치 ID (항상 먼저 시도)
+            scan_devices: 재탐색할 장치 ID 범위 (0 ~ scan_devices-1, 0 이면 설정 장치만)
+            initial_backoff: 첫 재시도 대기 시간 (초)
+            max_backoff: 최대 재시도 대기 시간 (초)
+            open_timeout: 장치 하나를 여는 데 기다리는 최대 시간 (초)
+        """
+        self.device_id = device_id
+        self.scan_devices = scan_devices
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.open_timeout = open_timeout
+        self.last_good_device: Optional[int] = None
+
+        self.connects = 0
+        self.open_attempts = 0
+        self.open_timeouts = 0
+        self.total_downtime = 0.0
+        self.last_open_ms = 0.0
+
+    def candidates(self) -> List[int]:
+        """시도할 장치 ID 목록 (마지막 정상 장치, 설정 장치, 탐색 범위 순)"""
+        order = [self.device_id]
+        if self.last_good_device is not None:
+            order.insert(0, self.last_good_device)
+        order.extend(range(self.scan_devices))
+        return list(dict.fromkeys(order))
+
+    async def _try_open(self, device_id: int) -> Optional[cv2.VideoCapture]:
+        """제한 시간 안에 장치 열기를 시도합니다."""
+        self.open_attempts += 1
+        started = time.perf_counter()
+        task = asyncio.ensure_future(asyncio.to_thread(_open_device, device_id))
+        taken = False
+        try:
+            cap = await asyncio.wait_for(asyncio.shield(task), self.open_timeout)
+            taken = True
+            return cap
+        except asyncio.TimeoutError:
+            self.open_timeouts += 1
+            logger.warning(f"웹캠 장치 {device_id} 열기 시간 초과 ({self.open_timeout:.1f}초)")
+            return None
+        finally:
+            # 스레드는 중단할 수 없으므로 시간 초과나 취소 후 늦게 열리면 바로 해제
+            if not taken:
+                task.add_done_callback(_release_late)
+            self.last_open_ms = (time.perf_counter() - started) * 1000.0
+
+    async def connect(self, on_status: StatusCallback) -> Tuple[cv2.VideoCapture, int]:
+        """
+        장치가 열릴 때까지 재시도합니다.
+
+        Args:
+            on_status: 상태 알림 콜백 ("reconnecting", "connected")
+
+        Returns:
+            Tuple[cv2.VideoCapture, int]: 열린 캡처 객체와 장치 ID
+        """
+        backoff = self.initial_backoff
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            for device_id in self.candidates():
+                cap = await self._try_open(device_id)
+                if cap is None:
+                    continue
+
+                downtime = time.monotonic() - started
+                if self.connects > 0:
+                    self.total_downtime += downtime
+                self.connects += 1
+                self.last_good_device = device_id
+                await on_status("connected", {
+                    "device_id": device_id,
+                    "attempts": attempt,
+                    "downtime_s": downtime,
+                    "open_ms": self.last_open_ms,
+                })
+                return cap, device_id
+
+            logger.warning(
+                f"웹캠을 열 수 없습니다 (장치 {self.candidates()}, 시도 {attempt}회), "
+                f"{backoff:.1f}초 후 재시도"
+            )
+            await on_status("reconnecting", {
+                "attempts": attempt,
+                "next_retry_s": backoff,
+                "devices": self.candidates(),
+            })
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2.0, self.max_backoff)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        재연결 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 연결 횟수, 열기 시도/시간 초과 수, 누적 끊김 시간 (초)
+        """
+        return {
+            "camera_connects": float(self.connects),
+            "camera_open_attempts": float(self.open_attempts),
+            "camera_open_timeouts": float(self.open_timeouts),
+            "camera_downtime_s": self.total_downtime,
+        }
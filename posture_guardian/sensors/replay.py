@@ -0,0 +1,478 @@
+"""
+센서 이벤트 녹화 및 재생
+- FRAME / PRESSURE 이벤트를 종류별 고정 길이 바이너리 레코드 파일로 저장 (각각 메모리 매핑 가능)
+  프레임은 녹화 경로, 압력 샘플은 `<녹화 경로>.pressure` 에 기록 (압력 레코드는 랜드마크 없이 24 바이트 + 매트 셀당 2 바이트)
+- 저장된 파일을 시간 순으로 합쳐 실시간 또는 최대 속도로 이벤트 버스에 다시 발행
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from posture_guardian.core.bus import EventBus, get_event_bus
+from posture_guardian.core.config import AppConfig
+from posture_guardian.utils.events import (Event, EventType, FrameData,
+                                          PressureBlock, PressureData)
+from posture_guardian.utils.landmarks import (LANDMARK_INDEX, NUM_LANDMARKS,
+                                             LandmarkArray)
+
+logger = logging.getLogger(__name__)
+
+# 파일 헤더: 매직(8) + 버전(4) + 레코드 크기(4) + 레코드 종류(4) + 매트 셀 수(4)
+FILE_MAGIC = b"PGRECORD"
+FILE_VERSION = 4
+HEADER_DTYPE = np.dtype([
+    ("magic", "S8"),
+    ("version", "<u4"),
+    ("record_size", "<u4"),
+    ("kind", "<u4"),
+    ("channels", "<u4"),
+])
+
+# 레코드 종류
+KIND_FRAME = 1
+KIND_PRESSURE = 2
+
+# 압력 레코드 파일 접미사
+PRESSURE_SUFFIX = ".pressure"
+
+# 압력 데이터 소스 코드
+SOURCE_CODES = {"arduino": 0, "simulation": 1}
+SOURCE_NAMES = {code: name for name, code in SOURCE_CODES.items()}
+UNKNOWN_SOURCE = 255
+
+# 프레임 레코드 (little-endian)
+FRAME_RECORD_DTYPE = np.dtype([
+    ("timestamp", "<f8"),           # epoch 초
+    ("frame_id", "<i8"),
+    ("eye_distance_left", "<f4"),   # 없으면 NaN
+    ("eye_distance_right", "<f4"),  # 없으면 NaN
+    ("camera_id", "S16"),           # 카메라 ID (UTF-8)
+    ("landmarks", "<f4", (NUM_LANDMARKS, 4)),
+])
+
+
+
+def pressure_record_dtype(channels: int = 0) -> np.dtype:
+    """
+    압력 샘플 레코드 형식 (little-endian)
+
+    Args:
+        channels: 다채널 매트 셀 수 (0 이면 셀 필드 없음)
+
+    Returns:
+        np.dtype: 압력 샘플 레코드 dtype
+    """
+    fields = [
+        ("timestamp", "<f8"),           # epoch 초
+        ("foot_value", "<i4"),
+        ("cushion_value", "<i4"),
+        ("source", "u1"),
+        ("_pad", "u1", (7,)),
+    ]
+    if channels:
+        # 셀 값은 1~1024, 0 이면 셀 값 없는 샘플
+        fields.append(("cells", "<u2", (channels,)))
+    return np.dtype(fields)
+
+
+PRESSURE_RECORD_DTYPE = pressure_record_dtype()
+
+
+def record_dtype(kind: int, channels: int = 0) -> np.dtype:
+    """
+    레코드 종류별 dtype
+
+    Args:
+        kind: 레코드 종류
+        channels: 다채널 매트 셀 수 (압력 레코드만 해당)
+
+    Returns:
+        np.dtype: 레코드 dtype
+    """
+    if kind == KIND_FRAME:
+        return FRAME_RECORD_DTYPE
+    return pressure_record_dtype(channels)
+
+
+def recording_paths(path: str) -> Dict[int, str]:
+    """
+    녹화 경로의 종류별 레코드 파일 경로
+
+    Args:
+        path: 녹화 경로 (`record_path` / `replay_path`)
+
+    Returns:
+        Dict[int, str]: 레코드 종류 → 파일 경로
+    """
+    return {KIND_FRAME: path, KIND_PRESSURE: path + PRESSURE_SUFFIX}
+
+
+def _frame_landmarks(frame: FrameData) -> np.ndarray:
+    """프레임의 랜드마크 배열 (키포인트만 있으면 해당 행만 채움)"""
+    if frame.landmarks is not None:
+        return frame.landmarks.data
+    data = np.zeros((NUM_LANDMARKS, 4), dtype=np.float32)
+    for name, kp in frame.keypoints.items():
+        if name in LANDMARK_INDEX:
+            data[LANDMARK_INDEX[name]] = (kp.x, kp.y, kp.z, kp.visibility)
+    return data
+
+
+def _record_channels(dtype: np.dtype) -> int:
+    """레코드 dtype 의 매트 셀 수"""
+    return dtype["cells"].shape[0] if "cells" in dtype.names else 0
+
+
+def encode_event(event: Event, channels: Optional[int] = None) -> Optional[Tuple[int, np.ndarray]]:
+    """
+    이벤트를 레코드로 변환합니다.
+
+    Args:
+        event: FRAME 또는 PRESSURE 이벤트
+        channels: 압력 레코드의 매트 셀 수 (None 이면 이벤트의 셀 수, 다르면 셀 값 없이 기록)
+
+    Returns:
+        Optional[Tuple[int, np.ndarray]]: (레코드 종류, 레코드 배열 - 압력 샘플 묶음이면 샘플마다 하나,
+        아니면 길이 1), 지원하지 않는 이벤트면 None
+    """
+    data = event.data
+    if event.type == EventType.FRAME and isinstance(data, FrameData):
+        record = np.zeros(1, dtype=FRAME_RECORD_DTYPE)
+        record["timestamp"] = data.timestamp.timestamp()
+        record["frame_id"] = data.frame_id
+        record["eye_distance_left"] = (
+            np.nan if data.eye_distance_left is None else data.eye_distance_left
+        )
+        record["eye_distance_right"] = (
+            np.nan if data.eye_distance_right is None else data.eye_distance_right
+        )
+        record["camera_id"] = data.camera_id.encode()
+        record["landmarks"] = _frame_landmarks(data)
+        return KIND_FRAME, record
+
+    if event.type != EventType.PRESSURE:
+        return None
+    if isinstance(data, PressureBlock):
+        cells = data.cells
+        timestamps = data.timestamps
+        foot_values = data.foot_values
+        cushion_values = data.cushion_values
+    elif isinstance(data, PressureData):
+        cells = None if data.cells is None else np.asarray([data.cells])
+        timestamps = data.timestamp.timestamp()
+        foot_values = data.foot_value
+        cushion_values = data.cushion_value
+    else:
+        return None
+    event_channels = 0 if cells is None else cells.shape[1]
+    if channels is None:
+        channels = event_channels
+    records = np.zeros(np.size(foot_values), dtype=pressure_record_dtype(channels))
+    records["timestamp"] = timestamps
+    records["foot_value"] = foot_values
+    records["cushion_value"] = cushion_values
+    if channels and cells is not None:
+        if event_channels == channels:
+            records["cells"] = cells
+        else:
+            logger.warning(f"매트 셀 수가 녹화 파일과 달라 셀 값 없이 기록합니다: {event_channels} != {channels}")
+    records["source"] = SOURCE_CODES.get(data.source, UNKNOWN_SOURCE)
+    return KIND_PRESSURE, records
+
+
+def decode_record(kind: int, record: np.void) -> Event:
+    """
+    레코드 하나를 이벤트로 변환합니다.
+
+    Args:
+        kind: 레코드 종류
+        record: `FRAME_RECORD_DTYPE` 또는 `pressure_record_dtype()` 레코드
+
+    Returns:
+        Event: FRAME 또는 PRESSURE 이벤트
+
+    Raises:
+        ValueError: 알 수 없는 레코드 종류
+    """
+    timestamp = datetime.fromtimestamp(float(record["timestamp"]))
+    if kind == KIND_FRAME:
+        left = float(record["eye_distance_left"])
+        right = float(record["eye_distance_right"])
+        return Event(type=EventType.FRAME, data=FrameData(
+            timestamp=timestamp,
+            frame_id=int(record["frame_id"]),
+            camera_id=bytes(record["camera_id"]).decode(),
+            landmarks=LandmarkArray(np.array(record["landmarks"])),
+            eye_distance_left=None if np.isnan(left) else left,
+            eye_distance_right=None if np.isnan(right) else right,
+        ))
+    if kind == KIND_PRESSURE:
+        cells = None
+        if "cells" in record.dtype.names and record["cells"].any():
+            cells = record["cells"].tolist()
+        return Event(type=EventType.PRESSURE, data=PressureData(
+            timestamp=timestamp,
+            foot_value=int(record["foot_value"]),
+            cushion_value=int(record["cushion_value"]),
+            source=SOURCE_NAMES.get(int(record["source"]), "unknown"),
+            cells=cells,
+        ))
+    raise ValueError(f"알 수 없는 레코드 종류: {kind}")
+
+
+class EventRecorder:
+    """FRAME / PRESSURE 이벤트 바이너리 녹화기 (종류별 레코드 파일)"""
+
+    def __init__(self, path: str):
+        """
+        녹화기 초기화 - 종류별 파일은 첫 레코드를 쓸 때 만들고, 이미 있으면 이어서 기록
+
+        Args:
+            path: 녹화 경로 (압력 샘플은 `<path>.pressure`)
+
+        Raises:
+            ValueError: 기존 파일 형식이 다른 경우
+        """
+        self.path = path
+        self.records = 0
+        self._paths = recording_paths(path)
+        # 기존 파일의 매트 셀 수 (새 파일이면 첫 레코드의 셀 수로 정함)
+        self._channels: Dict[int, int] = {}
+        for kind, kind_path in self._paths.items():
+            if os.path.exists(kind_path) and os.path.getsize(kind_path) > 0:
+                self._channels[kind] = _read_header(kind_path, kind)
+        self._files: Dict[int, BinaryIO] = {}
+
+    def _file(self, kind: int, dtype: np.dtype) -> BinaryIO:
+        """종류별 레코드 파일 (없으면 헤더를 기록하며 생성)"""
+        file = self._files.get(kind)
+        if file is not None:
+            return file
+        path = self._paths[kind]
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            file = open(path, "ab")
+        else:
+            file = open(path, "wb")
+            header = np.zeros(1, dtype=HEADER_DTYPE)
+            header["magic"] = FILE_MAGIC
+            header["version"] = FILE_VERSION
+            header["record_size"] = dtype.itemsize
+            header["kind"] = kind
+            header["channels"] = _record_channels(dtype)
+            file.write(header.tobytes())
+            self._channels[kind] = _record_channels(dtype)
+        self._files[kind] = file
+        return file
+
+    def write(self, event: Event) -> None:
+        """
+        이벤트 하나를 기록합니다. (지원하지 않는 이벤트는 무시)
+
+        Args:
+            event: 기록할 이벤트
+        """
+        encoded = encode_event(event, self._channels.get(KIND_PRESSURE))
+        if encoded is not None:
+            kind, records = encoded
+            self._file(kind, records.dtype).write(records.tobytes())
+            self.records += len(records)
+
+    def attach(self, bus: EventBus):
+        """
+        이벤트 버스의 FRAME / PRESSURE 이벤트를 구독해 기록합니다.
+
+        Args:
+            bus: 이벤트 버스
+
+        Returns:
+            Callable: 구독 취소 함수
+        """
+        frame_unsub = bus.subscribe(EventType.FRAME, self.write)
+        pressure_unsub = bus.subscribe(EventType.PRESSURE, self.write)
+
+        def unsubscribe() -> None:
+            frame_unsub()
+            pressure_unsub()
+
+        return unsubscribe
+
+    def close(self) -> None:
+        """파일을 닫습니다."""
+        for file in self._files.values():
+            if not file.closed:
+                file.close()
+        logger.info(f"이벤트 녹화 종료: {self.path} ({self.records}개 레코드)")
+
+
+def _read_header(path: str, kind: int) -> int:
+    """파일 헤더를 검증하고 매트 셀 수를 반환합니다."""
+    header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+    if (
+        header.size != 1
+        or header["magic"][0] != FILE_MAGIC
+        or int(header["version"][0]) != FILE_VERSION
+        or int(header["kind"][0]) != kind
+        or int(header["record_size"][0]) != record_dtype(kind, int(header["channels"][0])).itemsize
+    ):
+        raise ValueError(f"녹화 파일 형식이 올바르지 않습니다 (버전 {FILE_VERSION} 필요): {path}")
+    return int(header["channels"][0])
+
+
+def _load_records(path: str, kind: int) -> np.ndarray:
+    """종류별 레코드 파일을 메모리 매핑으로 엶 (파일이 없으면 빈 배열)"""
+    if not os.path.exists(path):
+        return np.zeros(0, dtype=record_dtype(kind))
+    dtype = record_dtype(kind, _read_header(path, kind))
+    count = (os.path.getsize(path) - HEADER_DTYPE.itemsize) // dtype.itemsize
+    if count == 0:
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=HEADER_DTYPE.itemsize, shape=(count,))
+
+
+class Recording:
+    """종류별 레코드 배열과 시간 순 재생 순서"""
+
+    def __init__(self, frames: np.ndarray, pressure: np.ndarray):
+        """
+        녹화 초기화
+
+        Args:
+            frames: `FRAME_RECORD_DTYPE` 레코드 배열
+            pressure: `pressure_record_dtype()` 레코드 배열
+        """
+        self.frames = frames
+        self.pressure = pressure
+        # 두 파일의 레코드를 시각 순으로 합친 순서 (같은 시각이면 프레임 먼저)
+        timestamps = np.concatenate([frames["timestamp"], pressure["timestamp"]])
+        order = np.argsort(timestamps, kind="stable")
+        self.timestamps = timestamps[order]
+        self._is_frame = order < len(frames)
+        self._indices = np.where(self._is_frame, order, order - len(frames))
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def records(self) -> Iterator[Tuple[int, np.void]]:
+        """시각 순 (레코드 종류, 레코드)"""
+        for is_frame, index in zip(self._is_frame.tolist(), self._indices.tolist()):
+            if is_frame:
+                yield KIND_FRAME, self.frames[index]
+            else:
+                yield KIND_PRESSURE, self.pressure[index]
+
+    def events(self) -> Iterator[Event]:
+        """시각 순 이벤트"""
+        for kind, record in self.records():
+            yield decode_record(kind, record)
+
+
+def load_recording(path: str) -> Recording:
+    """
+    녹화 파일을 메모리 매핑으로 엽니다.
+
+    Args:
+        path: 녹화 경로 (압력 샘플은 `<path>.pressure`)
+
+    Returns:
+        Recording: 종류별 레코드 배열 (읽기 전용 memmap) 과 재생 순서
+
+    Raises:
+        ValueError: 파일 형식이 다르거나 녹화 파일이 없는 경우
+    """
+    paths = recording_paths(path)
+    if not any(os.path.exists(kind_path) for kind_path in paths.values()):
+        raise ValueError(f"녹화 파일이 없습니다: {path}")
+    return Recording(
+        _load_records(paths[KIND_FRAME], KIND_FRAME),
+        _load_records(paths[KIND_PRESSURE], KIND_PRESSURE),
+    )
+
+
+async def replay_events(
+    recording: Recording,
+    bus: EventBus,
+    speed: float = 1.0,
+) -> int:
+    """
+    레코드를 시각 순으로 이벤트 버스에 발행합니다.
+
+    Args:
+        recording: `load_recording()` 결과
+        bus: 이벤트 버스
+        speed: 재생 배속 (0 이하면 대기 없이 최대 속도)
+
+    Returns:
+        int: 발행한 이벤트 수
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    timestamps = recording.timestamps.tolist()
+    first_ts = timestamps[0] if timestamps else 0.0
+
+    for count, (timestamp, event) in enumerate(zip(timestamps, recording.events()), start=1):
+        if speed > 0:
+            # 녹화 당시 간격을 배속에 맞춰 재현
+            due = started + (timestamp - first_ts) / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        elif count % 256 == 0:
+            # 최대 속도에서도 다른 태스크가 실행될 수 있도록 양보
+            await asyncio.sleep(0)
+        await bus.publish(event)
+    return len(recording)
+
+
+async def replay_sensor(config: AppConfig) -> None:
+    """
+    녹화 파일을 웹캠/압력 센서 대신 재생하는 작업을 실행합니다.
+
+    Args:
+        config: 애플리케이션 설정
+    """
+    path = config.sensors.replay_path
+    logger.info(f"녹화 재생 시작: {path}")
+    bus = get_event_bus()
+
+    try:
+        recording = load_recording(path)
+        if len(recording) == 0:
+            logger.warning(f"녹화 파일에 레코드가 없습니다: {path}")
+            return
+        while True:
+            published = await replay_events(recording, bus, config.sensors.replay_speed)
+            logger.info(f"녹화 재생 완료: {published}개 이벤트")
+            if not config.sensors.replay_loop:
+                break
+    except asyncio.CancelledError:
+        logger.info("녹화 재생 태스크 취소됨")
+    except Exception as e:
+        logger.exception(f"녹화 재생 오류: {e}")
+    finally:
+        logger.info("녹화 재생 종료")
+
+
+async def event_recorder(config: AppConfig) -> None:
+    """
+    FRAME / PRESSURE 이벤트를 파일로 녹화하는 작업을 실행합니다.
+
+    Args:
+        config: 애플리케이션 설정
+    """
+    path = config.sensors.record_path
+    logger.info(f"이벤트 녹화 시작: {path}")
+    recorder = EventRecorder(path)
+    unsubscribe = recorder.attach(get_event_bus())
+
+    try:
+        while True:
+            await asyncio.sleep(1.0)
+    except asyncio.CancelledError:
+        logger.info("이벤트 녹화 태스크 취소됨")
+    finally:
+        unsubscribe()
+        recorder.close()
@@ -0,0 +1,153 @@
+"""
+관심 영역(ROI) 추적
+- 이전 프레임의 머리·어깨 랜드마크로 다음 프레임의 크롭 영역 계산
+- 크롭 좌표계의 랜드마크를 전체 프레임 좌표계로 복원
+- 추적을 잃으면 전체 프레임으로 재탐색
+"""
+import logging
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 크롭 영역 계산에 사용하는 랜드마크 (코, 눈, 어깨)
+ROI_LANDMARK_INDICES = np.array([0, 1, 3, 4, 6, 11, 12])
+
+# 크롭 영역 (x, y, 너비, 높이) - 픽셀 단위
+Box = Tuple[int, int, int, int]
+
+
+class RoiTracker:
+    """머리·어깨 주변 ROI 추적기"""
+
+    def __init__(
+        self,
+        padding: float = 0.6,
+        min_visibility: float = 0.5,
+        min_size: int = 96,
+        max_area_ratio: float = 0.8,
+    ):
+        """
+        ROI 추적기 초기화
+
+        Args:
+            padding: 랜드마크 외곽 상자 대비 여백 비율
+            min_visibility: 추적 유지에 필요한 최소 평균 가시성
+            min_size: 크롭 영역 최소 변 길이 (픽셀)
+            max_area_ratio: 크롭 면적이 이 비율을 넘으면 전체 프레임 사용
+        """
+        self.padding = padding
+        self.min_visibility = min_visibility
+        self.min_size = min_size
+        self.max_area_ratio = max_area_ratio
+        self.box: Optional[Box] = None
+
+        self.roi_inferences = 0
+        self.full_inferences = 0
+        self.reacquisitions = 0
+
+    def crop(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Box]]:
+        """
+        현재 ROI 로 프레임을 자릅니다.
+
+        Args:
+            frame: (높이, 너비, 3) 프레임
+
+        Returns:
+            Tuple[np.ndarray, Optional[Box]]: (추론할 프레임, 사용한 크롭 영역 또는 None)
+        """
+        if self.box is None:
+            self.full_inferences += 1
+            return frame, None
+        x, y, w, h = self.box
+        self.roi_inferences += 1
+        return np.ascontiguousarray(frame[y:y + h, x:x + w]), self.box
+
+    def update(
+        self,
+        landmarks: Optional[np.ndarray],
+        box: Optional[Box],
+        frame_shape: Tuple[int, ...],
+    ) -> Optional[np.ndarray]:
+        """
+        추론 결과를 전체 프레임 좌표로 복원하고 다음 ROI 를 계산합니다.
+
+        Args:
+            landmarks: 크롭 좌표계의 (33, 4) 랜드마크 배열 또는 None
+            box: `crop()` 이 반환한 크롭 영역
+            frame_shape: 전체 프레임 크기
+
+        Returns:
+            Optional[np.ndarray]: 전체 프레임 좌표계의 랜드마크 배열 또는 None
+        """
+        if landmarks is None:
+            self._lose(box)
+            return None
+
+        frame_h, frame_w = frame_shape[:2]
+        if box is not None:
+            x, y, w, h = box
+            landmarks = landmarks.copy()
+            landmarks[:, 0] = (landmarks[:, 0] * w + x) / frame_w
+            landmarks[:, 1] = (landmarks[:, 1] * h + y) / frame_h
+            landmarks[:, 2] = landmarks[:, 2] * (w / frame_w)
+
+        roi_points = landmarks[ROI_LANDMARK_INDICES]
+        if roi_points[:, 3].mean() < self.min_visibility:
+            self._lose(box)
+            return landmarks
+
+        self.box = self._compute_box(roi_points, frame_w, frame_h)
+        return landmarks
+
+    def stats(self) -> Dict[str, float]:
+        """
+        ROI 추적 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: ROI/전체 프레임 추론 수, 재탐색 횟수
+        """
+        return {
+            "roi_inferences": float(self.roi_inferences),
+            "full_inferences": float(self.full_inferences),
+            "roi_reacquisitions": float(self.reacquisitions),
+        }
+
+    def _lose(self, box: Optional[Box]) -> None:
+        """추적을 잃었을 때 다음 프레임을 전체 프레임으로 재탐색하도록 설정"""
+        if box is not None:
+            self.reacquisitions += 1
+            logger.debug("ROI 추적 손실 - 전체 프레임으로 재탐색")
+        self.box = None
+
+    def _compute_box(self, points: np.ndarray, frame_w: int, frame_h: int) -> Optional[Box]:
+        """랜드마크 외곽 상자에 여백을 더해 크롭 영역을 계산"""
+        xs = points[:, 0] * frame_w
+        ys = points[:, 1] * frame_h
+        x0, x1 = float(xs.min()), float(xs.max())
+        y0, y1 = float(ys.min()), float(ys.max())
+
+        pad = self.padding * max(x1 - x0, y1 - y0)
+        x0, x1 = x0 - pad, x1 + pad
+        y0, y1 = y0 - pad, y1 + pad
+
+        # 최소 크기 보장
+        if x1 - x0 < self.min_size:
+            cx = (x0 + x1) / 2
+            x0, x1 = cx - self.min_size / 2, cx + self.min_size / 2
+        if y1 - y0 < self.min_size:
+            cy = (y0 + y1) / 2
+            y0, y1 = cy - self.min_size / 2, cy + self.min_size / 2
+
+        left = int(max(0, np.floor(x0)))
+        top = int(max(0, np.floor(y0)))
+        right = int(min(frame_w, np.ceil(x1)))
+        bottom = int(min(frame_h, np.ceil(y1)))
+        width, height = right - left, bottom - top
+
+        if width <= 0 or height <= 0:
+            return None
+        if width * height > self.max_area_ratio * frame_w * frame_h:
+            return None
+        return left, top, width, height
@@ -0,0 +1,184 @@
+"""
+압력 센서 시뮬레이션 시나리오
+- TOML 파일의 구간 목록으로 발받침대/방석 평균값의 시간 변화를 정의
+- 구부정한 자세로 서서히 변화(slouch), 자리 비움(away), 한쪽으로 기울기(lean), 잡음 폭주(noise)
+- 다채널 매트용 압력 중심 이동(cop_x, cop_y)도 같은 방식으로 정의 (lean side = left/right)
+- 구간 경계를 선형 보간하므로 임의 시각 배열의 평균값을 한 번에 계산 가능
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import toml
+
+# 구간 종류
+STEADY = "steady"
+SLOUCH = "slouch"
+AWAY = "away"
+LEAN = "lean"
+NOISE = "noise"
+
+# 자리 비움 시 남는 압력 (센서 바닥값 근처)
+_AWAY_FOOT = 20
+_AWAY_CUSHION = 10
+
+
+@dataclass
+class ScenarioSegment:
+    """시나리오 구간 (목표 평균값까지 ramp 초 동안 선형 변화한 뒤 유지)"""
+    kind: str
+    duration: float
+    foot: float
+    cushion: float
+    ramp: float
+    cop_x: float = 0.0        # 매트 압력 중심 좌우 이동 (-1 왼쪽 ~ 1 오른쪽)
+    cop_y: float = 0.0        # 매트 압력 중심 앞뒤 이동 (-1 뒤 ~ 1 앞)
+    noise: float = 1.0        # 표준편차 배율
+    burst_rate: float = 0.0   # 초당 잡음 폭주 횟수
+    burst_std: float = 0.0    # 폭주 샘플의 추가 표준편차
+
+
+def _segment(entry: Dict[str, Any], foot_mean: float, cushion_mean: float) -> ScenarioSegment:
+    """설정 항목 하나를 구간으로 변환 (종류별 기본값 위에 명시한 값 적용)"""
+    kind = entry.get("kind", STEADY)
+    duration = float(entry["duration"])
+    shift = float(entry.get("shift", 250))
+    lateral = float(entry.get("lateral", 0.5))
+    if kind == STEADY:
+        preset = dict(foot=foot_mean, cushion=cushion_mean, ramp=1.0)
+    elif kind == SLOUCH:
+        # 체중이 발에서 방석 뒤쪽으로 서서히 이동
+        preset = dict(foot=foot_mean - shift, cushion=cushion_mean + shift, ramp=duration, cop_y=-lateral)
+    elif kind == AWAY:
+        preset = dict(foot=_AWAY_FOOT, cushion=_AWAY_CUSHION, ramp=1.0)
+    elif kind == LEAN:
+        side = entry.get("side", "forward")
+        if side in ("left", "right"):
+            # 한쪽 엉덩이로 체중 이동: 매트 압력 중심만 좌우로 이동
+            sign = 1.0 if side == "right" else -1.0
+            preset = dict(foot=foot_mean, cushion=cushion_mean, ramp=1.0, cop_x=sign * lateral)
+        else:
+            # forward: 발에 체중 실림, back: 방석에 체중 실림
+            sign = 1.0 if side == "forward" else -1.0
+            preset = dict(foot=foot_mean + sign * shift, cushion=cushion_mean - sign * shift,
+                          ramp=1.0, cop_y=sign * lateral)
+    elif kind == NOISE:
+        preset = dict(foot=foot_mean, cushion=cushion_mean, ramp=0.0, noise=3.0,
+                      burst_rate=2.0, burst_std=300.0)
+    else:
+        raise ValueError(f"알 수 없는 시나리오 구간 종류: {kind}")
+
+    for key in ("foot", "cushion", "ramp", "cop_x", "cop_y", "noise", "burst_rate", "burst_std"):
+        if key in entry:
+            preset[key] = float(entry[key])
+    preset["ramp"] = min(preset["ramp"], duration)
+    return ScenarioSegment(kind=kind, duration=duration, **preset)
+
+
+class PressureScenario:
+    """구간 목록으로 정의한 압력 평균값/잡음 시간표"""
+
+    def __init__(self, segments: List[ScenarioSegment], foot_mean: float, cushion_mean: float, loop: bool = True):
+        """
+        시나리오 초기화
+
+        Args:
+            segments: 시간 순 구간 목록
+            foot_mean: 시작 발받침대 평균값
+            cushion_mean: 시작 방석 평균값
+            loop: 끝나면 처음부터 반복 여부 (아니면 마지막 구간 유지)
+        """
+        if not segments:
+            raise ValueError("시나리오 구간이 비어 있습니다")
+        self.segments = segments
+        self.loop = loop
+
+        # 평균값 보간용 꺾은선 (구간 시작 → ramp 끝 → 구간 끝)
+        times, foot, cushion = [0.0], [float(foot_mean)], [float(cushion_mean)]
+        cop_x, cop_y = [0.0], [0.0]
+        starts = []
+        start = 0.0
+        for segment in segments:
+            starts.append(start)
+            times += [start + segment.ramp, start + segment.duration]
+            foot += [segment.foot, segment.foot]
+            cushion += [segment.cushion, segment.cushion]
+            cop_x += [segment.cop_x, segment.cop_x]
+            cop_y += [segment.cop_y, segment.cop_y]
+            start += segment.duration
+        self.duration = start
+        self._times = np.array(times)
+        self._foot = np.array(foot)
+        self._cushion = np.array(cushion)
+        self._cop_x = np.array(cop_x)
+        self._cop_y = np.array(cop_y)
+        self._ends = np.array(starts[1:] + [start])
+        self._noise = np.array([segment.noise for segment in segments])
+        self._burst_rate = np.array([segment.burst_rate for segment in segments])
+        self._burst_std = np.array([segment.burst_std for segment in segments])
+
+    def _wrap(self, t: np.ndarray) -> np.ndarray:
+        """반복 여부에 따라 시각을 시나리오 범위로 변환"""
+        if self.loop:
+            return np.mod(t, self.duration)
+        return np.minimum(t, self.duration)
+
+    def means(self, t: np.ndarray) -> np.ndarray:
+        """
+        시각 배열의 평균값을 계산합니다.
+
+        Args:
+            t: 시나리오 시작 기준 경과 시간 (N,) 초
+
+        Returns:
+            np.ndarray: (N, 2) [발받침대, 방석] 평균값
+        """
+        t = self._wrap(t)
+        return np.stack([np.interp(t, self._times, self._foot), np.interp(t, self._times, self._cushion)], axis=1)
+
+    def cop(self, t: np.ndarray) -> np.ndarray:
+        """
+        시각 배열의 매트 압력 중심 이동량을 계산합니다.
+
+        Args:
+            t: 시나리오 시작 기준 경과 시간 (N,) 초
+
+        Returns:
+            np.ndarray: (N, 2) [좌우, 앞뒤] 이동량 (-1 ~ 1)
+        """
+        t = self._wrap(t)
+        return np.stack([np.interp(t, self._times, self._cop_x), np.interp(t, self._times, self._cop_y)], axis=1)
+
+    def noise(self, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        시각 배열의 구간별 잡음 설정을 반환합니다.
+
+        Args:
+            t: 시나리오 시작 기준 경과 시간 (N,) 초
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: 표준편차 배율, 초당 폭주 횟수, 폭주 표준편차 (각 (N,))
+        """
+        index = np.minimum(np.searchsorted(self._ends, self._wrap(t), side="right"), len(self.segments) - 1)
+        return self._noise[index], self._burst_rate[index], self._burst_std[index]
+
+
+def load_scenario(path: str, foot_mean: float, cushion_mean: float) -> PressureScenario:
+    """
+    TOML 시나리오 파일을 읽습니다.
+
+    파일 형식: 최상위 `loop` (선택)와 `[[segments]]` 배열
+    (kind, duration 필수 / shift, lateral, side, foot, cushion, ramp, cop_x, cop_y,
+    noise, burst_rate, burst_std 선택)
+
+    Args:
+        path: 시나리오 파일 경로
+        foot_mean: 기본 발받침대 평균값 (종류별 기본값 계산 기준)
+        cushion_mean: 기본 방석 평균값
+
+    Returns:
+        PressureScenario: 시나리오
+    """
+    data = toml.load(path)
+    segments = [_segment(entry, foot_mean, cushion_mean) for entry in data.get("segments", [])]
+    return PressureScenario(segments, foot_mean, cushion_mean, loop=data.get("loop", True))
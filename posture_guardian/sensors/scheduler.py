@@ -0,0 +1,90 @@
+"""
+수요 기반 추론 스케줄러
+- 자세 평가기가 발행한 다음 평가 시각 직전 구간에서만 포즈 추론 수행
+- 그 외 구간은 낮은 주기의 keep-alive 추론만 수행
+- 평가 예정 시각이 평가 간격 이상 지나도 새 일정이 없으면 (평가 일시 정지 등) keep-alive 로 복귀
+"""
+import time
+from typing import Dict, Optional
+
+
+class InferenceScheduler:
+    """평가 일정에 맞춘 추론 스케줄러"""
+
+    def __init__(
+        self,
+        window: float = 0.5,
+        keepalive_interval: float = 2.0,
+        check_interval: float = 10.0,
+    ):
+        """
+        추론 스케줄러 초기화
+
+        Args:
+            window: 평가 예정 시각 전부터 추론을 시작할 시간 (초)
+            keepalive_interval: 평가 구간 밖에서의 추론 간격 (초)
+            check_interval: 평가 간격 (초) - 평가 예정 시각이 이만큼 지나면 일정을 오래된 것으로 봄
+        """
+        self.window = window
+        self.keepalive_interval = keepalive_interval
+        self.check_interval = check_interval
+        self.next_check_time: Optional[float] = None
+        self._last_inference = 0.0
+
+        self.scheduled = 0
+        self.keepalive = 0
+        self.idle = 0
+
+    def update(self, next_check_time: Optional[float]) -> None:
+        """
+        다음 평가 예정 시각을 갱신합니다.
+
+        Args:
+            next_check_time: 평가 예정 시각 (epoch 초), 미정이면 None
+        """
+        self.next_check_time = next_check_time
+
+    def should_infer(self, now: Optional[float] = None) -> bool:
+        """
+        현재 프레임을 추론해야 하는지 판단합니다.
+
+        평가 일정을 모르는 동안(보정 전 등)에는 항상 추론합니다.
+        평가 예정 시각이 지난 뒤에는 평가기가 새 일정을 발행할 때까지 계속 추론하되,
+        `check_interval` 이상 지나도 새 일정이 없으면 keep-alive 주기로 돌아갑니다.
+
+        Args:
+            now: 현재 시각 (epoch 초), 없으면 time.time()
+
+        Returns:
+            bool: 추론 여부
+        """
+        if now is None:
+            now = time.time()
+
+        if self.next_check_time is None or (
+            self.next_check_time - self.window <= now <= self.next_check_time + self.check_interval
+        ):
+            self.scheduled += 1
+            self._last_inference = now
+            return True
+
+        if now - self._last_inference >= self.keepalive_interval:
+            self.keepalive += 1
+            self._last_inference = now
+            return True
+
+        self.idle += 1
+        return False
+
+    def stats(self) -> Dict[str, float]:
+        """
+        스케줄러 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 평가 구간/keep-alive 추론 수, 건너뛴 프레임 수
+        """
+        return {
+            "schedule_window_frames": float(self.scheduled),
+            "schedule_keepalive_frames": float(self.keepalive),
+            "schedule_idle_frames": float(self.idle),
+        }
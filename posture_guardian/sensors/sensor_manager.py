@@ -4,20 +4,31 @@
 - WebcamSensor: 웹캠 연결 및 데이터 수집
 - PressureSensor: 압력 센서 (발판, 방석) 데이터 수집
 """
+import atexit
+import time
+
 import cv2
 import numpy as np
 import streamlit as st
 
 from posture_guardian.sensors.webcam import calculate_distance
 from posture_guardian.sensors.pressure_pad import PressurePadSimulator
+from posture_guardian.sensors.pose_pool import PosePool
 
 
 class SensorManager:
     """센서 객체를 관리하고 데이터 수집 메서드 제공"""
     
-    def __init__(self):
-        """센서 관리자 초기화"""
+    def __init__(self, pose_pool_size: int = 1):
+        """센서 관리자 초기화
+        
+        Args:
+            pose_pool_size: 세션 간 공유할 MediaPipe Pose 인스턴스 수
+        """
         self.webcam = None
+        self.pose_pool_size = pose_pool_size
+        self.pose_pool = None
+        self.webcam_latency_ms = 0.0
         self.pressure_simulator = PressurePadSimulator(
             foot_mean=500, foot_std=30,
             cushion_mean=500, cushion_std=30
@@ -26,6 +37,7 @@ class SensorManager:
     def initialize(self):
         """모든 센서 초기화"""
         self._init_webcam()
+        self._init_pose_pool()
     
     def _init_webcam(self):
         """웹캠 초기화 - 열리지 않으면 시뮬레이션 모드로 안내"""
@@ -37,29 +49,35 @@ class SensorManager:
             except Exception as e:
                 st.warning(f"웹캠 초기화 오류: {e}")
     
+    def _init_pose_pool(self):
+        """Pose 풀 생성 및 워밍업 - 재실행마다 모델을 다시 로드하지 않도록 한 번만 수행"""
+        if self.pose_pool is None:
+            self.pose_pool = PosePool(size=self.pose_pool_size)
+            try:
+                self.pose_pool.warm_up()
+            except Exception as e:
+                st.warning(f"Pose 모델 워밍업 오류: {e}")
+    
     def get_webcam_data(self):
         """웹캠에서 데이터 수집
         
         Returns:
             dict: 눈 거리 (좌/우) 및 유효성 정보
         """
-        import mediapipe as mp
-        
-        mp_pose = mp.solutions.pose
-        pose = mp_pose.Pose(
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-        
         if self.webcam and self.webcam.isOpened():
             ret, frame = self.webcam.read()
             if ret:
+                started = time.perf_counter()
+                
                 # 프레임 처리
                 frame = cv2.flip(frame, 1)  # 좌우 반전 (거울 효과)
                 rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
                 
-                # MediaPipe Pose 처리
-                results = pose.process(rgb_frame)
+                # MediaPipe Pose 처리 (풀의 인스턴스 재사용)
+                self._init_pose_pool()
+                with self.pose_pool.acquire() as pose:
+                    results = pose.process(rgb_frame)
+                self.webcam_latency_ms = (time.perf_counter() - started) * 1000.0
                 
                 if results.pose_landmarks:
                     # 키포인트 추출
@@ -129,7 +147,13 @@ class SensorManager:
         if self.webcam:
             self.webcam.release()
             self.webcam = None
+        if self.pose_pool is not None:
+            self.pose_pool.close()
+            self.pose_pool = None
 
 
 # 싱글톤 인스턴스
-sensor_manager = SensorManager() 
\ No newline at end of file
+sensor_manager = SensorManager()
+
+# 프로세스 종료 시 웹캠과 Pose 풀 정리
+atexit.register(sensor_manager.cleanup)
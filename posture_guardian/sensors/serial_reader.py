@@ -0,0 +1,333 @@
+"""
+비동기 시리얼 라인 리더
+- 별도 스레드에서 시리얼 포트를 읽어 이벤트 루프를 막지 않음
+- 깨어날 때마다 완성된 모든 줄을 한 번에 파싱하고, 수신 시각을 샘플마다 기록
+- CSV 텍스트 프로토콜과 고정 길이 바이너리 프레임 프로토콜 지원 (arduino_code.ino 와 동일)
+- pyserial 의 `Serial` 과 같은 read()/in_waiting 인터페이스면 pty 도 사용 가능
+"""
+import asyncio
+import collections
+import logging
+import threading
+import time
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 압력 센서 값 범위 (PressureData 검증 범위)
+VALUE_MIN = 1
+VALUE_MAX = 1024
+
+# 프로토콜
+PROTOCOL_CSV = "csv"
+PROTOCOL_BINARY = "binary"
+
+# 바이너리 프레임: 동기 바이트 2개, 순번, 채널 값 (uint16 LE, 발받침대 다음 방석/매트 셀), XOR 체크섬
+SYNC = b"\xa5\x5a"
+# 기본 채널 수 (발받침대, 방석)
+DEFAULT_CHANNELS = 2
+
+
+def frame_dtype(channels: int = DEFAULT_CHANNELS) -> np.dtype:
+    """
+    채널 수에 맞는 바이너리 프레임 구조를 반환합니다.
+
+    Args:
+        channels: 프레임당 값 개수 (2 채널이면 8 바이트)
+
+    Returns:
+        np.dtype: 프레임 구조화 dtype
+    """
+    return np.dtype([
+        ("sync", "u1", (2,)),
+        ("seq", "u1"),
+        ("values", "<u2", (channels,)),
+        ("checksum", "u1"),
+    ])
+
+
+FRAME_DTYPE = frame_dtype()
+FRAME_SIZE = FRAME_DTYPE.itemsize  # 8 바이트
+
+
+def _checksum(frames: np.ndarray) -> np.ndarray:
+    """(N, 프레임 크기) 바이트 배열의 체크섬 (순번 ~ 마지막 값 XOR)"""
+    return np.bitwise_xor.reduce(frames[:, 2:-1], axis=1)
+
+
+def parse_csv_lines(lines: List[bytes], channels: int = DEFAULT_CHANNELS) -> Tuple[np.ndarray, int]:
+    """
+    "발받침대,방석[,셀...]" 형식의 줄 목록을 한 번에 파싱합니다.
+
+    Args:
+        lines: 줄바꿈을 제외한 바이트 줄 목록
+        channels: 줄당 값 개수 (개수가 다른 줄은 버림)
+
+    Returns:
+        Tuple[np.ndarray, int]: (N, channels) int32 값 배열 (1~1024 로 제한), 버린 줄 수
+    """
+    rows = [line.strip() for line in lines]
+    valid = [row for row in rows if row.count(b",") == channels - 1]
+    values = np.zeros((0, channels), dtype=np.int32)
+    if valid:
+        try:
+            # 모든 토큰을 한 번에 정수 배열로 변환
+            values = np.array(b",".join(valid).split(b","), dtype=np.int32).reshape(-1, channels)
+        except ValueError:
+            # 숫자가 아닌 줄이 섞인 경우에만 줄 단위로 걸러냄
+            parsed = []
+            for row in valid:
+                try:
+                    parsed.append([int(v) for v in row.split(b",")])
+                except ValueError:
+                    continue
+            values = np.array(parsed, dtype=np.int32).reshape(-1, channels)
+    dropped = sum(1 for row in rows if row) - len(values)
+    return np.clip(values, VALUE_MIN, VALUE_MAX), dropped
+
+
+def encode_binary_frames(values: np.ndarray, start_seq: int = 0) -> bytes:
+    """
+    값 배열을 바이너리 프레임으로 인코딩합니다. (펌웨어와 동일한 형식, 테스트/시뮬레이션용)
+
+    Args:
+        values: (N, 채널 수) 값 배열 [발받침대, 방석 또는 매트 셀...]
+        start_seq: 첫 프레임 순번
+
+    Returns:
+        bytes: N 개 프레임
+    """
+    values = np.atleast_2d(values)
+    dtype = frame_dtype(values.shape[1])
+    frames = np.zeros(len(values), dtype=dtype)
+    frames["sync"] = np.frombuffer(SYNC, dtype=np.uint8)
+    frames["seq"] = (start_seq + np.arange(len(values))) % 256
+    frames["values"] = values
+    frames["checksum"] = _checksum(frames.view(np.uint8).reshape(-1, dtype.itemsize))
+    return frames.tobytes()
+
+
+def decode_binary_frames(
+    buffer: bytes, channels: int = DEFAULT_CHANNELS
+) -> Tuple[np.ndarray, np.ndarray, bytes, int]:
+    """
+    버퍼에서 완성된 바이너리 프레임을 한 번에 디코딩합니다.
+
+    정렬된 버퍼는 `numpy.frombuffer` 로 바로 해석하고, 잡음이나 잘린 프레임이 섞이면
+    동기 바이트 위치를 찾아 체크섬이 맞는 프레임만 골라냅니다.
+
+    Args:
+        buffer: 수신 바이트 (이전 호출에서 남은 부분 포함)
+        channels: 프레임당 값 개수
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, bytes, int]:
+            (N, channels) 값 배열 (1~1024 로 제한), (N,) 순번 배열, 남은 바이트, 버린 바이트 수
+    """
+    dtype = frame_dtype(channels)
+    size = dtype.itemsize
+    raw = np.frombuffer(buffer, dtype=np.uint8)
+    count = len(raw) // size
+
+    # 빠른 경로: 버퍼가 프레임 경계에 맞춰 정렬되고 모든 체크섬이 맞는 경우
+    frames = raw[:count * size].reshape(-1, size)
+    aligned = (
+        count > 0
+        and np.all(frames[:, 0] == SYNC[0]) and np.all(frames[:, 1] == SYNC[1])
+        and np.array_equal(_checksum(frames), frames[:, -1])
+    )
+    if aligned:
+        starts = np.arange(count) * size
+    else:
+        # 동기 바이트 후보 중 완성되고 체크섬이 맞는 위치만 선택
+        starts = np.flatnonzero((raw[:-1] == SYNC[0]) & (raw[1:] == SYNC[1]))
+        starts = starts[starts + size <= len(raw)]
+        if len(starts):
+            candidates = raw[starts[:, None] + np.arange(size)]
+            starts = starts[_checksum(candidates) == candidates[:, -1]]
+        if len(starts) > 1 and np.any(np.diff(starts) < size):
+            # 값 안에 동기 바이트가 우연히 나타난 경우: 겹치는 후보 제거
+            kept = [int(starts[0])]
+            for start in starts[1:].tolist():
+                if start >= kept[-1] + size:
+                    kept.append(start)
+            starts = np.array(kept, dtype=np.int64)
+
+    if aligned:
+        decoded = np.frombuffer(buffer, dtype=dtype, count=count)
+    else:
+        decoded = raw[starts[:, None] + np.arange(size)].reshape(-1).view(dtype)
+    consumed = int(starts[-1]) + size if len(starts) else 0
+
+    # 아직 완성되지 않은 마지막 프레임이 있을 수 있는 부분만 남김
+    keep_from = max(consumed, len(raw) - (size - 1))
+    dropped = keep_from - len(decoded) * size
+    values = decoded["values"].astype(np.int32).reshape(-1, channels)
+    return np.clip(values, VALUE_MIN, VALUE_MAX), decoded["seq"], buffer[keep_from:], dropped
+
+
+class SerialLineReader:
+    """
+    스레드 기반 시리얼 리더 (CSV 또는 바이너리 프레임)
+
+    읽기 스레드는 도착한 바이트를 모아 완성된 줄/프레임만 파싱해 대기열에 넣고,
+    이벤트 루프는 `read_samples()` 로 쌓인 샘플을 한꺼번에 가져갑니다.
+    수신 시각은 read() 한 번으로 받은 청크 단위로 기록하므로 같은 청크의 샘플은 시각이 같습니다.
+    (청크 안에서 샘플이 언제 도착했는지는 알 수 없고, 보간하면 유휴 구간 뒤 첫 청크의 시각이 앞당겨짐)
+    """
+
+    def __init__(
+        self,
+        ser: Any,
+        max_pending: int = 1024,
+        protocol: str = PROTOCOL_CSV,
+        channels: int = DEFAULT_CHANNELS,
+    ):
+        """
+        시리얼 리더 초기화
+
+        Args:
+            ser: 열려 있는 시리얼 포트 (read(), in_waiting 지원, timeout 권장)
+            max_pending: 가져가지 않은 최대 청크 수 (넘으면 오래된 청크부터 버림)
+            protocol: "csv" (줄 단위 텍스트) 또는 "binary" (고정 길이 프레임)
+            channels: 샘플당 값 개수 (발받침대 + 방석 또는 매트 셀 수)
+        """
+        if protocol not in (PROTOCOL_CSV, PROTOCOL_BINARY):
+            raise ValueError(f"알 수 없는 시리얼 프로토콜: {protocol}")
+        self.ser = ser
+        self.protocol = protocol
+        self.channels = channels
+        self.frame_size = frame_dtype(channels).itemsize
+        self._pending: Deque[Tuple[float, np.ndarray]] = collections.deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ready: Optional[asyncio.Event] = None
+        self.error: Optional[BaseException] = None
+
+        self.bytes_read = 0
+        self.lines = 0
+        self.bad_lines = 0
+        self.chunks_dropped = 0
+        self.bytes_dropped = 0
+        self.frames_lost = 0
+        self._last_seq: Optional[int] = None
+
+    def start(self) -> None:
+        """읽기 스레드를 시작합니다. (이벤트 루프 안에서 호출)"""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="serial-reader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """읽기 스레드를 중지합니다. (포트의 read timeout 이내에 종료)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _notify(self) -> None:
+        """이벤트 루프에 새 샘플(또는 오류)을 알림"""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._ready.set)
+
+    def _decode(self, buffer: bytes, arrived: float) -> bytes:
+        """완성된 줄/프레임을 파싱해 대기열에 넣고 남은 부분을 반환"""
+        if self.protocol == PROTOCOL_BINARY:
+            values, seqs, rest, dropped = decode_binary_frames(buffer, self.channels)
+            self.bytes_dropped += dropped
+            if len(seqs):
+                # 순번 간격으로 전송 중 잃어버린 프레임 수 계산
+                previous = int(seqs[0]) - 1 if self._last_seq is None else self._last_seq
+                gaps = np.diff(np.concatenate([[previous], seqs.astype(np.int64)])) % 256
+                self.frames_lost += int((gaps - 1).sum())
+                self._last_seq = int(seqs[-1])
+        else:
+            complete, _, rest = buffer.rpartition(b"\n")
+            values, dropped = parse_csv_lines(complete.split(b"\n"), self.channels)
+            self.bad_lines += dropped
+        self.lines += len(values)
+        if len(values):
+            with self._lock:
+                if len(self._pending) == self._pending.maxlen:
+                    self.chunks_dropped += 1
+                self._pending.append((arrived, values))
+            self._notify()
+        return rest
+
+    def _run(self) -> None:
+        """읽기 스레드 본체"""
+        buffer = b""
+        while not self._stop_event.is_set():
+            try:
+                data = self.ser.read(max(1, self.ser.in_waiting))
+            except Exception as e:
+                self.error = e
+                self._notify()
+                return
+            if not data:
+                continue
+            arrived = time.time()
+            self.bytes_read += len(data)
+            buffer += data
+            if self.protocol == PROTOCOL_BINARY:
+                if len(buffer) >= self.frame_size:
+                    buffer = self._decode(buffer, arrived)
+            elif b"\n" in buffer:
+                buffer = self._decode(buffer, arrived)
+
+    async def read_samples(self, timeout: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        새 샘플이 올 때까지 기다린 뒤 쌓인 샘플을 모두 가져옵니다.
+
+        Args:
+            timeout: 최대 대기 시간 (초), 없으면 무한 대기
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (수신 시각 (N,) epoch 초 - 같은 청크의 샘플은 같은 시각,
+            값 (N, 채널 수) [발받침대, 방석...]), 시간 초과 시 빈 배열
+
+        Raises:
+            Exception: 읽기 스레드에서 발생한 시리얼 오류 (쌓인 샘플을 모두 가져간 뒤)
+        """
+        if not self._pending and self.error is None:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        with self._lock:
+            chunks = list(self._pending)
+            self._pending.clear()
+            self._ready.clear()
+
+        if not chunks:
+            if self.error is not None:
+                raise self.error
+            return np.zeros(0), np.zeros((0, self.channels), dtype=np.int32)
+
+        timestamps = np.concatenate([np.full(len(values), arrived) for arrived, values in chunks])
+        return timestamps, np.concatenate([values for _, values in chunks])
+
+    def stats(self) -> Dict[str, float]:
+        """
+        리더 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 읽은 바이트/샘플 수, 버린 줄/바이트/청크 수, 잃어버린 프레임 수
+        """
+        return {
+            "serial_bytes": float(self.bytes_read),
+            "serial_lines": float(self.lines),
+            "serial_bad_lines": float(self.bad_lines),
+            "serial_chunks_dropped": float(self.chunks_dropped),
+            "serial_bytes_dropped": float(self.bytes_dropped),
+            "serial_frames_lost": float(self.frames_lost),
+        }
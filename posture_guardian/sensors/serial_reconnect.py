@@ -0,0 +1,164 @@
+"""
+아두이노 시리얼 재연결 관리
+- 포트가 사라지면 지수 백오프로 포트 목록을 다시 탐색
+- 마지막으로 연결된 장치를 VID/PID/일련번호로 기억해 포트 이름이 바뀌어도 같은 장치를 먼저 시도
+- 연결 상태 변화를 콜백으로 알림 (SYSTEM pressure_health 이벤트 발행용)
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import serial
+import serial.tools.list_ports
+
+logger = logging.getLogger(__name__)
+
+# 상태 알림 콜백: (상태, 추가 정보)
+StatusCallback = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+# 아두이노로 보는 포트 설명 문자열 (USB-시리얼 변환 칩 포함)
+ARDUINO_DESCRIPTIONS = ("Arduino", "CH340", "CP210", "FT232", "USB Serial")
+
+# 장치 식별자: (VID, PID, 일련번호)
+PortIdentity = Tuple[Optional[int], Optional[int], Optional[str]]
+
+
+def _identity(port: Any) -> PortIdentity:
+    """list_ports 항목의 장치 식별자"""
+    return (port.vid, port.pid, port.serial_number)
+
+
+class SerialReconnector:
+    """지수 백오프 기반 아두이노 시리얼 재연결 관리자"""
+
+    def __init__(
+        self,
+        baud_rate: int = 9600,
+        port: Optional[str] = None,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        read_timeout: float = 0.1,
+    ):
+        """
+        재연결 관리자 초기화
+
+        Args:
+            baud_rate: 통신 속도
+            port: 고정 포트 경로 (없으면 포트 목록에서 아두이노 탐색)
+            initial_backoff: 첫 재시도 대기 시간 (초)
+            max_backoff: 최대 재시도 대기 시간 (초)
+            read_timeout: 열린 포트의 읽기 timeout (초, 읽기 스레드 종료 확인 주기)
+        """
+        self.baud_rate = baud_rate
+        self.port = port
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.read_timeout = read_timeout
+        self.last_identity: Optional[PortIdentity] = None
+        self.last_device: Optional[str] = None
+
+        self.connects = 0
+        self.open_attempts = 0
+        self.total_downtime = 0.0
+
+    def candidates(self) -> List[str]:
+        """
+        시도할 포트 목록 (고정 포트, 기억한 장치, 마지막 포트, 설명이 맞는 포트 순)
+
+        Returns:
+            List[str]: 포트 경로 목록
+        """
+        if self.port:
+            return [self.port]
+        ports = list(serial.tools.list_ports.comports())
+        order = []
+        if self.last_identity is not None and self.last_identity[:2] != (None, None):
+            order.extend(port.device for port in ports if _identity(port) == self.last_identity)
+        if self.last_device is not None:
+            order.extend(port.device for port in ports if port.device == self.last_device)
+        order.extend(
+            port.device for port in ports
+            if any(name in (port.description or "") for name in ARDUINO_DESCRIPTIONS)
+        )
+        return list(dict.fromkeys(order))
+
+    def _remember(self, device: str) -> None:
+        """연결된 포트의 장치 식별자 기억"""
+        self.last_device = device
+        for port in serial.tools.list_ports.comports():
+            if port.device == device:
+                self.last_identity = _identity(port)
+                return
+
+    async def _try_open(self, device: str) -> Optional[serial.Serial]:
+        """포트 열기를 시도합니다."""
+        self.open_attempts += 1
+        try:
+            return await asyncio.to_thread(
+                serial.Serial, device, self.baud_rate, timeout=self.read_timeout
+            )
+        except (serial.SerialException, OSError) as e:
+            logger.debug(f"시리얼 포트 {device} 열기 실패: {e}")
+            return None
+
+    async def connect(self, on_status: StatusCallback) -> Tuple[serial.Serial, str]:
+        """
+        포트가 열릴 때까지 재시도합니다.
+
+        Args:
+            on_status: 상태 알림 콜백 ("reconnecting", "connected")
+
+        Returns:
+            Tuple[serial.Serial, str]: 열린 시리얼 포트와 포트 경로
+        """
+        backoff = self.initial_backoff
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            candidates = await asyncio.to_thread(self.candidates)
+            for device in candidates:
+                ser = await self._try_open(device)
+                if ser is None:
+                    continue
+
+                downtime = time.monotonic() - started
+                if self.connects > 0:
+                    self.total_downtime += downtime
+                self.connects += 1
+                await asyncio.to_thread(self._remember, device)
+                await on_status("connected", {
+                    "port": device,
+                    "attempts": attempt,
+                    "downtime_s": downtime,
+                    "vid": self.last_identity[0] if self.last_identity else None,
+                    "pid": self.last_identity[1] if self.last_identity else None,
+                    "serial_number": self.last_identity[2] if self.last_identity else None,
+                })
+                return ser, device
+
+            logger.warning(
+                f"아두이노 포트를 열 수 없습니다 (후보 {candidates}, 시도 {attempt}회), "
+                f"{backoff:.1f}초 후 재시도"
+            )
+            await on_status("reconnecting", {
+                "attempts": attempt,
+                "next_retry_s": backoff,
+                "ports": candidates,
+            })
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2.0, self.max_backoff)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        재연결 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 연결 횟수, 열기 시도 수, 누적 끊김 시간 (초)
+        """
+        return {
+            "serial_connects": float(self.connects),
+            "serial_open_attempts": float(self.open_attempts),
+            "serial_downtime_s": self.total_downtime,
+        }
@@ -0,0 +1,137 @@
+"""
+랜드마크 평활화 필터
+- 프레임 간 랜드마크 떨림을 (33, 4) 배열 전체에 대해 한 번에 평활화
+- One-Euro 필터 (느린 움직임은 강하게, 빠른 움직임은 약하게 평활화) 또는 EMA
+- 키포인트별 파라미터, 키포인트당 고정 크기 상태
+"""
+import math
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+from posture_guardian.utils.landmarks import LANDMARK_INDEX, NUM_LANDMARKS, VISIBILITY
+
+
+def _per_keypoint(default: float, overrides: Optional[Mapping[str, float]]) -> np.ndarray:
+    """기본값과 키포인트별 재정의로 (33, 1) 파라미터 열을 만듭니다."""
+    values = np.full((NUM_LANDMARKS, 1), default, dtype=np.float32)
+    for name, value in (overrides or {}).items():
+        values[LANDMARK_INDEX[name]] = value
+    return values
+
+
+class LandmarkSmoother:
+    """
+    (33, 4) 랜드마크 배열용 벡터화 평활화 필터
+
+    좌표 열(x, y, z)만 평활화하고 가시성 열은 그대로 전달합니다.
+    프레임 간격이 `reset_after` 초를 넘으면 이전 상태를 버리고 새로 시작합니다.
+    """
+
+    def __init__(
+        self,
+        method: str = "one_euro",
+        min_cutoff: float = 1.0,
+        beta: float = 5.0,
+        d_cutoff: float = 1.0,
+        ema_alpha: float = 0.5,
+        overrides: Optional[Mapping[str, float]] = None,
+        reset_after: float = 1.0,
+    ):
+        """
+        평활화 필터 초기화
+
+        Args:
+            method: "one_euro" 또는 "ema"
+            min_cutoff: One-Euro 최소 차단 주파수 (Hz, 작을수록 강한 평활화)
+            beta: One-Euro 속도 계수 (클수록 빠른 움직임에서 지연 감소)
+            d_cutoff: One-Euro 속도 추정 차단 주파수 (Hz)
+            ema_alpha: EMA 가중치 (0~1, 클수록 현재 프레임 비중이 큼)
+            overrides: 키포인트별 min_cutoff(One-Euro) 또는 alpha(EMA) 재정의
+            reset_after: 상태를 초기화할 프레임 간격 (초)
+
+        Raises:
+            ValueError: 지원하지 않는 방식 또는 키포인트 이름
+        """
+        if method not in ("one_euro", "ema"):
+            raise ValueError(f"지원하지 않는 평활화 방식: {method}")
+        unknown = set(overrides or {}) - set(LANDMARK_INDEX)
+        if unknown:
+            raise ValueError(f"알 수 없는 키포인트: {sorted(unknown)}")
+
+        self.method = method
+        self.d_cutoff = d_cutoff
+        self.reset_after = reset_after
+        if method == "one_euro":
+            self.min_cutoff = _per_keypoint(min_cutoff, overrides)
+            self.beta = np.full((NUM_LANDMARKS, 1), beta, dtype=np.float32)
+        else:
+            self.alpha = _per_keypoint(ema_alpha, overrides)
+
+        self._value: Optional[np.ndarray] = None   # (33, 3) 평활화된 좌표
+        self._speed: Optional[np.ndarray] = None   # (33, 3) 평활화된 속도
+        self._last_time: Optional[float] = None
+
+        self.filtered = 0
+        self.resets = 0
+
+    @staticmethod
+    def _alpha(cutoff, dt: float):
+        """차단 주파수와 프레임 간격에 대한 저역 통과 가중치"""
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def reset(self) -> None:
+        """필터 상태를 초기화합니다."""
+        self._value = None
+        self._speed = None
+        self._last_time = None
+
+    def __call__(self, landmarks: np.ndarray, timestamp: float) -> np.ndarray:
+        """
+        랜드마크 배열 하나를 평활화합니다.
+
+        Args:
+            landmarks: (33, 4) 랜드마크 배열 (변경하지 않음)
+            timestamp: 프레임 시각 (초)
+
+        Returns:
+            np.ndarray: 평활화된 새 (33, 4) 배열
+        """
+        coords = landmarks[:, :VISIBILITY]
+        out = np.empty_like(landmarks, dtype=np.float32)
+        out[:, VISIBILITY] = landmarks[:, VISIBILITY]
+
+        dt = None if self._last_time is None else timestamp - self._last_time
+        if self._value is None or dt is None or dt > self.reset_after:
+            if self._value is not None:
+                self.resets += 1
+            self._value = coords.astype(np.float32, copy=True)
+            self._speed = np.zeros_like(self._value)
+        elif dt <= 0.0:
+            # 같은 시각의 중복 프레임은 상태를 바꾸지 않음
+            pass
+        elif self.method == "one_euro":
+            speed = (coords - self._value) / dt
+            self._speed += self._alpha(self.d_cutoff, dt) * (speed - self._speed)
+            cutoff = self.min_cutoff + self.beta * np.abs(self._speed)
+            self._value += self._alpha(cutoff, dt) * (coords - self._value)
+        else:
+            self._value += self.alpha * (coords - self._value)
+
+        self._last_time = max(timestamp, self._last_time or timestamp)
+        self.filtered += 1
+        out[:, :VISIBILITY] = self._value
+        return out
+
+    def stats(self) -> Dict[str, float]:
+        """
+        필터 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 평활화한 프레임 수, 상태 초기화 횟수
+        """
+        return {
+            "smoothing_frames": float(self.filtered),
+            "smoothing_resets": float(self.resets),
+        }
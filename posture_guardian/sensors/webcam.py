@@ -3,8 +3,11 @@
 """
 import asyncio
 import logging
+import queue
+import threading
 import time
-from typing import Dict, Optional, Tuple
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
 import cv2
 import mediapipe as mp
@@ -12,8 +15,22 @@ import numpy as np
 
 from posture_guardian.core.bus import get_event_bus
 from posture_guardian.core.config import AppConfig
-from posture_guardian.utils.events import (Event, EventType, FrameData,
-                                          PoseKeypoint)
+from posture_guardian.sensors.capture import (configure_capture,
+                                              preprocess_frame,
+                                              probe_capture_modes)
+from posture_guardian.sensors.flow import LandmarkFlowTracker
+from posture_guardian.sensors.motion import MotionGate
+from posture_guardian.sensors.pose_worker import PoseWorkerProcess
+from posture_guardian.sensors.presence import PresenceDetector
+from posture_guardian.sensors.quality import FrameQualityFilter
+from posture_guardian.sensors.reconnect import CameraReconnector
+from posture_guardian.sensors.roi import RoiTracker
+from posture_guardian.sensors.scheduler import InferenceScheduler
+from posture_guardian.sensors.smoothing import LandmarkSmoother
+from posture_guardian.utils.events import (CheckSchedule, Event, EventType,
+                                          FrameData, latest_pressure)
+from posture_guardian.utils.landmarks import LandmarkArray
+from posture_guardian.utils.metrics import LoopLagMonitor
 
 logger = logging.getLogger(__name__)
 
@@ -36,115 +53,739 @@ def calculate_distance(point1, point2) -> float:
     return np.sqrt((point1.x - point2.x) ** 2 + (point1.y - point2.y) ** 2)
 
 
-def extract_keypoints(landmarks) -> Dict[str, PoseKeypoint]:
+class FrameGrabber:
     """
-    MediaPipe 랜드마크에서 키포인트 정보를 추출합니다.
+    별도 스레드에서 웹캠 프레임을 읽어 고정 크기 링 버퍼에 보관하는 캡처기
+
+    캡처 스레드가 `read()`, 좌우 반전, 색상 변환을 모두 수행하므로
+    이벤트 루프는 가장 최신 프레임만 가져가면 됩니다.
+    소비되지 못하고 덮어써진 프레임은 드롭으로 집계됩니다.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture, buffer_size: int = 2):
+        """
+        프레임 캡처기 초기화
+
+        Args:
+            cap: 열려 있는 OpenCV 캡처 객체
+            buffer_size: 링 버퍼 크기 (프레임)
+        """
+        self.cap = cap
+        self.buffer_size = max(1, buffer_size)
+        self._slots: List[Optional[Tuple[int, float, np.ndarray]]] = [None] * self.buffer_size
+        self._write_seq = 0          # 마지막으로 기록된 프레임 순번
+        self._read_seq = 0           # 마지막으로 소비된 프레임 순번
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.read_failures = 0
+        self.consecutive_failures = 0
+        self.last_frame_at = time.monotonic()
+        self.total_preprocess_ms = 0.0
+        self.frame_interval = 0.0    # 저속 동작 시 프레임 사이 대기 시간 (초)
+
+    def start(self) -> None:
+        """캡처 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="webcam-capture", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """캡처 스레드를 중지하고 종료를 기다립니다."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self) -> None:
+        """캡처 스레드 본체"""
+        while not self._stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                self.read_failures += 1
+                self.consecutive_failures += 1
+                logger.warning("웹캠에서 프레임을 읽을 수 없습니다")
+                self._stop_event.wait(0.2)
+                continue
+            self.consecutive_failures = 0
+
+            started = time.perf_counter()
+            rgb_frame = preprocess_frame(frame)  # 좌우 반전 (거울 효과) + RGB 변환
+            preprocess_ms = (time.perf_counter() - started) * 1000.0
+            captured_at = time.monotonic()
+
+            with self._lock:
+                self._write_seq += 1
+                self._slots[self._write_seq % self.buffer_size] = (
+                    self._write_seq, captured_at, rgb_frame
+                )
+                self.frames_captured += 1
+                self.total_preprocess_ms += preprocess_ms
+                self.last_frame_at = captured_at
+
+            if self.frame_interval > 0:
+                self._stop_event.wait(self.frame_interval)
+
+    def latest(self) -> Optional[Tuple[int, float, np.ndarray]]:
+        """
+        아직 소비하지 않은 가장 최신 프레임을 반환합니다.
+
+        Returns:
+            Optional[Tuple[int, float, np.ndarray]]: (순번, 캡처 시각, RGB 프레임),
+            새 프레임이 없으면 None
+        """
+        with self._lock:
+            if self._write_seq == self._read_seq:
+                return None
+            item = self._slots[self._write_seq % self.buffer_size]
+            # 마지막 소비 이후 건너뛴 프레임은 드롭으로 집계
+            self.frames_dropped += self._write_seq - self._read_seq - 1
+            self._read_seq = self._write_seq
+        return item
+
+    def is_stalled(self, failure_threshold: int, stale_timeout: float) -> bool:
+        """
+        장치가 끊긴 것으로 보이는지 확인합니다.
+
+        Args:
+            failure_threshold: 연속 읽기 실패 허용 횟수
+            stale_timeout: 새 프레임 없이 기다리는 최대 시간 (초)
+
+        Returns:
+            bool: 연속 실패 또는 프레임 정체 여부
+        """
+        return (
+            self.consecutive_failures >= failure_threshold
+            or time.monotonic() - self.last_frame_at > stale_timeout + self.frame_interval
+        )
+
+    def stats(self) -> Dict[str, float]:
+        """
+        캡처 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 캡처/드롭/읽기 실패 프레임 수, 평균 전처리 시간 (밀리초)
+        """
+        with self._lock:
+            return {
+                "frames_captured": float(self.frames_captured),
+                "frames_dropped": float(self.frames_dropped),
+                "read_failures": float(self.read_failures),
+                "preprocess_mean_ms": self.total_preprocess_ms / (self.frames_captured or 1),
+            }
+
+
+class VideoFileReader:
+    """
+    영상 파일을 별도 스레드에서 디코딩해 유한 큐에 넣는 리더
+
+    웹캠 캡처와 달리 프레임을 버리지 않으며, 큐가 가득 차면 디코딩 스레드가 기다립니다.
+    디코딩과 포즈 추론이 서로 다른 스레드에서 겹쳐 실행되어 실시간보다 빠르게 처리됩니다.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture, queue_size: int = 8, flip: bool = True):
+        """
+        영상 리더 초기화
+
+        Args:
+            cap: 영상 파일을 연 OpenCV 캡처 객체
+            queue_size: 디코딩된 프레임 큐 크기
+            flip: 웹캠과 같이 좌우 반전할지 여부
+        """
+        self.cap = cap
+        self.flip = flip
+        self._queue: "queue.Queue[Optional[Tuple[float, np.ndarray]]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.frames_decoded = 0
+        self.total_decode_ms = 0.0
+
+    def start(self) -> None:
+        """디코딩 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="video-decode", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """디코딩 스레드를 중지합니다."""
+        self._stop_event.set()
+        # 큐에서 대기 중인 디코딩 스레드를 깨우기 위해 비움
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _put(self, item: Optional[Tuple[float, np.ndarray]]) -> bool:
+        """중지 요청을 확인하면서 큐에 넣기"""
+        while not self._stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        """디코딩 스레드 본체 - 파일 끝에서 None 을 넣고 종료"""
+        while not self._stop_event.is_set():
+            started = time.perf_counter()
+            ret, frame = self.cap.read()
+            if not ret:
+                break
+            position_ms = self.cap.get(cv2.CAP_PROP_POS_MSEC)
+            rgb_frame = preprocess_frame(frame, self.flip)
+            self.frames_decoded += 1
+            self.total_decode_ms += (time.perf_counter() - started) * 1000.0
+            if not self._put((position_ms / 1000.0, rgb_frame)):
+                return
+        self._put(None)
+
+    def read(self) -> Optional[Tuple[float, np.ndarray]]:
+        """
+        다음 프레임을 기다려 반환합니다. (블로킹)
+
+        Returns:
+            Optional[Tuple[float, np.ndarray]]: (영상 내 위치(초), RGB 프레임), 파일 끝이면 None
+        """
+        return self._queue.get()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        디코딩 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 디코딩 프레임 수, 평균 디코딩 시간 (밀리초)
+        """
+        return {
+            "frames_decoded": float(self.frames_decoded),
+            "decode_mean_ms": self.total_decode_ms / (self.frames_decoded or 1),
+        }
+
+
+def build_frame_data(
+    frame_id: int,
+    landmarks: np.ndarray,
+    timestamp: Optional[datetime] = None,
+    camera_id: str = "0",
+) -> FrameData:
+    """
+    랜드마크 배열로 프레임 데이터를 생성합니다.
     
+    키포인트 객체를 만들지 않고 배열을 그대로 담으며,
+    눈 거리는 벡터화된 계산으로 한 번에 구합니다.
+
     Args:
-        landmarks: MediaPipe 랜드마크 목록
-        
+        frame_id: 프레임 ID
+        landmarks: (33, 4) 랜드마크 배열
+        timestamp: 프레임 시각 (없으면 현재 시각)
+        camera_id: 카메라 ID
+
     Returns:
-        Dict[str, PoseKeypoint]: 키포인트 정보 사전
-    """
-    keypoint_map = {
-        "left_eye_inner": 1,
-        "left_eye_outer": 3,
-        "right_eye_inner": 4,
-        "right_eye_outer": 6,
-        "nose": 0,
-        "left_shoulder": 11,
-        "right_shoulder": 12,
-        "left_elbow": 13,
-        "right_elbow": 14,
-        "left_hip": 23,
-        "right_hip": 24,
-    }
-    
-    result = {}
-    for name, idx in keypoint_map.items():
-        landmark = landmarks.landmark[idx]
-        result[name] = PoseKeypoint(
-            x=landmark.x,
-            y=landmark.y,
-            z=landmark.z,
-            visibility=landmark.visibility
+        FrameData: 프레임 데이터
+    """
+    landmark_array = LandmarkArray(landmarks)
+    left_eye_distance, right_eye_distance = landmark_array.eye_distances()
+
+    return FrameData(
+        timestamp=timestamp or datetime.now(),
+        frame_id=frame_id,
+        camera_id=camera_id,
+        landmarks=landmark_array,
+        eye_distance_left=left_eye_distance,
+        eye_distance_right=right_eye_distance,
+        # 리소스 사용량을 줄이기 위해 원본 이미지 전송하지 않음
+        # raw_image=cv2.imencode('.jpg', frame)[1].tobytes()
+    )
+
+
+def local_pose_infer(pose, rgb_frame: np.ndarray) -> Optional[np.ndarray]:
+    """
+    현재 프로세스의 MediaPipe Pose 로 추론합니다.
+
+    Args:
+        pose: MediaPipe Pose 인스턴스
+        rgb_frame: RGB 프레임
+
+    Returns:
+        Optional[np.ndarray]: (33, 4) 랜드마크 배열, 사람이 없으면 None
+    """
+    results = pose.process(rgb_frame)
+    if not results.pose_landmarks:
+        return None
+    return LandmarkArray.from_mediapipe(results.pose_landmarks).data
+
+
+class PoseEstimator:
+    """
+    포즈 추론기
+
+    추론 백엔드(현재 프로세스 또는 `PoseWorkerProcess`), ROI 추적, 움직임 게이트,
+    광학 흐름 추적을 묶어 RGB 프레임에서 전체 프레임 좌표계의 랜드마크 배열을 얻습니다.
+    """
+
+    def __init__(self, config: AppConfig, offload: bool = True):
+        """
+        포즈 추론기 초기화
+
+        Args:
+            config: 애플리케이션 설정
+            offload: 현재 프로세스 추론을 워커 스레드에서 실행할지 여부
+        """
+        sensors = config.sensors
+        self.offload = offload
+        self.pose = mp_pose.Pose(
+            min_detection_confidence=0.5,
+            min_tracking_confidence=0.5
         )
-    
-    return result
+        self.worker: Optional[PoseWorkerProcess] = None
+        if sensors.pose_backend == "process":
+            self.worker = PoseWorkerProcess()
+        elif sensors.pose_backend != "local":
+            logger.warning(f"알 수 없는 포즈 추론 방식: {sensors.pose_backend}, local 로 동작합니다")
 
+        self.roi: Optional[RoiTracker] = None
+        if sensors.roi_tracking:
+            self.roi = RoiTracker(
+                padding=sensors.roi_padding,
+                min_visibility=sensors.roi_min_visibility,
+            )
 
-async def webcam_sensor(config: AppConfig) -> None:
+        self.motion: Optional[MotionGate] = None
+        if sensors.motion_gating:
+            self.motion = MotionGate(
+                threshold=sensors.motion_threshold,
+                max_reuse_age=sensors.motion_max_reuse_age,
+            )
+
+        self.flow: Optional[LandmarkFlowTracker] = None
+        if sensors.flow_tracking:
+            self.flow = LandmarkFlowTracker(
+                inference_fps=sensors.flow_inference_fps,
+                max_error=sensors.flow_max_error,
+            )
+
+        self.inferences = 0
+        self.total_infer_ms = 0.0
+
+    async def estimate(self, rgb_frame: np.ndarray) -> Optional[np.ndarray]:
+        """
+        프레임에서 랜드마크를 추론합니다.
+
+        Args:
+            rgb_frame: RGB 프레임
+
+        Returns:
+            Optional[np.ndarray]: (33, 4) 랜드마크 배열, 사람이 없으면 None
+        """
+        # 장면 변화가 없으면 이전 결과 재사용
+        if self.motion is not None and not self.motion.check(rgb_frame):
+            return self.motion.landmarks
+        
+        # 추론 사이 프레임은 광학 흐름으로 추적
+        if self.flow is not None:
+            tracked = self.flow.track(rgb_frame)
+            if tracked is not None:
+                if self.motion is not None:
+                    self.motion.remember(tracked)
+                return tracked
+        
+        box = None
+        target = rgb_frame
+        if self.roi is not None:
+            target, box = self.roi.crop(rgb_frame)
+
+        started = time.perf_counter()
+        landmarks = await self._infer(target)
+        self.inferences += 1
+        self.total_infer_ms += (time.perf_counter() - started) * 1000.0
+
+        if self.roi is not None:
+            landmarks = self.roi.update(landmarks, box, rgb_frame.shape)
+        if self.flow is not None:
+            self.flow.reset(rgb_frame, landmarks)
+        if self.motion is not None:
+            self.motion.remember(landmarks)
+        return landmarks
+
+    async def _infer(self, rgb_frame: np.ndarray) -> Optional[np.ndarray]:
+        """설정된 백엔드로 추론하고, 워커 오류 시 현재 프로세스 추론으로 전환"""
+        if self.worker is not None:
+            try:
+                return await asyncio.to_thread(self.worker.infer, rgb_frame)
+            except RuntimeError as e:
+                logger.error(f"포즈 워커 오류: {e}, 현재 프로세스 추론으로 전환")
+                self.worker.stop()
+                self.worker = None
+        if self.offload:
+            return await asyncio.to_thread(local_pose_infer, self.pose, rgb_frame)
+        return local_pose_infer(self.pose, rgb_frame)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        추론 통계를 반환합니다.
+
+        Returns:
+            Dict[str, float]: 추론 횟수, 평균 추론 시간 (밀리초) 및 백엔드별 통계
+        """
+        stats = {
+            "inferences": float(self.inferences),
+            "infer_mean_ms": self.total_infer_ms / (self.inferences or 1),
+        }
+        if self.worker is not None:
+            stats.update(self.worker.stats())
+        if self.roi is not None:
+            stats.update(self.roi.stats())
+        if self.motion is not None:
+            stats.update(self.motion.stats())
+        if self.flow is not None:
+            stats.update(self.flow.stats())
+        return stats
+
+    def close(self) -> None:
+        """추론 자원을 해제합니다."""
+        if self.worker is not None:
+            self.worker.stop()
+            self.worker = None
+        self.pose.close()
+
+
+async def camera_worker(
+    config: AppConfig,
+    camera_id: str,
+    device_id: Optional[int] = None,
+    presence: Optional[PresenceDetector] = None,
+    on_presence: Optional[Callable[[str], Awaitable[None]]] = None,
+    grabbers: Optional[Dict[str, FrameGrabber]] = None,
+) -> None:
     """
-    웹캠 센서 작업을 실행합니다.
+    카메라 한 대(또는 영상 파일)의 캡처/추론 작업을 실행합니다.
+    
+    `webcam_capture_mode` 가 "threaded" 이면 캡처는 `FrameGrabber` 스레드에서,
+    포즈 추론은 워커 스레드에서 수행되어 이벤트 루프를 막지 않습니다.
+    "inline" 이면 기존처럼 이벤트 루프 안에서 직접 처리합니다.
+    추론 백엔드와 ROI 추적은 `PoseEstimator` 가 담당합니다.
+    `demand_scheduling` 이 켜져 있으면 자세 평가기가 발행한 SCHEDULE 이벤트에 맞춰
+    평가 직전 구간과 keep-alive 프레임만 추론합니다.
+    `video_path` 가 지정되면 웹캠 대신 영상 파일의 모든 프레임을 대기 없이 처리하고,
+    파일 끝에서 처리 속도(FPS)를 보고한 뒤 종료합니다.
+    웹캠을 열 수 없거나 연결이 끊기면 `CameraReconnector` 가 백오프로 재연결하며,
+    연결 상태는 SYSTEM camera_health 이벤트로 알립니다.
+    `quality_filter` 가 켜져 있으면 흐리거나 너무 어둡거나 밝은 프레임은 추론 전에 제외합니다.
+    `presence` 가 주어지면 자리 비움 동안 `presence_idle_interval` 간격으로만 캡처/추론합니다.
+    발행 전 랜드마크는 `LandmarkSmoother` 로 평활화하고, `FrameData` 에 카메라 ID 를 기록합니다.
     
     Args:
         config: 애플리케이션 설정
+        camera_id: 발행하는 프레임에 기록할 카메라 ID
+        device_id: 웹캠 장치 ID (None 이면 `video_path` 영상 파일)
+        presence: 카메라 간에 공유하는 재석 감지기 (카메라별로 검출 횟수를 따로 셈)
+        on_presence: 재석 상태가 바뀌었을 때 호출할 콜백
+        grabbers: 카메라 ID → 캡처 스레드 (자리 비움 시 캡처 간격 조정용)
     """
-    logger.info("웹캠 센서 시작")
+    logger.info(f"카메라 {camera_id} 작업 시작")
     bus = get_event_bus()
     
+    cap = None
+    grabber: Optional[FrameGrabber] = None
+    frame_id = 0
+    
+    reader: Optional[VideoFileReader] = None
+    video_path = config.sensors.video_path if device_id is None else None
+    
+    capture_mode = config.sensors.webcam_capture_mode
+    if capture_mode not in ("threaded", "inline"):
+        logger.warning(f"알 수 없는 웹캠 캡처 방식: {capture_mode}, threaded 로 동작합니다")
+        capture_mode = "threaded"
+    if video_path:
+        # 영상 파일은 디코딩 스레드 + 추론 스레드로 처리
+        capture_mode = "video"
+    
     # MediaPipe Pose 초기화
-    pose = mp_pose.Pose(
-        min_detection_confidence=0.5,
-        min_tracking_confidence=0.5
+    estimator = PoseEstimator(config, offload=capture_mode != "inline")
+    
+    # 수요 기반 추론: 자세 평가기의 다음 평가 시각을 구독
+    scheduler: Optional[InferenceScheduler] = None
+    schedule_unsub = None
+    if config.sensors.demand_scheduling and video_path:
+        logger.warning("영상 파일 입력에서는 수요 기반 추론을 사용하지 않습니다")
+    elif config.sensors.demand_scheduling:
+        scheduler = InferenceScheduler(
+            window=config.sensors.demand_window,
+            keepalive_interval=config.sensors.demand_keepalive_interval,
+            check_interval=config.processing.check_interval_max,
+        )
+        
+        def on_schedule(event: Event) -> None:
+            schedule: CheckSchedule = event.data
+            scheduler.update(schedule.next_check_time)
+        
+        schedule_unsub = bus.subscribe(EventType.SCHEDULE, on_schedule)
+    
+    # 흐리거나 노출이 맞지 않는 프레임은 추론 전에 제외
+    quality: Optional[FrameQualityFilter] = None
+    if config.sensors.quality_filter:
+        quality = FrameQualityFilter(
+            min_sharpness=config.sensors.quality_min_sharpness,
+            min_brightness=config.sensors.quality_min_brightness,
+            max_brightness=config.sensors.quality_max_brightness,
+            max_clipped_ratio=config.sensors.quality_max_clipped_ratio,
+        )
+    
+    # 발행 전 랜드마크 평활화
+    smoother: Optional[LandmarkSmoother] = None
+    smoothing = config.sensors.landmark_smoothing
+    if smoothing not in ("one_euro", "ema", "none"):
+        logger.warning(f"알 수 없는 랜드마크 평활화 방식: {smoothing}, 평활화하지 않습니다")
+    elif smoothing != "none":
+        smoother = LandmarkSmoother(
+            method=smoothing,
+            min_cutoff=config.sensors.smoothing_min_cutoff,
+            beta=config.sensors.smoothing_beta,
+            d_cutoff=config.sensors.smoothing_d_cutoff,
+            ema_alpha=config.sensors.smoothing_ema_alpha,
+            overrides=config.sensors.smoothing_overrides,
+        )
+    
+    sensors = config.sensors
+    if grabbers is None:
+        grabbers = {}
+    
+    def frame_interval() -> float:
+        """자리 비움 동안의 캡처 간격 (재석 시 0)"""
+        return _idle_interval(config, presence)
+    
+    # 웹캠 재연결 관리 (다중 카메라면 다른 카메라의 장치를 가져가지 않도록 자기 장치만 시도)
+    reconnector = CameraReconnector(
+        device_id=sensors.webcam_device_id if device_id is None else device_id,
+        scan_devices=sensors.webcam_scan_devices if len(sensors.camera_devices()) == 1 else 0,
+        initial_backoff=sensors.webcam_reconnect_initial_backoff,
+        max_backoff=sensors.webcam_reconnect_max_backoff,
+        open_timeout=sensors.webcam_open_timeout,
     )
     
-    cap = None
-    frame_id = 0
+    async def publish_health(status: str, details: Dict) -> None:
+        await bus.publish(Event(
+            type=EventType.SYSTEM,
+            data={"source": "webcam", "kind": "camera_health", "camera_id": camera_id,
+                  "status": status, **details}
+        ))
+    
+    # 재연결 후에도 같은 캡처 모드를 사용 (탐색은 처음 한 번만)
+    capture_settings: Optional[Tuple] = None
+    
+    async def open_webcam() -> cv2.VideoCapture:
+        nonlocal capture_settings
+        cap, opened_device = await reconnector.connect(publish_health)
+        logger.info(
+            f"웹캠 연결됨: 카메라 {camera_id}, 장치 ID {opened_device} (캡처 방식: {capture_mode})"
+        )
+        
+        # 캡처 모드 설정 (탐색 시 후보 중 가장 저렴한 모드 선택)
+        if capture_settings is None and sensors.webcam_probe:
+            chosen, _ = await asyncio.to_thread(
+                probe_capture_modes,
+                cap,
+                sensors.webcam_probe_modes,
+                lambda rgb: local_pose_infer(estimator.pose, rgb),
+                sensors.webcam_probe_min_confidence,
+                sensors.webcam_fps,
+                sensors.webcam_probe_frames,
+            )
+            if chosen is not None:
+                capture_settings = (
+                    chosen["width"], chosen["height"], sensors.webcam_fps, chosen["fourcc"]
+                )
+        else:
+            if capture_settings is None:
+                capture_settings = (
+                    sensors.webcam_width,
+                    sensors.webcam_height,
+                    sensors.webcam_fps,
+                    sensors.webcam_fourcc,
+                )
+            chosen = configure_capture(cap, *capture_settings)
+        if chosen is not None:
+            logger.info(
+                f"웹캠 캡처 모드 ({camera_id}): " + ", ".join(f"{k}={v}" for k, v in chosen.items())
+            )
+            await bus.publish(Event(
+                type=EventType.SYSTEM,
+                data={"source": "webcam", "kind": "capture_mode", "camera_id": camera_id, **chosen}
+            ))
+        return cap
+    
+    # 루프 지연 측정 (드롭 프레임과 함께 주기적으로 보고)
+    lag_monitor = LoopLagMonitor()
+    lag_task = asyncio.create_task(lag_monitor.run())
+    stats_interval = config.sensors.webcam_stats_interval
+    last_report = time.monotonic()
     
     try:
-        # 웹캠 초기화
-        device_id = config.sensors.webcam_device_id
-        cap = cv2.VideoCapture(device_id)
+        if video_path:
+            # 영상 파일 초기화
+            cap = cv2.VideoCapture(video_path)
+            if not cap.isOpened():
+                logger.error(f"영상 파일을 열 수 없습니다: {video_path}")
+                return
+            logger.info(f"영상 파일 입력: {video_path}")
+            reader = VideoFileReader(
+                cap,
+                queue_size=config.sensors.video_queue_size,
+                flip=config.sensors.video_flip,
+            )
+            reader.start()
+            video_start = datetime.now()
+        else:
+            # 웹캠 초기화 (열릴 때까지 재시도)
+            cap = await open_webcam()
         
-        if not cap.isOpened():
-            logger.error(f"웹캠을 열 수 없습니다: 장치 ID {device_id}")
-            return
+        if capture_mode == "threaded":
+            grabber = FrameGrabber(cap, buffer_size=config.sensors.webcam_buffer_size)
+            grabber.start()
+            grabbers[camera_id] = grabber
         
-        logger.info(f"웹캠 연결됨: 장치 ID {device_id}")
+        processed = 0
+        loop_started = time.perf_counter()
+        inline_frames = 0
+        inline_preprocess_ms = 0.0
+        inline_failures = 0
         
         # 웹캠 프레임 처리 루프
         while True:
-            # CPU 부하 방지를 위한 지연
-            await asyncio.sleep(0.03)  # 약 30 FPS
+            # CPU 부하 방지를 위한 지연 (영상 파일은 대기 없이 처리)
+            if reader is None:
+                # 약 30 FPS, 자리 비움 동안은 presence_idle_interval 간격
+                await asyncio.sleep(frame_interval() or 0.03)
             
-            # 프레임 읽기
-            ret, frame = cap.read()
-            if not ret:
-                logger.warning("웹캠에서 프레임을 읽을 수 없습니다")
-                await asyncio.sleep(1)
+            # 드롭 프레임 및 루프 지연 통계 보고
+            now = time.monotonic()
+            if stats_interval > 0 and now - last_report >= stats_interval:
+                last_report = now
+                stats = lag_monitor.snapshot(reset=True)
+                if grabber is not None:
+                    stats.update(grabber.stats())
+                if reader is not None:
+                    stats.update(reader.stats())
+                if capture_mode == "inline":
+                    stats["preprocess_mean_ms"] = inline_preprocess_ms / (inline_frames or 1)
+                stats.update(estimator.stats())
+                if scheduler is not None:
+                    stats.update(scheduler.stats())
+                if reader is None:
+                    stats.update(reconnector.stats())
+                if quality is not None:
+                    stats.update(quality.stats())
+                if smoother is not None:
+                    stats.update(smoother.stats())
+                stats["frames_published"] = float(frame_id)
+                logger.info(
+                    f"웹캠 통계 ({camera_id}): " + ", ".join(f"{k}={v:.1f}" for k, v in stats.items())
+                )
+                await bus.publish(Event(
+                    type=EventType.SYSTEM,
+                    data={"source": "webcam", "kind": "stats", "camera_id": camera_id, **stats}
+                ))
+            
+            frame_time: Optional[datetime] = None
+            if reader is not None:
+                # 디코딩 스레드의 다음 프레임 (버리지 않음)
+                item = await asyncio.to_thread(reader.read)
+                if item is None:
+                    elapsed = time.perf_counter() - loop_started
+                    fps = processed / elapsed if elapsed > 0 else 0.0
+                    logger.info(
+                        f"영상 파일 처리 완료: {processed} 프레임, "
+                        f"{elapsed:.1f}초, {fps:.1f} FPS"
+                    )
+                    await bus.publish(Event(
+                        type=EventType.SYSTEM,
+                        data={"source": "webcam", "kind": "video_done", "camera_id": camera_id,
+                              "frames": float(processed), "elapsed_s": elapsed,
+                              "fps": fps, **estimator.stats()}
+                    ))
+                    break
+                position, rgb_frame = item
+                # 영상 내 위치를 프레임 시각으로 사용
+                frame_time = video_start + timedelta(seconds=position)
+            elif grabber is not None:
+                # 캡처 스레드의 최신 프레임만 사용 (오래된 프레임은 드롭)
+                item = grabber.latest()
+                if item is None:
+                    if grabber.is_stalled(sensors.webcam_failure_threshold, sensors.webcam_stale_timeout):
+                        # 장치가 빠진 경우 핸들을 닫고 재연결
+                        await publish_health("lost", {"read_failures": float(grabber.consecutive_failures)})
+                        grabber.stop()
+                        cap.release()
+                        cap = await open_webcam()
+                        grabber = FrameGrabber(cap, buffer_size=sensors.webcam_buffer_size)
+                        grabber.frame_interval = frame_interval()
+                        grabber.start()
+                        grabbers[camera_id] = grabber
+                    continue
+                _, _, rgb_frame = item
+            else:
+                # 프레임 읽기
+                ret, frame = cap.read()
+                if not ret:
+                    inline_failures += 1
+                    logger.warning("웹캠에서 프레임을 읽을 수 없습니다")
+                    if inline_failures >= sensors.webcam_failure_threshold:
+                        # 죽은 핸들을 계속 읽지 않고 재연결
+                        await publish_health("lost", {"read_failures": float(inline_failures)})
+                        cap.release()
+                        cap = await open_webcam()
+                        inline_failures = 0
+                    else:
+                        await asyncio.sleep(0.2)
+                    continue
+                inline_failures = 0
+                
+                # 프레임 처리
+                started = time.perf_counter()
+                rgb_frame = preprocess_frame(frame)  # 좌우 반전 (거울 효과) + RGB 변환
+                inline_preprocess_ms += (time.perf_counter() - started) * 1000.0
+                inline_frames += 1
+            
+            # 다음 평가 시각과 무관한 프레임은 추론하지 않음
+            if scheduler is not None and not scheduler.should_infer():
                 continue
             
-            # 프레임 처리
-            frame = cv2.flip(frame, 1)  # 좌우 반전 (거울 효과)
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            # 품질 미달 프레임은 추론하지 않음 (재석 판단에도 사용하지 않음)
+            if quality is not None and quality.check(rgb_frame) is not None:
+                continue
             
             # MediaPipe Pose 처리
-            results = pose.process(rgb_frame)
+            landmarks = await estimator.estimate(rgb_frame)
+            processed += 1
             
-            if results.pose_landmarks:
-                # 키포인트 추출
-                keypoints = extract_keypoints(results.pose_landmarks)
-                
-                # 눈 거리 계산
-                landmarks = results.pose_landmarks.landmark
-                left_eye_inner = landmarks[1]
-                left_eye_outer = landmarks[3]
-                right_eye_inner = landmarks[4]
-                right_eye_outer = landmarks[6]
-                
-                left_eye_distance = calculate_distance(left_eye_inner, left_eye_outer)
-                right_eye_distance = calculate_distance(right_eye_inner, right_eye_outer)
+            if presence is not None:
+                state = presence.update_frame(landmarks is not None, camera_id)
+                if state is not None and on_presence is not None:
+                    await on_presence(state)
+            
+            if landmarks is not None:
+                if frame_time is None:
+                    frame_time = datetime.now()
+                if smoother is not None:
+                    landmarks = smoother(landmarks, frame_time.timestamp())
                 
                 # 이벤트 생성 및 발행
-                frame_data = FrameData(
-                    frame_id=frame_id,
-                    keypoints=keypoints,
-                    eye_distance_left=left_eye_distance,
-                    eye_distance_right=right_eye_distance,
-                    # 리소스 사용량을 줄이기 위해 원본 이미지 전송하지 않음
-                    # raw_image=cv2.imencode('.jpg', frame)[1].tobytes()
-                )
+                frame_data = build_frame_data(frame_id, landmarks, frame_time, camera_id)
                 
                 event = Event(
                     type=EventType.FRAME,
@@ -155,12 +796,101 @@ async def webcam_sensor(config: AppConfig) -> None:
                 frame_id += 1
             
     except asyncio.CancelledError:
-        logger.info("웹캠 센서 태스크 취소됨")
+        logger.info(f"카메라 {camera_id} 작업 취소됨")
     except Exception as e:
-        logger.exception(f"웹캠 센서 오류: {e}")
+        logger.exception(f"카메라 {camera_id} 오류: {e}")
     finally:
         # 자원 해제
+        lag_task.cancel()
+        if schedule_unsub is not None:
+            schedule_unsub()
+        if grabber is not None:
+            grabber.stop()
+            grabbers.pop(camera_id, None)
+        if presence is not None:
+            presence.remove_camera(camera_id)
+        if reader is not None:
+            reader.stop()
         if cap is not None:
             cap.release()
-        pose.close()
-        logger.info("웹캠 센서 종료") 
\ No newline at end of file
+        estimator.close()
+        logger.info(f"카메라 {camera_id} 작업 종료")
+
+
+def _idle_interval(config: AppConfig, presence: Optional[PresenceDetector]) -> float:
+    """자리 비움 동안의 캡처 간격 (재석이거나 감지하지 않으면 0)"""
+    if presence is not None and not presence.present:
+        return config.sensors.presence_idle_interval
+    return 0.0
+
+
+async def webcam_sensor(config: AppConfig) -> None:
+    """
+    웹캠 센서 작업을 실행합니다.
+    
+    `camera_devices()` 의 카메라마다 `camera_worker` 를 하나씩 실행합니다.
+    각 카메라는 자체 캡처 스레드와 포즈 추론기(`pose_backend` 가 "process" 이면 별도 프로세스)를
+    가지므로 카메라 수만큼 CPU 코어에 분산되고, 이벤트 루프는 결과 발행만 담당합니다.
+    `video_path` 가 지정되면 웹캠 대신 영상 파일 하나를 처리합니다.
+    `presence_detection` 이 켜져 있으면 모든 카메라가 공유하는 `PresenceDetector` 로
+    (어느 카메라든 방석이든 사용자를 보면 재석)
+    자리 비움을 판단해 SYSTEM presence 이벤트로 알리고, 자리 비움 동안
+    모든 카메라를 `presence_idle_interval` 간격으로만 동작시킵니다.
+    
+    Args:
+        config: 애플리케이션 설정
+    """
+    logger.info("웹캠 센서 시작")
+    bus = get_event_bus()
+    sensors = config.sensors
+    
+    if sensors.opencv_threads is not None:
+        cv2.setNumThreads(sensors.opencv_threads)
+    
+    # 카메라 ID → 캡처 스레드
+    grabbers: Dict[str, FrameGrabber] = {}
+    
+    # 재석 감지: 방석 압력과 (모든 카메라의) 랜드마크 검출 여부로 자리 비움 판단
+    presence: Optional[PresenceDetector] = None
+    pressure_unsub = None
+    
+    async def publish_presence(state: str) -> None:
+        logger.info(f"재석 상태 변경: {state}")
+        for grabber in grabbers.values():
+            grabber.frame_interval = _idle_interval(config, presence)
+        await bus.publish(Event(
+            type=EventType.SYSTEM,
+            data={"source": "webcam", "kind": "presence", "status": state, **presence.stats()}
+        ))
+    
+    if sensors.presence_detection and not sensors.video_path:
+        presence = PresenceDetector(
+            cushion_floor=sensors.presence_cushion_floor,
+            absent_frames=sensors.presence_absent_frames,
+            return_frames=sensors.presence_return_frames,
+        )
+        
+        async def on_pressure(event: Event) -> None:
+            state = presence.update_pressure(latest_pressure(event.data).cushion_value)
+            if state is not None:
+                await publish_presence(state)
+        
+        pressure_unsub = bus.subscribe(EventType.PRESSURE, on_pressure)
+    
+    try:
+        if sensors.video_path:
+            await camera_worker(config, "video")
+        else:
+            await asyncio.gather(*(
+                camera_worker(
+                    config, str(device_id), device_id,
+                    presence=presence, on_presence=publish_presence, grabbers=grabbers,
+                )
+                for device_id in sensors.camera_devices()
+            ))
+    except asyncio.CancelledError:
+        logger.info("웹캠 센서 태스크 취소됨")
+    finally:
+        if pressure_unsub is not None:
+            pressure_unsub()
+        logger.info("웹캠 센서 종료")
@@ -370,6 +370,9 @@ class UIState:
         self.last_update_time = datetime.now()
         self.calibration_complete = False
         self.start_time: Optional[datetime] = None
+        self.away = False
+        # Streamlit 앱이 읽는 상태 파일
+        self.state_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp_state.json")
     
     def update_from_result(self, result: PostureResult) -> bool:
         """
@@ -436,17 +439,39 @@ class UIState:
             # 보정 완료시 상태 파일 업데이트
             self._save_state_to_file()
     
-    def _save_state_to_file(self) -> None:
+    def set_away(self, away: bool) -> None:
         """
-        현재 UI 상태를 임시 파일에 저장
+        자리 비움 상태 반영 - 전환 시 한 번만 기록하고, 자리 비움 동안은 상태 파일을 쓰지 않음
+        
+        Args:
+            away: 자리 비움 여부
         """
+        if away == self.away:
+            return
+        if away:
+            self.away = True
+            self.message = "자리를 비운 동안 자세 평가를 멈춥니다."
+            # 자리 비움 전환 기록 (away: true) 은 강제로 기록
+            self._save_state_to_file(force=True)
+        else:
+            self.away = False
+            self.message = "다시 오셨네요! 자세 평가를 재개합니다."
+            self._save_state_to_file()
+    
+    def _save_state_to_file(self, force: bool = False) -> None:
+        """
+        현재 UI 상태를 임시 파일에 저장 (자리 비움 동안은 기록하지 않음)
+        
+        Args:
+            force: 자리 비움 중이어도 기록 (자리 비움 전환 기록용)
+        """
+        if self.away and not force:
+            return
         try:
-            import json
-            import os
-            
             # 저장할 데이터 준비
             data = {
                 "score": self.score,
+                "away": self.away,
                 "status": self.status,
                 "message": self.message,
                 "details": self.details,
@@ -455,12 +480,8 @@ class UIState:
                 "timestamp": datetime.now().isoformat()  # 파일 생성 시간 추가
             }
             
-            # 임시 파일 경로 설정
-            dir_path = os.path.dirname(os.path.abspath(__file__))
-            file_path = os.path.join(dir_path, "temp_state.json")
-            
             # 파일에 데이터 저장 (즉시 플러시)
-            with open(file_path, "w") as f:
+            with open(self.state_file, "w") as f:
                 json.dump(data, f, ensure_ascii=False)  # 한글 인코딩 보존
                 f.flush()
                 os.fsync(f.fileno())  # 파일 시스템에 즉시 반영
@@ -526,6 +547,11 @@ async def ui_processor(config: AppConfig) -> None:
         ui_state.update_from_calibration(calibration)
         logger.info("UI 처리기: 보정 데이터 수신 완료")
     
+    async def on_system(event: Event) -> None:
+        data = event.data
+        if isinstance(data, dict) and data.get("kind") == "presence":
+            ui_state.set_away(data.get("status") == "away")
+    
     # 명령 파일 확인 함수
     async def check_command_file():
         try:
@@ -561,6 +587,7 @@ async def ui_processor(config: AppConfig) -> None:
     # 이벤트 구독
     result_unsub = bus.subscribe(EventType.POSTURE_RESULT, on_posture_result)
     cal_unsub = bus.subscribe(EventType.CALIBRATION, on_calibration)
+    system_unsub = bus.subscribe(EventType.SYSTEM, on_system)
     
     try:
         # 상태 업데이트 루프 - 더 자주 실행되도록 수정
@@ -571,8 +598,8 @@ async def ui_processor(config: AppConfig) -> None:
                 await check_command_file()
                 last_command_check = current_time
             
-            # 짧은 간격으로 처리
-            await asyncio.sleep(0.05)
+            # 짧은 간격으로 처리 (자리 비움 동안은 명령 확인 주기로만 깨어남)
+            await asyncio.sleep(0.5 if ui_state.away else 0.05)
     
     except asyncio.CancelledError:
         logger.info("UI 처리기 태스크 취소됨")
@@ -582,4 +609,5 @@ async def ui_processor(config: AppConfig) -> None:
         # 구독 해제
         result_unsub()
         cal_unsub()
+        system_unsub()
         logger.info("UI 처리기 종료") 
\ No newline at end of file
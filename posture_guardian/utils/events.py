@@ -5,7 +5,11 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Tuple, Union
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+
+from posture_guardian.utils.landmarks import LandmarkArray
+from posture_guardian.utils.pressure_mat import cushion_value
 
 
 class EventType(str, Enum):
@@ -16,6 +20,7 @@ class EventType(str, Enum):
     CALIBRATION = "calibration"       # 보정 데이터
     COMMAND = "command"               # 시스템 명령
     SYSTEM = "system"                 # 시스템 상태
+    SCHEDULE = "schedule"             # 다음 자세 평가 예정 시각
 
 
 class PoseKeypoint(BaseModel):
@@ -28,13 +33,23 @@ class PoseKeypoint(BaseModel):
 
 class FrameData(BaseModel):
     """웹캠에서 처리된 프레임 데이터"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     timestamp: datetime = Field(default_factory=datetime.now, description="타임스탬프")
     frame_id: int = Field(..., description="프레임 ID")
-    keypoints: Dict[str, PoseKeypoint] = Field(..., description="키포인트 정보")
+    camera_id: str = Field("0", description="카메라 ID (웹캠 장치 ID 또는 video)")
+    keypoints: Dict[str, PoseKeypoint] = Field(default_factory=dict, description="키포인트 정보 (landmarks 가 있으면 생략 가능)")
+    landmarks: Optional[LandmarkArray] = Field(None, description="배열 기반 랜드마크 (33, 4)")
     eye_distance_left: Optional[float] = Field(None, description="왼쪽 눈 내부-외부 거리")
     eye_distance_right: Optional[float] = Field(None, description="오른쪽 눈 내부-외부 거리")
     raw_image: Optional[bytes] = Field(None, description="원본 이미지 바이너리")
 
+    def get_keypoints(self) -> Dict[str, PoseKeypoint]:
+        """키포인트 사전 반환 (배열만 있으면 이때 변환)"""
+        if not self.keypoints and self.landmarks is not None:
+            return self.landmarks.to_keypoints()
+        return self.keypoints
+
 
 class PressureData(BaseModel):
     """압력 센서 데이터"""
@@ -42,6 +57,105 @@ class PressureData(BaseModel):
     foot_value: int = Field(..., ge=1, le=1024, description="발받침대 압력값 (1-1024)")
     cushion_value: int = Field(..., ge=1, le=1024, description="방석 압력값 (1-1024)")
     source: str = Field("arduino", description="데이터 소스 (arduino 또는 simulation)")
+    cells: Optional[List[int]] = Field(None, description="다채널 매트 셀 압력값 (있으면 cushion_value 는 셀 평균)")
+
+
+class PressureBlock(BaseModel):
+    """
+    압력 센서 샘플 묶음
+
+    시리얼 리더가 한 번에 읽은 샘플을 연속 배열로 담아 이벤트 하나로 발행합니다.
+    값은 생성하는 쪽에서 1~1024 로 제한되어 있어야 합니다. (샘플별 검증 생략)
+    """
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    timestamps: np.ndarray = Field(..., description="샘플 수신 시각 (N,) epoch 초")
+    foot_values: np.ndarray = Field(..., description="발받침대 압력값 (N,) int32")
+    cushion_values: np.ndarray = Field(..., description="방석 압력값 (N,) int32 (매트면 셀 평균)")
+    cells: Optional[np.ndarray] = Field(None, description="다채널 매트 셀 압력값 (N, 셀 수) int32")
+    source: str = Field("arduino", description="데이터 소스 (arduino 또는 simulation)")
+
+    @classmethod
+    def from_arrays(cls, timestamps: np.ndarray, values: np.ndarray, source: str = "arduino") -> "PressureBlock":
+        """
+        (N,) 시각 배열과 (N, 채널 수) 값 배열로 묶음을 만듭니다.
+
+        채널이 2개면 [발받침대, 방석], 더 많으면 [발받침대, 매트 셀...] 이며
+        매트의 방석 값은 셀 평균입니다.
+
+        Args:
+            timestamps: 수신 시각 (epoch 초)
+            values: (N, 채널 수) 압력값
+            source: 데이터 소스
+
+        Returns:
+            PressureBlock: 압력 샘플 묶음
+        """
+        values = np.atleast_2d(np.asarray(values, dtype=np.int32))
+        cells = None
+        if values.shape[1] > 2:
+            cells = np.ascontiguousarray(values[:, 1:])
+            cushion = cushion_value(cells)
+        else:
+            cushion = np.ascontiguousarray(values[:, 1])
+        return cls(
+            timestamps=np.asarray(timestamps, dtype=np.float64),
+            foot_values=np.ascontiguousarray(values[:, 0]),
+            cushion_values=cushion,
+            cells=cells,
+            source=source,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def sample(self, index: int) -> PressureData:
+        """샘플 하나를 PressureData 로 반환 (검증 생략)"""
+        return PressureData.model_construct(
+            timestamp=datetime.fromtimestamp(float(self.timestamps[index])),
+            foot_value=int(self.foot_values[index]),
+            cushion_value=int(self.cushion_values[index]),
+            source=self.source,
+            cells=None if self.cells is None else self.cells[index].tolist(),
+        )
+
+    def latest(self) -> PressureData:
+        """가장 최근 샘플"""
+        return self.sample(-1)
+
+    def samples(self) -> List[PressureData]:
+        """모든 샘플을 PressureData 목록으로 반환"""
+        return [self.sample(index) for index in range(len(self))]
+
+
+def pressure_samples(data: Union[PressureData, PressureBlock]) -> List[PressureData]:
+    """
+    PRESSURE 이벤트 데이터를 샘플 단위 PressureData 목록으로 변환합니다.
+
+    Args:
+        data: 단일 압력 데이터 또는 압력 샘플 묶음
+
+    Returns:
+        List[PressureData]: 샘플 목록 (시간 순)
+    """
+    if isinstance(data, PressureBlock):
+        return data.samples()
+    return [data]
+
+
+def latest_pressure(data: Union[PressureData, PressureBlock]) -> PressureData:
+    """
+    PRESSURE 이벤트 데이터의 가장 최근 샘플을 반환합니다.
+
+    Args:
+        data: 단일 압력 데이터 또는 압력 샘플 묶음
+
+    Returns:
+        PressureData: 가장 최근 샘플
+    """
+    if isinstance(data, PressureBlock):
+        return data.latest()
+    return data
 
 
 class CalibrationData(BaseModel):
@@ -50,6 +164,7 @@ class CalibrationData(BaseModel):
     baseline_foot: float = Field(..., description="발받침대 기준값")
     baseline_cushion: float = Field(..., description="방석 기준값")
     baseline_eye_distance_ratio: float = Field(..., description="눈 거리 비율 기준값")
+    baseline_lr_balance: Optional[float] = Field(None, description="다채널 매트 좌우 균형 기준값 (없으면 0)")
     completed: bool = Field(False, description="보정 완료 여부")
 
 
@@ -71,6 +186,12 @@ class PostureResult(BaseModel):
     details: Dict[str, float] = Field(default_factory=dict, description="세부 측정값")
 
 
+class CheckSchedule(BaseModel):
+    """자세 평가 일정"""
+    timestamp: datetime = Field(default_factory=datetime.now, description="타임스탬프")
+    next_check_time: Optional[float] = Field(..., description="다음 평가 예정 시각 (epoch 초, None 이면 미정)")
+
+
 class CommandType(str, Enum):
     """명령 유형"""
     START = "start"         # 시작
@@ -89,6 +210,7 @@ class Command(BaseModel):
 class Event(BaseModel):
     """통합 이벤트 모델"""
     type: EventType = Field(..., description="이벤트 유형")
-    data: Union[FrameData, PressureData, PostureResult, CalibrationData, Command, Dict] = Field(
+    data: Union[FrameData, PressureData, PressureBlock, PostureResult, CalibrationData, Command,
+                CheckSchedule, Dict] = Field(
         ..., description="이벤트 데이터"
     ) 
\ No newline at end of file
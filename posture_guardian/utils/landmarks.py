@@ -0,0 +1,199 @@
+"""
+배열 기반 포즈 랜드마크 컨테이너
+- MediaPipe Pose 33개 랜드마크를 (33, 4) float32 배열로 보관
+- 키포인트 이름 → 행 인덱스 매핑
+- 벡터화된 기하 계산 (눈 거리, 어깨 기울기 등)
+"""
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from posture_guardian.utils.events import PoseKeypoint
+
+# MediaPipe Pose 랜드마크 순서
+LANDMARK_NAMES: List[str] = [
+    "nose",
+    "left_eye_inner", "left_eye", "left_eye_outer",
+    "right_eye_inner", "right_eye", "right_eye_outer",
+    "left_ear", "right_ear",
+    "mouth_left", "mouth_right",
+    "left_shoulder", "right_shoulder",
+    "left_elbow", "right_elbow",
+    "left_wrist", "right_wrist",
+    "left_pinky", "right_pinky",
+    "left_index", "right_index",
+    "left_thumb", "right_thumb",
+    "left_hip", "right_hip",
+    "left_knee", "right_knee",
+    "left_ankle", "right_ankle",
+    "left_heel", "right_heel",
+    "left_foot_index", "right_foot_index",
+]
+
+# 키포인트 이름 → 행 인덱스
+LANDMARK_INDEX: Dict[str, int] = {name: idx for idx, name in enumerate(LANDMARK_NAMES)}
+
+NUM_LANDMARKS = len(LANDMARK_NAMES)
+
+# 열 인덱스
+X, Y, Z, VISIBILITY = 0, 1, 2, 3
+
+# 자세 평가에 사용하는 키포인트
+KEYPOINT_NAMES: List[str] = [
+    "left_eye_inner",
+    "left_eye_outer",
+    "right_eye_inner",
+    "right_eye_outer",
+    "nose",
+    "left_shoulder",
+    "right_shoulder",
+    "left_elbow",
+    "right_elbow",
+    "left_hip",
+    "right_hip",
+]
+
+# 눈 거리 계산용 (안쪽, 바깥쪽) 인덱스 - [왼쪽, 오른쪽]
+_EYE_INNER = np.array([LANDMARK_INDEX["left_eye_inner"], LANDMARK_INDEX["right_eye_inner"]])
+_EYE_OUTER = np.array([LANDMARK_INDEX["left_eye_outer"], LANDMARK_INDEX["right_eye_outer"]])
+_LEFT_SHOULDER = LANDMARK_INDEX["left_shoulder"]
+_RIGHT_SHOULDER = LANDMARK_INDEX["right_shoulder"]
+_NOSE = LANDMARK_INDEX["nose"]
+
+
+class LandmarkArray:
+    """
+    (33, 4) float32 배열 기반 랜드마크 컨테이너
+
+    각 행은 (x, y, z, visibility) 이며 행 순서는 `LANDMARK_NAMES` 를 따릅니다.
+    키포인트 객체는 `to_keypoints()` 를 호출할 때만 생성합니다.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: np.ndarray):
+        """
+        랜드마크 컨테이너 초기화
+
+        Args:
+            data: (33, 4) 랜드마크 배열
+
+        Raises:
+            ValueError: 배열 크기가 맞지 않는 경우
+        """
+        data = np.asarray(data, dtype=np.float32)
+        if data.shape != (NUM_LANDMARKS, 4):
+            raise ValueError(f"랜드마크 배열 크기가 잘못되었습니다: {data.shape}")
+        self.data = data
+
+    @classmethod
+    def from_mediapipe(cls, landmarks) -> "LandmarkArray":
+        """
+        MediaPipe 랜드마크 목록으로 컨테이너를 생성합니다.
+
+        Args:
+            landmarks: MediaPipe `pose_landmarks`
+
+        Returns:
+            LandmarkArray: 랜드마크 컨테이너
+        """
+        return cls(np.array(
+            [(lm.x, lm.y, lm.z, lm.visibility) for lm in landmarks.landmark],
+            dtype=np.float32,
+        ))
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        """이름으로 (x, y, z, visibility) 행을 반환"""
+        return self.data[LANDMARK_INDEX[name]]
+
+    def __repr__(self) -> str:
+        return f"LandmarkArray(mean_visibility={self.data[:, VISIBILITY].mean():.2f})"
+
+    def indices(self, names: Iterable[str]) -> np.ndarray:
+        """키포인트 이름 목록을 행 인덱스 배열로 변환"""
+        return np.fromiter((LANDMARK_INDEX[n] for n in names), dtype=np.intp)
+
+    def distances(self, idx_a: np.ndarray, idx_b: np.ndarray) -> np.ndarray:
+        """
+        두 인덱스 배열의 대응 랜드마크 사이 2D 거리를 한 번에 계산합니다.
+
+        Args:
+            idx_a: 첫 번째 랜드마크 인덱스 배열
+            idx_b: 두 번째 랜드마크 인덱스 배열
+
+        Returns:
+            np.ndarray: 거리 배열
+        """
+        diff = self.data[idx_a, :2] - self.data[idx_b, :2]
+        return np.hypot(diff[:, 0], diff[:, 1])
+
+    def eye_distances(self) -> Tuple[float, float]:
+        """
+        눈 안쪽-바깥쪽 거리
+
+        Returns:
+            Tuple[float, float]: (왼쪽, 오른쪽) 거리
+        """
+        left, right = self.distances(_EYE_INNER, _EYE_OUTER).tolist()
+        return left, right
+
+    def eye_distance_ratio(self) -> Optional[float]:
+        """왼쪽/오른쪽 눈 거리 비율 (오른쪽 거리가 0이면 None)"""
+        left, right = self.eye_distances()
+        if right == 0.0:
+            return None
+        return left / right
+
+    def shoulder_width(self) -> float:
+        """양 어깨 사이 2D 거리"""
+        diff = self.data[_LEFT_SHOULDER, :2] - self.data[_RIGHT_SHOULDER, :2]
+        return float(np.hypot(diff[0], diff[1]))
+
+    def shoulder_tilt(self) -> float:
+        """
+        어깨선 기울기
+
+        Returns:
+            float: 수평 대비 어깨선 각도 (도, 왼쪽 어깨가 낮으면 양수)
+        """
+        diff = self.data[_LEFT_SHOULDER, :2] - self.data[_RIGHT_SHOULDER, :2]
+        return float(np.degrees(np.arctan2(diff[1], abs(diff[0]))))
+
+    def head_drop(self) -> Optional[float]:
+        """
+        어깨 중심 대비 코의 높이 (어깨 너비로 정규화)
+
+        Returns:
+            Optional[float]: 값이 작을수록 고개가 숙여진 상태, 어깨 너비가 0이면 None
+        """
+        width = self.shoulder_width()
+        if width == 0.0:
+            return None
+        mid_y = (self.data[_LEFT_SHOULDER, Y] + self.data[_RIGHT_SHOULDER, Y]) / 2
+        return float((mid_y - self.data[_NOSE, Y]) / width)
+
+    def mean_visibility(self, names: Optional[Iterable[str]] = None) -> float:
+        """지정한 키포인트(없으면 전체)의 평균 가시성"""
+        if names is None:
+            return float(self.data[:, VISIBILITY].mean())
+        return float(self.data[self.indices(names), VISIBILITY].mean())
+
+    def to_keypoints(self, names: Iterable[str] = KEYPOINT_NAMES) -> Dict[str, "PoseKeypoint"]:
+        """
+        키포인트 객체 사전으로 변환합니다. (호환용, 호출 시에만 객체 생성)
+
+        Args:
+            names: 변환할 키포인트 이름 목록
+
+        Returns:
+            Dict[str, PoseKeypoint]: 키포인트 정보 사전
+        """
+        # events 모듈이 이 모듈을 참조하므로 순환 참조를 피하기 위해 지연 임포트
+        from posture_guardian.utils.events import PoseKeypoint
+
+        result = {}
+        for name in names:
+            x, y, z, visibility = self.data[LANDMARK_INDEX[name]].tolist()
+            result[name] = PoseKeypoint(x=x, y=y, z=z, visibility=visibility)
+        return result
@@ -0,0 +1,61 @@
+"""
+런타임 성능 측정 유틸리티
+- 이벤트 루프 지연(lag) 측정
+"""
+import asyncio
+import time
+from typing import Dict
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 측정기
+
+    일정 간격으로 sleep 한 뒤 실제로 깨어난 시각과 예정 시각의 차이를 기록합니다.
+    루프를 막는 작업이 있을수록 지연이 커집니다.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        """
+        루프 지연 측정기 초기화
+
+        Args:
+            interval: 측정 간격 (초)
+        """
+        self.interval = interval
+        self.samples = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+
+    async def run(self) -> None:
+        """취소될 때까지 루프 지연을 측정합니다."""
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - expected)
+            self.samples += 1
+            self.total_lag += lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+
+    def snapshot(self, reset: bool = False) -> Dict[str, float]:
+        """
+        현재까지의 지연 통계를 반환합니다.
+
+        Args:
+            reset: True 이면 반환 후 통계를 초기화
+
+        Returns:
+            Dict[str, float]: 평균/최대 지연 (밀리초) 및 샘플 수
+        """
+        mean_lag = self.total_lag / self.samples if self.samples else 0.0
+        stats = {
+            "loop_lag_mean_ms": mean_lag * 1000.0,
+            "loop_lag_max_ms": self.max_lag * 1000.0,
+            "loop_lag_samples": float(self.samples),
+        }
+        if reset:
+            self.samples = 0
+            self.total_lag = 0.0
+            self.max_lag = 0.0
+        return stats
@@ -0,0 +1,102 @@
+"""
+다채널 압력 매트 (방석) 특징 계산
+- 셀 위치를 (N, 2) 배열로 보관 (x: 왼쪽 -1 ~ 오른쪽 +1, y: 뒤 -1 ~ 앞 +1)
+- 샘플 묶음 (S, N) 의 압력 중심(CoP), 좌우/앞뒤 균형, 전체 하중을 행렬 연산으로 한 번에 계산
+"""
+from typing import Dict
+
+import numpy as np
+
+# 특징 이름
+TOTAL_LOAD = "total_load"
+COP_X = "cop_x"
+COP_Y = "cop_y"
+LR_BALANCE = "lr_balance"
+FB_BALANCE = "fb_balance"
+
+
+class MatLayout:
+    """압력 매트 셀 배치와 벡터화된 특징 계산"""
+
+    __slots__ = ("positions", "_sides")
+
+    def __init__(self, positions: np.ndarray):
+        """
+        셀 배치 초기화
+
+        Args:
+            positions: (N, 2) 셀 중심 좌표 [x, y] (-1 ~ 1)
+
+        Raises:
+            ValueError: 배열 크기가 맞지 않는 경우
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 2 or len(positions) == 0:
+            raise ValueError(f"셀 좌표 배열 크기가 잘못되었습니다: {positions.shape}")
+        self.positions = positions
+        # 좌우/앞뒤 부호 (가운데 셀은 0) - 균형 계산용 (N, 2)
+        self._sides = np.sign(positions)
+
+    @classmethod
+    def grid(cls, rows: int, cols: int) -> "MatLayout":
+        """
+        rows x cols 격자 배치를 만듭니다. (행은 뒤 → 앞, 열은 왼쪽 → 오른쪽 순서)
+
+        Args:
+            rows: 앞뒤 방향 셀 수
+            cols: 좌우 방향 셀 수
+
+        Returns:
+            MatLayout: 격자 배치
+        """
+        ys = np.linspace(-1.0, 1.0, rows) if rows > 1 else np.zeros(1)
+        xs = np.linspace(-1.0, 1.0, cols) if cols > 1 else np.zeros(1)
+        grid_y, grid_x = np.meshgrid(ys, xs, indexing="ij")
+        return cls(np.stack([grid_x.ravel(), grid_y.ravel()], axis=1))
+
+    @property
+    def channels(self) -> int:
+        """셀 수"""
+        return len(self.positions)
+
+    def features(self, cells: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        샘플별 특징을 계산합니다.
+
+        Args:
+            cells: (S, N) 셀 압력값
+
+        Returns:
+            Dict[str, np.ndarray]: 특징 이름 → (S,) 배열
+                total_load: 셀 압력 합
+                cop_x, cop_y: 압력 중심 (-1 ~ 1, 하중이 없으면 0)
+                lr_balance: (오른쪽 - 왼쪽) / 합 (-1 ~ 1)
+                fb_balance: (앞 - 뒤) / 합 (-1 ~ 1)
+        """
+        cells = np.asarray(cells, dtype=np.float64).reshape(-1, self.channels)
+        total = cells.sum(axis=1)
+        # 하중이 없는 샘플은 0 으로 나누지 않도록 분모를 1 로
+        scale = 1.0 / np.where(total > 0, total, 1.0)
+        cop = (cells @ self.positions) * scale[:, None]
+        balance = (cells @ self._sides) * scale[:, None]
+        return {
+            TOTAL_LOAD: total,
+            COP_X: cop[:, 0],
+            COP_Y: cop[:, 1],
+            LR_BALANCE: balance[:, 0],
+            FB_BALANCE: balance[:, 1],
+        }
+
+
+def cushion_value(cells: np.ndarray) -> np.ndarray:
+    """
+    기존 단일 방석 값과 같은 척도의 대표값 (셀 평균, 1~1024)
+
+    Args:
+        cells: (S, N) 셀 압력값
+
+    Returns:
+        np.ndarray: (S,) int32 방석 값
+    """
+    cells = np.asarray(cells)
+    return np.clip(np.rint(cells.mean(axis=1)), 1, 1024).astype(np.int32)
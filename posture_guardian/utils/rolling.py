@@ -0,0 +1,169 @@
+"""
+고정 길이 슬라이딩 윈도우 통계
+- 미리 할당한 링 배열에 최근 샘플을 보관하고, 샘플마다 O(1) 로 평균/분산 갱신 (슬라이딩 Welford)
+- 최솟값/최댓값은 단조 덱(monotonic deque)으로 분할 상환 O(1)
+- 지수 이동 평균(EMA) 함께 유지
+"""
+import collections
+from typing import Deque, Dict, Optional
+
+import numpy as np
+
+
+class RollingStats:
+    """슬라이딩 윈도우 평균/분산/최솟값/최댓값/EMA"""
+
+    def __init__(self, window: int, ema_alpha: float = 0.2):
+        """
+        윈도우 통계 초기화
+
+        Args:
+            window: 윈도우 길이 (샘플 수)
+            ema_alpha: EMA 가중치 (0~1, 클수록 최근 샘플 비중이 큼)
+
+        Raises:
+            ValueError: 윈도우 길이가 1 미만인 경우
+        """
+        if window < 1:
+            raise ValueError(f"윈도우 길이는 1 이상이어야 합니다: {window}")
+        self.window = window
+        self.ema_alpha = ema_alpha
+        self._ring = np.zeros(window, dtype=np.float64)
+        self._ema: Optional[float] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 샘플을 버립니다."""
+        self.count = 0          # 지금까지 넣은 샘플 수 (링 위치와 덱의 샘플 번호)
+        self._ema = None
+        self._clear_window()
+
+    def _clear_window(self) -> None:
+        """윈도우 통계만 비움 (샘플 번호와 EMA 유지)"""
+        self._size = 0
+        self._mean = 0.0
+        self._m2 = 0.0          # 편차 제곱합
+        # 샘플 번호 단조 덱: 앞쪽이 윈도우의 최솟값/최댓값
+        self._min_queue: Deque[int] = collections.deque()
+        self._max_queue: Deque[int] = collections.deque()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, value: float) -> None:
+        """
+        샘플 하나를 추가합니다. (윈도우가 차 있으면 가장 오래된 샘플을 밀어냄)
+
+        Args:
+            value: 샘플 값
+        """
+        value = float(value)
+        index = self.count
+        slot = index % self.window
+
+        if self._size < self.window:
+            # 윈도우를 채우는 중: 일반 Welford 갱신
+            self._size += 1
+            delta = value - self._mean
+            self._mean += delta / self._size
+            self._m2 += delta * (value - self._mean)
+        else:
+            # 가장 오래된 샘플을 새 샘플로 교체
+            old = self._ring[slot]
+            old_mean = self._mean
+            self._mean += (value - old) / self.window
+            self._m2 = max(self._m2 + (value - old) * (value - self._mean + old - old_mean), 0.0)
+        self._ring[slot] = value
+        self._ema = value if self._ema is None else self._ema + self.ema_alpha * (value - self._ema)
+        self.count += 1
+
+        # 윈도우 밖으로 나간 샘플 번호를 앞에서 제거하고, 새 샘플보다 못한 값을 뒤에서 제거
+        oldest = self.count - self.window
+        ring = self._ring
+        window = self.window
+        min_queue, max_queue = self._min_queue, self._max_queue
+        if min_queue and min_queue[0] < oldest:
+            min_queue.popleft()
+        while min_queue and ring[min_queue[-1] % window] >= value:
+            min_queue.pop()
+        min_queue.append(index)
+        if max_queue and max_queue[0] < oldest:
+            max_queue.popleft()
+        while max_queue and ring[max_queue[-1] % window] <= value:
+            max_queue.pop()
+        max_queue.append(index)
+
+    def extend(self, values: np.ndarray) -> None:
+        """
+        샘플 여러 개를 순서대로 추가합니다.
+
+        윈도우보다 긴 묶음은 앞부분이 윈도우에 남지 않으므로 EMA 만 한 번에 갱신하고,
+        마지막 `window` 개만 윈도우에 넣습니다.
+
+        Args:
+            values: (N,) 샘플 값
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if len(values) > self.window:
+            head = values[:-self.window]
+            if self._ema is None:
+                self._ema = float(head[0])
+                head = head[1:]
+            # EMA 닫힌 형태: (1-a)^n * ema + a * sum((1-a)^(n-1-i) * x_i)
+            decay = 1.0 - self.ema_alpha
+            weights = decay ** np.arange(len(head) - 1, -1, -1)
+            self._ema = decay ** len(head) * self._ema + self.ema_alpha * float(weights @ head)
+            self.count += len(values) - self.window
+            self._clear_window()
+            values = values[-self.window:]
+        for value in values.tolist():
+            self.push(value)
+
+    @property
+    def mean(self) -> float:
+        """윈도우 평균"""
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """윈도우 분산 (모분산)"""
+        size = len(self)
+        return self._m2 / size if size else 0.0
+
+    @property
+    def std(self) -> float:
+        """윈도우 표준편차"""
+        return float(np.sqrt(self.variance))
+
+    @property
+    def min(self) -> float:
+        """윈도우 최솟값"""
+        return float(self._ring[self._min_queue[0] % self.window]) if self._min_queue else 0.0
+
+    @property
+    def max(self) -> float:
+        """윈도우 최댓값"""
+        return float(self._ring[self._max_queue[0] % self.window]) if self._max_queue else 0.0
+
+    @property
+    def ema(self) -> float:
+        """지수 이동 평균 (윈도우와 무관하게 모든 샘플 반영)"""
+        return 0.0 if self._ema is None else self._ema
+
+    def summary(self, prefix: str) -> Dict[str, float]:
+        """
+        현재 통계를 사전으로 반환합니다.
+
+        Args:
+            prefix: 키 접두사 (예: "foot")
+
+        Returns:
+            Dict[str, float]: {prefix}_mean, _std, _min, _max, _ema
+        """
+        return {
+            f"{prefix}_mean": self.mean,
+            f"{prefix}_std": self.std,
+            f"{prefix}_min": self.min,
+            f"{prefix}_max": self.max,
+            f"{prefix}_ema": self.ema,
+        }
@@ -0,0 +1,15 @@
+"""
+공통 테스트 픽스처
+"""
+import pytest
+
+from posture_guardian.core import bus as bus_module
+from posture_guardian.core.bus import EventBus
+
+
+@pytest.fixture
+def event_bus(monkeypatch: pytest.MonkeyPatch) -> EventBus:
+    """테스트마다 새로 만든 전역 이벤트 버스 (get_event_bus 가 반환)"""
+    event_bus = EventBus()
+    monkeypatch.setattr(bus_module, "_bus_instance", event_bus)
+    return event_bus
@@ -0,0 +1,120 @@
+"""
+아두이노 바이너리 프레임 프로토콜 테스트 (인코딩/디코딩, pty 가상 아두이노)
+"""
+import asyncio
+import os
+import sys
+import time
+from typing import Tuple
+
+import numpy as np
+import pytest
+import serial
+
+from posture_guardian.sensors.serial_reader import (FRAME_SIZE, PROTOCOL_BINARY,
+                                                    PROTOCOL_CSV,
+                                                    SerialLineReader,
+                                                    decode_binary_frames,
+                                                    encode_binary_frames)
+from tools.pty_arduino import PtyArduino
+
+VALUES = np.array([[100, 200], [300, 400], [1024, 1], [512, 513]], dtype=np.int32)
+
+
+def test_round_trip() -> None:
+    values, seqs, rest, dropped = decode_binary_frames(encode_binary_frames(VALUES, start_seq=254))
+    assert values.tolist() == VALUES.tolist()
+    assert seqs.tolist() == [254, 255, 0, 1]
+    assert rest == b"" and dropped == 0
+
+
+def test_round_trip_mat_channels() -> None:
+    mat = np.arange(1, 19, dtype=np.int32).reshape(2, 9)
+    values, _, rest, dropped = decode_binary_frames(encode_binary_frames(mat), channels=9)
+    assert values.tolist() == mat.tolist()
+    assert rest == b"" and dropped == 0
+
+
+def test_partial_frame_is_kept() -> None:
+    data = encode_binary_frames(VALUES)
+    values, _, rest, _ = decode_binary_frames(data[:-3])
+    assert len(values) == 3
+    values, _, rest, dropped = decode_binary_frames(rest + data[-3:])
+    assert values.tolist() == VALUES[3:].tolist()
+    assert rest == b"" and dropped == 0
+
+
+def test_resync_after_garbage() -> None:
+    garbage = b"\x00\xa5\x13junk\xa5\x5a\x01"
+    values, _, rest, dropped = decode_binary_frames(garbage + encode_binary_frames(VALUES))
+    assert values.tolist() == VALUES.tolist()
+    assert rest == b""
+    assert dropped == len(garbage)
+
+
+def test_bad_checksum_is_rejected() -> None:
+    data = bytearray(encode_binary_frames(VALUES))
+    data[FRAME_SIZE + 3] ^= 0xFF  # 두 번째 프레임 값 손상
+    values, seqs, _, dropped = decode_binary_frames(bytes(data))
+    assert values.tolist() == VALUES[[0, 2, 3]].tolist()
+    assert seqs.tolist() == [0, 2, 3]
+    assert dropped == FRAME_SIZE
+
+
+def _open(arduino: PtyArduino, protocol: str, channels: int = 2) -> Tuple[serial.Serial, SerialLineReader]:
+    ser = serial.Serial(arduino.port, 115200, timeout=0.05)
+    reader = SerialLineReader(ser, protocol=protocol, channels=channels)
+    reader.start()
+    return ser, reader
+
+
+async def _read_all(reader: SerialLineReader, expected: int, timeout: float = 3.0) -> np.ndarray:
+    chunks = []
+    deadline = time.monotonic() + timeout
+    while sum(len(c) for c in chunks) < expected and time.monotonic() < deadline:
+        _, values = await reader.read_samples(timeout=0.1)
+        chunks.append(values)
+    return np.concatenate(chunks)
+
+
+pty_only = pytest.mark.skipif(sys.platform == "win32", reason="pty 는 POSIX 전용")
+
+
+@pty_only
+@pytest.mark.asyncio
+@pytest.mark.parametrize("protocol,channels", [(PROTOCOL_BINARY, 2), (PROTOCOL_BINARY, 9), (PROTOCOL_CSV, 2)])
+async def test_pty_arduino_stream(protocol: str, channels: int) -> None:
+    arduino = PtyArduino(protocol=protocol, rate_hz=500.0, samples=200, channels=channels)
+    ser, reader = _open(arduino, protocol, channels)
+    try:
+        arduino.start()
+        values = await _read_all(reader, 200)
+        assert values.shape == (200, channels)
+        assert values.min() >= 1 and values.max() <= 1024
+        assert reader.frames_lost == 0
+        assert reader.bytes_dropped == 0 and reader.bad_lines == 0
+    finally:
+        reader.stop()
+        ser.close()
+        arduino.stop()
+
+
+@pty_only
+@pytest.mark.asyncio
+async def test_pty_sequence_gap_and_garbage() -> None:
+    arduino = PtyArduino(protocol=PROTOCOL_BINARY)
+    ser, reader = _open(arduino, PROTOCOL_BINARY)
+    try:
+        frames = encode_binary_frames(np.tile([500, 500], (10, 1)))
+        # 3, 4 번 프레임 유실, 앞에 잡음
+        os.write(arduino.master, b"\xff\xa5" + frames[:3 * FRAME_SIZE])
+        await asyncio.sleep(0.05)
+        os.write(arduino.master, frames[5 * FRAME_SIZE:])
+        values = await _read_all(reader, 8)
+        assert len(values) == 8
+        assert reader.frames_lost == 2
+        assert reader.bytes_dropped == 2
+    finally:
+        reader.stop()
+        ser.close()
+        arduino.stop()
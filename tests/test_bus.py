@@ -0,0 +1,145 @@
+"""
+이벤트 버스 큐 정책 테스트
+"""
+import asyncio
+from typing import Dict, List
+
+import pytest
+
+from posture_guardian.core.bus import (BOUNDED_POLICIES, KEY_SOURCE,
+                                       POLICY_BLOCK, POLICY_DROP_OLDEST,
+                                       POLICY_LATEST, POLICY_UNBOUNDED,
+                                       EventBus, QueuePolicy)
+from posture_guardian.core.config import BusConfig, QueuePolicyConfig
+from posture_guardian.utils.events import (Command, CommandType, Event,
+                                          EventType, FrameData, PressureData)
+
+
+def _frame(frame_id: int, camera_id: str = "0") -> Event:
+    return Event(type=EventType.FRAME, data=FrameData(frame_id=frame_id, camera_id=camera_id))
+
+
+def _pressure(value: int) -> Event:
+    return Event(type=EventType.PRESSURE, data=PressureData(foot_value=value, cushion_value=value))
+
+
+def _command() -> Event:
+    return Event(type=EventType.COMMAND, data=Command(type=CommandType.START))
+
+
+def _label(event: Event) -> str:
+    if event.type == EventType.FRAME:
+        return f"frame{event.data.camera_id}:{event.data.frame_id}"
+    if event.type == EventType.PRESSURE:
+        return f"pressure:{event.data.foot_value}"
+    return event.type.value
+
+
+async def _deliver(bus: EventBus, events: List[Event]) -> List[str]:
+    """워커를 멈춘 채로 모두 발행한 뒤 워커를 돌려 전달 순서를 반환"""
+    delivered: List[str] = []
+    for event_type in EventType:
+        bus.subscribe(event_type, lambda event: delivered.append(_label(event)))
+    for event in events:
+        await bus.publish(event)
+    await bus.start()
+    while bus.pending():
+        await asyncio.sleep(0.01)
+    await bus.stop()
+    return delivered
+
+
+@pytest.mark.asyncio
+async def test_default_is_unbounded() -> None:
+    bus = EventBus()
+    delivered = await _deliver(bus, [_frame(i) for i in range(100)])
+    assert delivered == [f"frame0:{i}" for i in range(100)]
+    assert bus.stats()["bus_dropped"] == 0 and bus.stats()["bus_coalesced"] == 0
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest() -> None:
+    bus = EventBus({EventType.PRESSURE: QueuePolicy(POLICY_DROP_OLDEST, maxsize=3)})
+    delivered = await _deliver(bus, [_pressure(v) for v in range(1, 7)])
+    assert delivered == ["pressure:4", "pressure:5", "pressure:6"]
+    assert bus.stats()["bus_dropped_pressure"] == 3
+
+
+@pytest.mark.asyncio
+async def test_latest_coalesces_per_source() -> None:
+    bus = EventBus({EventType.FRAME: QueuePolicy(POLICY_LATEST, key=KEY_SOURCE)})
+    events = [_frame(1, "0"), _frame(1, "1"), _frame(2, "0"), _frame(3, "0"), _frame(2, "1")]
+    delivered = await _deliver(bus, events)
+    # 처음 대기열에 들어간 위치에서 최신 값으로 처리
+    assert delivered == ["frame0:3", "frame1:2"]
+    assert bus.stats()["bus_coalesced_frame"] == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_event_does_not_overtake_command() -> None:
+    bus = EventBus({EventType.FRAME: QueuePolicy(POLICY_LATEST)})
+    events = [_frame(1), _frame(2), _command(), _frame(3), _frame(4)]
+    delivered = await _deliver(bus, events)
+    assert delivered == ["frame0:2", "command", "frame0:4"]
+
+
+@pytest.mark.asyncio
+async def test_never_drop_types_ignore_lossy_policy() -> None:
+    bus = EventBus({
+        EventType.COMMAND: QueuePolicy(POLICY_DROP_OLDEST, maxsize=1),
+        EventType.CALIBRATION: QueuePolicy(POLICY_LATEST),
+    })
+    delivered = await _deliver(bus, [_command() for _ in range(5)])
+    assert delivered == ["command"] * 5
+    assert bus.stats()["bus_dropped"] == 0
+
+
+@pytest.mark.asyncio
+async def test_block_waits_for_space() -> None:
+    bus = EventBus({EventType.PRESSURE: QueuePolicy(POLICY_BLOCK, maxsize=2)})
+    delivered: List[int] = []
+    release = asyncio.Event()
+    
+    async def slow(event: Event) -> None:
+        await release.wait()
+        delivered.append(event.data.foot_value)
+    
+    bus.subscribe(EventType.PRESSURE, slow)
+    await bus.start()
+    
+    async def publish_all() -> None:
+        for value in range(1, 6):
+            await bus.publish(_pressure(value))
+    
+    publisher = asyncio.create_task(publish_all())
+    await asyncio.sleep(0.05)
+    # 워커가 첫 이벤트를 처리 중이고 두 개가 대기하면 발행자는 기다림
+    assert not publisher.done()
+    assert bus.pending() == 2
+    
+    release.set()
+    await asyncio.wait_for(publisher, 1.0)
+    while bus.pending():
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.01)
+    await bus.stop()
+    assert delivered == [1, 2, 3, 4, 5]
+    assert bus.stats()["bus_dropped"] == 0
+
+
+def test_bus_config_policies() -> None:
+    assert BusConfig().policies() == {}
+    
+    bounded = BusConfig(bounded_queues=True).policies()
+    assert bounded == BOUNDED_POLICIES
+    
+    config = BusConfig(queue_policies={"pressure": QueuePolicyConfig(policy=POLICY_UNBOUNDED)})
+    assert config.policies()[EventType.PRESSURE] == QueuePolicy()
+
+
+def test_bus_config_lossless_types() -> None:
+    config = BusConfig(bounded_queues=True)
+    policies: Dict[EventType, QueuePolicy] = config.policies(lossless=(EventType.FRAME, EventType.PRESSURE))
+    assert policies[EventType.FRAME] == QueuePolicy(POLICY_BLOCK, BOUNDED_POLICIES[EventType.FRAME].maxsize)
+    assert policies[EventType.PRESSURE] == QueuePolicy(POLICY_BLOCK, BOUNDED_POLICIES[EventType.PRESSURE].maxsize)
+    assert policies[EventType.SYSTEM] == BOUNDED_POLICIES[EventType.SYSTEM]
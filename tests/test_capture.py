@@ -0,0 +1,67 @@
+"""
+캡처 모드 탐색 테스트
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from posture_guardian.sensors.capture import _probe_rank, probe_capture_modes
+from posture_guardian.utils.landmarks import NUM_LANDMARKS
+
+# 모드별 프레임 대기 시간 (초) - 작은 해상도는 프레임 간격이 긴 카메라를 흉내냄
+FRAME_WAIT = {320: 0.03, 1920: 0.0}
+
+
+class FakeCapture:
+    """설정한 해상도의 빈 프레임을 돌려주는 캡처 객체"""
+
+    def __init__(self):
+        self.props: Dict[int, float] = {}
+
+    def set(self, prop: int, value: float) -> bool:
+        self.props[prop] = value
+        return True
+
+    def get(self, prop: int) -> float:
+        return self.props.get(prop, 0.0)
+
+    def _size(self) -> Tuple[int, int]:
+        return int(self.get(cv2.CAP_PROP_FRAME_WIDTH)), int(self.get(cv2.CAP_PROP_FRAME_HEIGHT))
+
+    def grab(self) -> bool:
+        time.sleep(FRAME_WAIT[self._size()[0]])
+        return True
+
+    def retrieve(self) -> Tuple[bool, np.ndarray]:
+        width, height = self._size()
+        return True, np.zeros((height, width, 3), dtype=np.uint8)
+
+    def read(self) -> Tuple[bool, np.ndarray]:
+        self.grab()
+        return self.retrieve()
+
+
+def _visible(rgb: np.ndarray) -> Optional[np.ndarray]:
+    return np.ones((NUM_LANDMARKS, 4), dtype=np.float32)
+
+
+def test_probe_ignores_frame_wait() -> None:
+    cap = FakeCapture()
+    chosen, results = probe_capture_modes(cap, ["1920x1080", "320x240"], _visible, frames=3, warmup_frames=0)
+    # 320x240 은 프레임 대기가 길지만 디코딩+전처리 비용이 작으므로 선택
+    assert chosen["mode"] == "320x240"
+    assert results[1]["wait_ms"] > results[0]["wait_ms"]
+    assert cap._size() == (320, 240)
+
+
+def test_probe_rank_breaks_cost_ties_by_confidence_then_resolution() -> None:
+    def result(cost: float, confidence: float, width: int) -> Dict[str, object]:
+        return {
+            "decode_ms": cost, "preprocess_ms": 0.0, "confidence": confidence,
+            "width": width, "height": width * 3 // 4,
+        }
+
+    results = [result(1.02, 0.8, 640), result(1.0, 0.9, 320), result(1.01, 0.9, 640), result(3.0, 1.0, 1280)]
+    assert min(results, key=_probe_rank) is results[2]
@@ -0,0 +1,70 @@
+"""
+압력 데드밴드 필터 테스트
+"""
+import numpy as np
+
+from posture_guardian.sensors.deadband import PressureDeadband
+
+
+def _values(*rows) -> np.ndarray:
+    return np.array(rows, dtype=np.int32)
+
+
+def test_threshold_is_exclusive_and_per_channel() -> None:
+    deadband = PressureDeadband(threshold=10, heartbeat_interval=0)
+    timestamps = np.arange(6, dtype=np.float64) * 0.1
+    values = _values([500, 500], [510, 500], [511, 500], [511, 489], [515, 495], [505, 495])
+    mask = deadband.filter(timestamps, values)
+    # 첫 샘플은 항상, 이후에는 마지막 발행 샘플보다 어느 채널이든 10 을 넘게 바뀐 샘플만
+    assert mask.tolist() == [True, False, True, True, False, False]
+    assert deadband.stats()["deadband_samples_out"] == 3
+    assert deadband.heartbeats == 0
+
+
+def test_reference_carries_across_blocks() -> None:
+    deadband = PressureDeadband(threshold=5, heartbeat_interval=0)
+    assert deadband.filter(np.array([0.0]), _values([100, 100])).tolist() == [True]
+    # 조금씩 바뀌어도 마지막 발행 값 기준이므로 누적 변화가 임계값을 넘을 때 발행
+    mask = deadband.filter(np.array([0.1, 0.2, 0.3]), _values([103, 100], [105, 100], [106, 100]))
+    assert mask.tolist() == [False, False, True]
+
+
+def test_heartbeat_interval() -> None:
+    deadband = PressureDeadband(threshold=50, heartbeat_interval=1.0)
+    timestamps = np.arange(0.0, 3.01, 0.25)
+    values = np.full((len(timestamps), 2), 500, dtype=np.int32)
+    mask = deadband.filter(timestamps, values)
+    # 값이 그대로면 1초마다 한 번
+    assert timestamps[mask].tolist() == [0.0, 1.0, 2.0, 3.0]
+    assert deadband.heartbeats == 3
+    
+    # 변화로 발행하면 heartbeat 간격도 그 시각부터 다시 셈
+    mask = deadband.filter(np.array([3.5, 3.75, 4.5, 4.75]), _values([600, 500], [600, 500], [600, 500], [600, 500]))
+    assert mask.tolist() == [True, False, True, False]
+    assert deadband.heartbeats == 4
+
+
+def test_first_sample_after_reset_is_emitted() -> None:
+    deadband = PressureDeadband(threshold=10, heartbeat_interval=0)
+    deadband.filter(np.array([0.0]), _values([500, 500]))
+    assert deadband.filter(np.array([1.0]), _values([500, 500])).tolist() == [False]
+    
+    # 재연결/출처 변경: 값이 같아도 첫 샘플은 바로 발행
+    deadband.reset()
+    mask = deadband.filter(np.array([2.0, 2.1]), _values([500, 500], [500, 500]))
+    assert mask.tolist() == [True, False]
+
+
+def test_channel_count_change_restarts() -> None:
+    deadband = PressureDeadband(threshold=10, heartbeat_interval=0)
+    deadband.filter(np.array([0.0]), _values([500, 500]))
+    # 매트 셀 수가 바뀌면 기준 샘플을 새로 잡음
+    mask = deadband.filter(np.array([1.0, 1.1]), _values([500, 500, 500], [500, 500, 500]))
+    assert mask.tolist() == [True, False]
+
+
+def test_empty_block() -> None:
+    deadband = PressureDeadband(threshold=10)
+    mask = deadband.filter(np.zeros(0), np.zeros((0, 2), dtype=np.int32))
+    assert mask.shape == (0,)
+    assert deadband.stats()["deadband_reduction"] == 0.0
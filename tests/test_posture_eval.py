@@ -0,0 +1,147 @@
+"""
+자세 평가기 테스트
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pytest
+
+from posture_guardian.core.config import AppConfig, SensorConfig
+from posture_guardian.processing.posture_eval import PostureEvaluator
+from posture_guardian.utils.events import (CalibrationData, FrameData,
+                                          PostureStatus, PressureBlock,
+                                          PressureData)
+
+
+def _block(foot: int, cushion: int, source: str, count: int = 5) -> PressureBlock:
+    values = np.tile([foot, cushion], (count, 1))
+    return PressureBlock.from_arrays(np.arange(count, dtype=np.float64), values, source=source)
+
+
+def _arduino_evaluator() -> PostureEvaluator:
+    return PostureEvaluator(AppConfig(sensors=SensorConfig(arduino_connection=True)))
+
+
+def test_arduino_mode_ignores_simulated_pressure() -> None:
+    evaluator = _arduino_evaluator()
+    evaluator.update_pressure(_block(500, 500, "arduino"))
+    assert not evaluator.paused
+    assert evaluator.pressure_stats["foot"].mean == 500
+    
+    # 재연결 중 시뮬레이션 값: 평가 중지, 윈도우 비움
+    evaluator.update_pressure(_block(900, 900, "simulation"))
+    assert "pressure" in evaluator.pause_reasons
+    assert evaluator.latest_pressure is None
+    assert len(evaluator.pressure_stats["foot"]) == 0
+    
+    # 실제 센서 복귀: 새 값만으로 평가 재개
+    evaluator.update_pressure(PressureData(foot_value=300, cushion_value=400, source="arduino"))
+    assert not evaluator.paused
+    assert len(evaluator.pressure_stats["foot"]) == 1
+    assert evaluator.pressure_stats["foot"].mean == 300
+    assert evaluator.latest_pressure.cushion_value == 400
+
+
+def test_arduino_lost_pauses_until_samples_return() -> None:
+    evaluator = _arduino_evaluator()
+    evaluator.update_pressure(_block(500, 500, "arduino"))
+    
+    evaluator.set_pressure_available(False)
+    assert "pressure" in evaluator.pause_reasons
+    assert len(evaluator.pressure_stats["cushion"]) == 0
+    
+    # 연결 알림만으로는 재개하지 않고 실제 샘플이 와야 재개
+    evaluator.set_pressure_available(True)
+    assert evaluator.paused
+    evaluator.update_pressure(_block(450, 480, "arduino", count=3))
+    assert not evaluator.paused
+    assert evaluator.pressure_stats["cushion"].mean == 480
+
+
+def test_simulation_mode_resets_window_on_source_change() -> None:
+    evaluator = PostureEvaluator(AppConfig())
+    evaluator.update_pressure(_block(500, 500, "simulation"))
+    assert not evaluator.paused
+    assert evaluator.pressure_stats["foot"].mean == 500
+    
+    evaluator.set_pressure_available(False)
+    assert not evaluator.paused
+    
+    evaluator.update_pressure(_block(200, 200, "replay", count=2))
+    assert not evaluator.paused
+    assert len(evaluator.pressure_stats["foot"]) == 2
+    assert evaluator.pressure_stats["foot"].mean == 200
+
+
+def _frame(camera_id: str, left: float, right: float = 1.0, timestamp: Optional[datetime] = None) -> FrameData:
+    return FrameData(
+        timestamp=timestamp or datetime.now(), frame_id=0, camera_id=camera_id,
+        eye_distance_left=left, eye_distance_right=right,
+    )
+
+
+def _two_camera_evaluator() -> PostureEvaluator:
+    config = AppConfig(sensors=SensorConfig(webcam_device_ids=[0, 2]))
+    return PostureEvaluator(config)
+
+
+def test_eye_distance_fuses_cameras_against_own_baselines() -> None:
+    evaluator = _two_camera_evaluator()
+    # 보정 시점: 기준 카메라 1.0, 측면 카메라 0.5 (측면 카메라는 이 값이 기준)
+    evaluator.update_frame(_frame("0", 1.0))
+    evaluator.update_frame(_frame("2", 0.5))
+    evaluator.set_calibration(CalibrationData(
+        baseline_foot=500, baseline_cushion=500, baseline_eye_distance_ratio=1.0
+    ))
+    assert evaluator.eye_baselines == {"0": 1.0, "2": 0.5}
+    assert evaluator._check_eye_distance() == PostureStatus.GOOD
+    
+    # 측면 카메라만 크게 바뀜: 평균 차이 (0 + 0.4) / 2 = 0.2 > 0.1
+    evaluator.update_frame(_frame("2", 0.7))
+    assert evaluator._eye_deviations() == pytest.approx({"0": 0.0, "2": 0.4})
+    assert evaluator._check_eye_distance() == PostureStatus.BAD_EYES
+    
+    # 기준 카메라 쪽으로 조금만 바뀌면 평균 차이가 임계값 이하
+    evaluator.update_frame(_frame("2", 0.55))
+    evaluator.update_frame(_frame("0", 1.05))
+    assert evaluator._check_eye_distance() == PostureStatus.GOOD
+
+
+def test_side_camera_baseline_averages_calibration_window() -> None:
+    evaluator = _two_camera_evaluator()
+    start = datetime(2024, 1, 1, 12, 0, 0)
+    # 보정 시간 (3초) 이전의 비율은 기준값에서 제외
+    evaluator.update_frame(_frame("2", 0.9, timestamp=start))
+    for second, ratio in ((2, 0.4), (3, 0.5), (4, 0.6)):
+        evaluator.update_frame(_frame("2", ratio, timestamp=start + timedelta(seconds=second)))
+    evaluator.update_frame(_frame("0", 1.0, timestamp=start + timedelta(seconds=5)))
+    evaluator.set_calibration(CalibrationData(
+        baseline_foot=500, baseline_cushion=500, baseline_eye_distance_ratio=1.0
+    ))
+    assert evaluator.eye_baselines == pytest.approx({"0": 1.0, "2": 0.5})
+
+
+def test_video_input_uses_primary_camera_baseline() -> None:
+    evaluator = _two_camera_evaluator()
+    evaluator.update_frame(_frame("video", 1.0))
+    evaluator.set_calibration(CalibrationData(
+        baseline_foot=500, baseline_cushion=500, baseline_eye_distance_ratio=1.0
+    ))
+    assert evaluator.eye_baselines == {"0": 1.0}
+    
+    evaluator.update_frame(_frame("video", 1.5))
+    assert evaluator.latest_frame.camera_id == "video"
+    assert evaluator._eye_deviations() == pytest.approx({"0": 0.5})
+    assert evaluator._check_eye_distance() == PostureStatus.BAD_EYES
+
+
+def test_eye_distance_without_baseline_falls_back_to_calibration() -> None:
+    evaluator = _two_camera_evaluator()
+    evaluator.set_calibration(CalibrationData(
+        baseline_foot=500, baseline_cushion=500, baseline_eye_distance_ratio=1.0
+    ))
+    # 보정 이후 처음 보인 카메라는 기준값이 없으므로 보정 값과 비교
+    evaluator.update_frame(_frame("2", 1.5))
+    assert evaluator._eye_deviations() == pytest.approx({"2": 0.5})
+    assert evaluator._check_eye_distance() == PostureStatus.BAD_EYES
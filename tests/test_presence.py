@@ -0,0 +1,67 @@
+"""
+재석 감지 상태 머신 테스트
+"""
+from posture_guardian.sensors.presence import AWAY, PRESENT, PresenceDetector
+
+
+def _detector() -> PresenceDetector:
+    return PresenceDetector(cushion_floor=100, absent_frames=3, return_frames=2)
+
+
+def test_single_camera_away_and_return() -> None:
+    presence = _detector()
+    assert [presence.update_frame(False) for _ in range(3)] == [None, None, AWAY]
+    assert not presence.present
+    # 한 번 검출로는 복귀하지 않고 연속 return_frames 번이면 복귀
+    assert presence.update_frame(True) is None
+    assert presence.update_frame(False) is None
+    assert [presence.update_frame(True) for _ in range(2)] == [None, PRESENT]
+    assert presence.transitions == 2
+
+
+def test_seated_pressure_keeps_present() -> None:
+    presence = _detector()
+    assert presence.update_pressure(500) is None
+    for _ in range(10):
+        assert presence.update_frame(False) is None
+    assert presence.present
+    # 일어나면 이미 쌓인 미검출 횟수로 바로 자리 비움
+    assert presence.update_pressure(20) == AWAY
+    # 다시 앉으면 랜드마크 없이도 복귀
+    assert presence.update_pressure(300) == PRESENT
+
+
+def test_camera_that_sees_user_keeps_present() -> None:
+    presence = _detector()
+    presence.update_pressure(20)
+    # 한 카메라는 사용자를 보지 못하고 다른 카메라는 계속 봄
+    for _ in range(10):
+        assert presence.update_frame(False, "0") is None
+        assert presence.update_frame(True, "2") is None
+    assert presence.present
+    assert presence.missing == 0 and presence.seen == 10
+
+
+def test_away_only_when_every_camera_misses() -> None:
+    presence = _detector()
+    presence.update_pressure(20)
+    presence.update_frame(True, "2")
+    for _ in range(5):
+        presence.update_frame(False, "0")
+    assert presence.present
+    states = [presence.update_frame(False, "2") for _ in range(3)]
+    assert states == [None, None, AWAY]
+    
+    # 어느 카메라든 연속 검출되면 복귀 (다른 카메라의 미검출이 횟수를 지우지 않음)
+    assert presence.update_frame(True, "2") is None
+    assert presence.update_frame(False, "0") is None
+    assert presence.update_frame(True, "2") == PRESENT
+
+
+def test_removed_camera_does_not_block_away() -> None:
+    presence = _detector()
+    presence.update_pressure(20)
+    presence.update_frame(True, "2")
+    presence.remove_camera("2")
+    assert presence.cameras == []
+    assert [presence.update_frame(False, "0") for _ in range(3)] == [None, None, AWAY]
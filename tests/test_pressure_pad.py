@@ -0,0 +1,71 @@
+"""
+압력 센서 발행 테스트
+"""
+import asyncio
+from typing import List
+
+import numpy as np
+import pytest
+
+from posture_guardian.core.bus import EventBus
+from posture_guardian.core.config import AppConfig, SensorConfig
+from posture_guardian.sensors.pressure_pad import pressure_pad_sensor
+from posture_guardian.utils.events import (Event, EventType, PressureBlock,
+                                          PressureData, pressure_samples)
+from posture_guardian.utils.pressure_mat import cushion_value
+
+
+async def _collect_pressure(event_bus: EventBus, config: AppConfig, duration: float = 0.5) -> List[Event]:
+    """압력 센서 작업을 잠시 실행하고 발행된 PRESSURE 이벤트를 모읍니다."""
+    events: List[Event] = []
+    event_bus.subscribe(EventType.PRESSURE, events.append)
+    await event_bus.start()
+    task = asyncio.create_task(pressure_pad_sensor(config))
+    await asyncio.sleep(duration)
+    task.cancel()
+    await task
+    await asyncio.sleep(0.05)
+    await event_bus.stop()
+    return events
+
+
+def _mat_config(batching: bool) -> AppConfig:
+    return AppConfig(sensors=SensorConfig(
+        mat_rows=2,
+        mat_cols=2,
+        pressure_batching=batching,
+        simulation_rate_hz=50.0,
+        simulation_seed=1,
+        pressure_stats_interval=0.0,
+    ))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batching", [True, False])
+async def test_publish_mat_samples(event_bus: EventBus, batching: bool) -> None:
+    events = await _collect_pressure(event_bus, _mat_config(batching))
+    
+    assert events
+    expected_type = PressureBlock if batching else PressureData
+    assert all(isinstance(event.data, expected_type) for event in events)
+    
+    samples = [sample for event in events for sample in pressure_samples(event.data)]
+    assert len(samples) >= 5
+    for sample in samples:
+        assert sample.source == "simulation"
+        assert sample.cells is not None and len(sample.cells) == 4
+        assert sample.cushion_value == int(cushion_value(np.array([sample.cells]))[0])
+
+
+@pytest.mark.asyncio
+async def test_publish_single_cushion_per_sample(event_bus: EventBus) -> None:
+    config = AppConfig(sensors=SensorConfig(
+        pressure_batching=False, simulation_rate_hz=50.0, pressure_stats_interval=0.0
+    ))
+    events = await _collect_pressure(event_bus, config)
+    
+    assert events
+    for event in events:
+        assert isinstance(event.data, PressureData)
+        assert event.data.cells is None
+        assert 1 <= event.data.cushion_value <= 1024
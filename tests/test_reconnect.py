@@ -0,0 +1,61 @@
+"""
+웹캠 재연결 관리자 테스트
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from posture_guardian.sensors import reconnect
+from posture_guardian.sensors.reconnect import CameraReconnector
+
+
+class FakeCapture:
+    def __init__(self):
+        self.released = threading.Event()
+
+    def release(self) -> None:
+        self.released.set()
+
+
+@pytest.fixture
+def slow_open(monkeypatch):
+    """0.2초 뒤에 장치가 열리는 `_open_device`"""
+    cap = FakeCapture()
+
+    def open_device(device_id: int) -> FakeCapture:
+        time.sleep(0.2)
+        return cap
+
+    monkeypatch.setattr(reconnect, "_open_device", open_device)
+    return cap
+
+
+@pytest.mark.asyncio
+async def test_late_open_is_released_after_timeout(slow_open) -> None:
+    reconnector = CameraReconnector(open_timeout=0.05)
+    assert await reconnector._try_open(0) is None
+    assert reconnector.open_timeouts == 1
+    await asyncio.sleep(0.3)
+    assert slow_open.released.is_set()
+
+
+@pytest.mark.asyncio
+async def test_late_open_is_released_after_cancel(slow_open) -> None:
+    reconnector = CameraReconnector(open_timeout=5.0)
+    task = asyncio.create_task(reconnector._try_open(0))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.sleep(0.3)
+    assert slow_open.released.is_set()
+
+
+@pytest.mark.asyncio
+async def test_opened_capture_is_kept(slow_open) -> None:
+    reconnector = CameraReconnector(open_timeout=5.0)
+    assert await reconnector._try_open(0) is slow_open
+    await asyncio.sleep(0)
+    assert not slow_open.released.is_set()
@@ -0,0 +1,117 @@
+"""
+센서 이벤트 녹화/재생 테스트
+"""
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from posture_guardian.sensors.replay import (FILE_VERSION, HEADER_DTYPE,
+                                             KIND_FRAME, KIND_PRESSURE,
+                                             PRESSURE_RECORD_DTYPE,
+                                             EventRecorder, load_recording,
+                                             recording_paths)
+from posture_guardian.utils.events import (Event, EventType, FrameData,
+                                          PressureBlock)
+from posture_guardian.utils.landmarks import NUM_LANDMARKS, LandmarkArray
+
+LANDMARKS = LandmarkArray(np.random.default_rng(0).random((NUM_LANDMARKS, 4), dtype=np.float32))
+
+
+def _frame(camera_id: str, timestamp: float) -> Event:
+    return Event(type=EventType.FRAME, data=FrameData(
+        timestamp=datetime.fromtimestamp(timestamp), frame_id=7, camera_id=camera_id, landmarks=LANDMARKS
+    ))
+
+
+def _pressure(timestamps, values) -> Event:
+    return Event(type=EventType.PRESSURE, data=PressureBlock.from_arrays(
+        np.array(timestamps, dtype=np.float64), np.array(values), source="simulation"
+    ))
+
+
+def test_round_trip_in_time_order(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.pgrec")
+    recorder = EventRecorder(path)
+    recorder.write(_frame("0", 100.0))
+    recorder.write(_pressure([100.5, 101.5], [[100, 200], [300, 400]]))
+    recorder.write(_frame("2", 101.0))
+    recorder.write(_frame("video", 102.0))
+    recorder.close()
+    
+    recording = load_recording(path)
+    assert (len(recording.frames), len(recording.pressure)) == (3, 2)
+    events = list(recording.events())
+    assert [event.type for event in events] == [
+        EventType.FRAME, EventType.PRESSURE, EventType.FRAME, EventType.PRESSURE, EventType.FRAME
+    ]
+    assert np.all(np.diff(recording.timestamps) >= 0)
+    frames = [event.data for event in events if event.type == EventType.FRAME]
+    assert [frame.camera_id for frame in frames] == ["0", "2", "video"]
+    assert np.array_equal(frames[0].landmarks.data, LANDMARKS.data)
+    pressures = [event.data for event in events if event.type == EventType.PRESSURE]
+    assert [(p.foot_value, p.cushion_value, p.source) for p in pressures] == [
+        (100, 200, "simulation"), (300, 400, "simulation")
+    ]
+
+
+def test_pressure_records_are_compact(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.pgrec")
+    recorder = EventRecorder(path)
+    recorder.write(_pressure(np.arange(1000.0), np.full((1000, 2), 500)))
+    recorder.close()
+    
+    paths = recording_paths(path)
+    # 압력만 녹화하면 프레임 파일은 만들지 않음
+    assert not os.path.exists(paths[KIND_FRAME])
+    assert os.path.getsize(paths[KIND_PRESSURE]) == HEADER_DTYPE.itemsize + 1000 * PRESSURE_RECORD_DTYPE.itemsize
+    assert PRESSURE_RECORD_DTYPE.itemsize == 24
+    assert len(load_recording(path)) == 1000
+
+
+def test_round_trip_keeps_mat_cells(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.pgrec")
+    values = [[100, 200, 400, 600, 800], [300, 1, 2, 3, 1024]]
+    recorder = EventRecorder(path)
+    recorder.write(_pressure([1.0, 2.0], values))
+    recorder.write(_pressure([3.0], [[500, 600]]))
+    recorder.close()
+    
+    recording = load_recording(path)
+    assert recording.pressure.dtype.itemsize == PRESSURE_RECORD_DTYPE.itemsize + 4 * 2
+    pressures = [event.data for event in recording.events()]
+    assert [p.cells for p in pressures] == [[200, 400, 600, 800], [1, 2, 3, 1024], None]
+    assert [p.cushion_value for p in pressures] == [500, 258, 600]
+    
+    # 이어서 기록해도 파일의 셀 수를 유지
+    recorder = EventRecorder(path)
+    recorder.write(Event(type=EventType.PRESSURE, data=pressures[0]))
+    recorder.close()
+    cells = [event.data.cells for event in load_recording(path).events()]
+    assert cells == [[200, 400, 600, 800], [200, 400, 600, 800], [1, 2, 3, 1024], None]
+
+
+def test_recorder_appends(tmp_path: Path) -> None:
+    path = str(tmp_path / "session.pgrec")
+    for timestamp in (1.0, 2.0):
+        recorder = EventRecorder(path)
+        recorder.write(_frame("0", timestamp))
+        recorder.close()
+    assert len(load_recording(path)) == 2
+
+
+def test_old_version_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "old.pgrec"
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = b"PGRECORD"
+    header["version"] = FILE_VERSION - 1
+    path.write_bytes(header.tobytes())
+    with pytest.raises(ValueError):
+        load_recording(str(path))
+
+
+def test_missing_recording(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        load_recording(str(tmp_path / "missing.pgrec"))
@@ -0,0 +1,93 @@
+"""
+슬라이딩 윈도우 통계 테스트 (전수 계산과 비교)
+"""
+from typing import List
+
+import numpy as np
+import pytest
+
+from posture_guardian.utils.rolling import RollingStats
+
+
+def _reference_ema(values: List[float], alpha: float) -> float:
+    ema = values[0]
+    for value in values[1:]:
+        ema += alpha * (value - ema)
+    return ema
+
+
+def _assert_matches(stats: RollingStats, history: List[float]) -> None:
+    window = np.array(history[-stats.window:])
+    assert len(stats) == len(window)
+    assert stats.mean == pytest.approx(window.mean(), abs=1e-9)
+    assert stats.variance == pytest.approx(window.var(), rel=1e-7, abs=1e-7)
+    assert stats.min == window.min()
+    assert stats.max == window.max()
+    assert stats.ema == pytest.approx(_reference_ema(history, stats.ema_alpha), rel=1e-9)
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 20])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_push_matches_brute_force(window: int, seed: int) -> None:
+    rng = np.random.default_rng(seed)
+    # 중복 값이 많은 정수 흐름 (단조 덱의 같은 값 처리 확인)
+    values = rng.integers(1, 20, size=300).astype(float).tolist()
+    stats = RollingStats(window, ema_alpha=0.3)
+    for count, value in enumerate(values, start=1):
+        stats.push(value)
+        _assert_matches(stats, values[:count])
+
+
+@pytest.mark.parametrize("window", [1, 3, 16])
+def test_extend_matches_repeated_push(window: int) -> None:
+    rng = np.random.default_rng(42)
+    pushed = RollingStats(window, ema_alpha=0.2)
+    extended = RollingStats(window, ema_alpha=0.2)
+    history: List[float] = []
+    # 윈도우보다 짧은 묶음, 같은 길이, 훨씬 긴 묶음을 섞어서
+    for size in rng.integers(0, 3 * window + 5, size=40).tolist():
+        block = rng.normal(500, 50, size=size)
+        for value in block.tolist():
+            pushed.push(value)
+        extended.extend(block)
+        history.extend(block.tolist())
+        if not history:
+            continue
+        _assert_matches(extended, history)
+        assert extended.count == pushed.count
+        for name in ("mean", "variance", "min", "max", "ema"):
+            assert getattr(extended, name) == pytest.approx(getattr(pushed, name), rel=1e-7, abs=1e-7)
+
+
+def test_window_eviction() -> None:
+    stats = RollingStats(3)
+    for value in (10, 1, 5):
+        stats.push(value)
+    assert (stats.min, stats.max) == (1, 10)
+    
+    # 최댓값 10 이 윈도우 밖으로 밀려남
+    stats.push(2)
+    assert (stats.min, stats.max, stats.mean) == (1, 5, pytest.approx(8 / 3))
+    # 최솟값 1 이 밀려남
+    stats.push(4)
+    assert (stats.min, stats.max) == (2, 5)
+    # 분산이 0 아래로 내려가지 않음
+    for _ in range(5):
+        stats.push(7)
+    assert (stats.min, stats.max, stats.mean, stats.variance) == (7, 7, 7, pytest.approx(0.0, abs=1e-12))
+    assert stats.variance >= 0
+
+
+def test_reset_and_empty() -> None:
+    stats = RollingStats(4)
+    assert (len(stats), stats.mean, stats.std, stats.min, stats.max, stats.ema) == (0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    stats.extend(np.arange(10.0))
+    stats.reset()
+    assert len(stats) == 0 and stats.ema == 0.0
+    stats.push(3.0)
+    assert (stats.mean, stats.min, stats.max, stats.ema) == (3.0, 3.0, 3.0, 3.0)
+
+
+def test_invalid_window() -> None:
+    with pytest.raises(ValueError):
+        RollingStats(0)
@@ -0,0 +1,35 @@
+"""
+수요 기반 추론 스케줄러 테스트
+"""
+from posture_guardian.sensors.scheduler import InferenceScheduler
+
+
+def test_infers_only_near_check_time() -> None:
+    scheduler = InferenceScheduler(window=0.5, keepalive_interval=2.0, check_interval=10.0)
+    # 일정을 모르면 항상 추론
+    assert scheduler.should_infer(now=0.0)
+    scheduler.update(5.0)
+    assert not scheduler.should_infer(now=1.0)
+    assert scheduler.should_infer(now=2.0)  # keep-alive
+    assert not scheduler.should_infer(now=3.0)
+    assert scheduler.should_infer(now=4.6)
+    assert scheduler.should_infer(now=4.7)
+    assert scheduler.stats() == {
+        "schedule_window_frames": 3.0,
+        "schedule_keepalive_frames": 1.0,
+        "schedule_idle_frames": 2.0,
+    }
+
+
+def test_stale_schedule_falls_back_to_keepalive() -> None:
+    scheduler = InferenceScheduler(window=0.5, keepalive_interval=2.0, check_interval=10.0)
+    scheduler.update(5.0)
+    # 예정 시각이 지나도 평가 간격 안에서는 새 일정이 올 때까지 계속 추론
+    assert all(scheduler.should_infer(now=5.0 + t) for t in (0.0, 0.1, 9.9))
+    # 평가 간격 이상 새 일정이 없으면 keep-alive 주기로만 추론
+    assert not scheduler.should_infer(now=16.0)
+    assert scheduler.should_infer(now=17.0)
+    assert not scheduler.should_infer(now=18.0)
+    # 새 일정을 받으면 다시 평가 구간 추론
+    scheduler.update(18.2)
+    assert scheduler.should_infer(now=18.0)
@@ -0,0 +1,109 @@
+"""
+시리얼 리더 테스트 (pty 가상 아두이노)
+"""
+import asyncio
+import os
+import sys
+import time
+from typing import Iterator, List, Tuple
+
+import numpy as np
+import pytest
+import serial
+
+from posture_guardian.sensors.serial_reader import PROTOCOL_CSV, SerialLineReader
+from tools.pty_arduino import PtyArduino
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="pty 는 POSIX 전용")
+
+
+@pytest.fixture
+def arduino() -> Iterator[PtyArduino]:
+    """쓰기 스레드 없이 pty 만 연 가상 아두이노 (테스트가 master 에 직접 씀)"""
+    arduino = PtyArduino(protocol=PROTOCOL_CSV)
+    yield arduino
+    arduino.stop()
+
+
+@pytest.fixture
+def port(arduino: PtyArduino) -> Iterator[serial.Serial]:
+    ser = serial.Serial(arduino.port, 9600, timeout=0.05)
+    yield ser
+    ser.close()
+
+
+async def _drain(reader: SerialLineReader, expected: int, timeout: float = 2.0) -> Tuple[np.ndarray, np.ndarray]:
+    """expected 개 샘플이 모일 때까지 read_samples() 결과를 이어 붙임"""
+    timestamps: List[np.ndarray] = []
+    values: List[np.ndarray] = []
+    deadline = time.monotonic() + timeout
+    while sum(len(v) for v in values) < expected and time.monotonic() < deadline:
+        t, v = await reader.read_samples(timeout=0.1)
+        timestamps.append(t)
+        values.append(v)
+    return np.concatenate(timestamps), np.concatenate(values)
+
+
+@pytest.mark.asyncio
+async def test_partial_and_multiple_lines(arduino: PtyArduino, port: serial.Serial) -> None:
+    reader = SerialLineReader(port)
+    reader.start()
+    try:
+        # 여러 줄을 한 번에, 마지막 줄은 잘린 채로
+        os.write(arduino.master, b"100,200\r\n300,400\r\n50")
+        timestamps, values = await _drain(reader, 2)
+        assert values.tolist() == [[100, 200], [300, 400]]
+        
+        # 잘린 줄의 나머지와 새 줄
+        await asyncio.sleep(0.05)
+        os.write(arduino.master, b"0,600\r\n700,8")
+        await asyncio.sleep(0.05)
+        os.write(arduino.master, b"00\r\n")
+        later, values = await _drain(reader, 2)
+        assert values.tolist() == [[500, 600], [700, 800]]
+        
+        # 수신 시각은 도착 순서대로이고 나중에 온 줄이 더 늦음
+        assert np.all(np.diff(timestamps) >= 0)
+        assert later[0] > timestamps[-1]
+        assert later[-1] > later[0]
+        assert reader.bad_lines == 0
+    finally:
+        reader.stop()
+
+
+@pytest.mark.asyncio
+async def test_bad_lines_are_dropped(arduino: PtyArduino, port: serial.Serial) -> None:
+    reader = SerialLineReader(port)
+    reader.start()
+    try:
+        os.write(arduino.master, b"1,2\r\ngarbage\r\n1,2,3\r\n2000,0\r\n")
+        _, values = await _drain(reader, 2)
+        # 범위를 벗어난 값은 1~1024 로 제한
+        assert values.tolist() == [[1, 2], [1024, 1]]
+        await asyncio.sleep(0.05)
+        assert reader.bad_lines == 2
+    finally:
+        reader.stop()
+
+
+@pytest.mark.asyncio
+async def test_read_does_not_block_loop(arduino: PtyArduino, port: serial.Serial) -> None:
+    reader = SerialLineReader(port)
+    reader.start()
+    ticks = 0
+    
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+    
+    task = asyncio.create_task(ticker())
+    try:
+        # 데이터가 없는 동안 기다려도 다른 작업은 계속 실행
+        timestamps, values = await reader.read_samples(timeout=0.3)
+        assert len(timestamps) == 0 and values.shape == (0, 2)
+        assert ticks >= 10
+    finally:
+        task.cancel()
+        reader.stop()
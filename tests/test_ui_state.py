@@ -0,0 +1,31 @@
+"""
+UI 상태 파일 테스트
+"""
+import json
+from pathlib import Path
+
+from posture_guardian.ui.streamlit_ui import UIState
+
+
+def _read(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def test_away_transition_is_written(tmp_path: Path) -> None:
+    state = UIState()
+    state.state_file = str(tmp_path / "temp_state.json")
+    
+    state.set_away(True)
+    data = _read(tmp_path / "temp_state.json")
+    assert data["away"] is True
+    assert data["message"] == "자리를 비운 동안 자세 평가를 멈춥니다."
+    
+    # 자리 비움 동안은 기록하지 않음
+    state.score = 3
+    state._save_state_to_file()
+    assert _read(tmp_path / "temp_state.json")["score"] == 10
+    
+    state.set_away(False)
+    data = _read(tmp_path / "temp_state.json")
+    assert data["away"] is False
+    assert data["score"] == 3
@@ -0,0 +1,3 @@
+"""
+개발용 도구 (테스트, 성능 측정 전용 - 런타임 패키지에 포함되지 않음)
+"""
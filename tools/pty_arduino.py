@@ -0,0 +1,90 @@
+"""
+가상 아두이노 (pty)
+- 의사 터미널 한 쌍을 열고 스레드에서 arduino_code.ino 와 같은 형식으로 압력 값을 씀
+- 실제 장치 없이 `serial.Serial(port)` 로 시리얼 리더/프로토콜을 검증하는 용도 (POSIX 전용)
+"""
+import os
+import threading
+import time
+import tty
+from typing import Optional
+
+import numpy as np
+
+from posture_guardian.sensors.serial_reader import (PROTOCOL_BINARY,
+                                                    encode_binary_frames)
+
+
+class PtyArduino:
+    """pty 로 CSV 또는 바이너리 프레임을 일정 속도로 보내는 가상 아두이노"""
+
+    def __init__(
+        self,
+        protocol: str = PROTOCOL_BINARY,
+        rate_hz: float = 200.0,
+        samples: Optional[int] = None,
+        seed: int = 0,
+        channels: int = 2,
+    ):
+        """
+        가상 아두이노 초기화
+
+        Args:
+            protocol: "csv" 또는 "binary"
+            rate_hz: 초당 샘플 수
+            samples: 보낼 샘플 수 (없으면 stop() 까지 계속)
+            seed: 값 생성용 난수 시드
+            channels: 샘플당 값 개수 (발받침대 + 방석 또는 매트 셀 수)
+        """
+        self.protocol = protocol
+        self.rate_hz = rate_hz
+        self.samples = samples
+        self.channels = channels
+        self.rng = np.random.default_rng(seed)
+
+        self.master, self.slave = os.openpty()
+        # 바이너리 값이 줄바꿈 변환 등으로 바뀌지 않도록 raw 모드
+        tty.setraw(self.slave)
+        self.port = os.ttyname(self.slave)
+
+        self.sent = 0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _encode(self, values: np.ndarray) -> bytes:
+        """값 블록을 프로토콜 형식으로 인코딩"""
+        if self.protocol == PROTOCOL_BINARY:
+            return encode_binary_frames(values, start_seq=self.sent)
+        return b"".join(b",".join(b"%d" % v for v in row) + b"\r\n" for row in values.tolist())
+
+    def _run(self) -> None:
+        """쓰기 스레드 본체 (약 10ms 단위로 묶어서 전송)"""
+        started = time.perf_counter()
+        while not self._stop_event.is_set():
+            due = int((time.perf_counter() - started) * self.rate_hz)
+            if self.samples is not None:
+                due = min(due, self.samples)
+            if due > self.sent:
+                values = self.rng.integers(0, 1024, size=(due - self.sent, self.channels))
+                os.write(self.master, self._encode(values))
+                self.sent = due
+            if self.samples is not None and self.sent >= self.samples:
+                return
+            time.sleep(0.01)
+
+    def start(self) -> None:
+        """쓰기 스레드를 시작합니다."""
+        self._thread = threading.Thread(target=self._run, name="pty-arduino", daemon=True)
+        self._thread.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """지정한 샘플을 모두 보낼 때까지 기다립니다."""
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stop(self) -> None:
+        """쓰기를 중지하고 pty 를 닫습니다."""
+        self._stop_event.set()
+        self.join(timeout=1.0)
+        os.close(self.master)
+        os.close(self.slave)